@@ -0,0 +1,129 @@
+import threading
+import time
+
+import errors
+
+
+class AdaptiveConcurrency:
+    """
+    측정한 전체 처리량과 에러율로 동시 다운로드 수를 자동으로 조절하는 AIMD 방식 제어기입니다.
+
+    일정 간격(interval)마다 모든 작업이 받은 바이트 합계로 처리량(바이트/초)을 계산하고 다음과 같이 조절합니다.
+
+    - 감소 (multiplicative decrease): 구간 안에 HTTP 429/403, 네트워크 에러, yt-dlp 내부 재시도가 있었으면
+      서버가 제한하거나 연결이 포화된 것으로 보고 동시 다운로드 수를 절반으로 줄입니다.
+    - 증가 (additive increase): 에러가 없고 대기 중인 작업이 있어 모든 슬롯이 차 있으면 하나 늘려 봅니다.
+    - 되돌리기: 늘린 뒤 처리량이 GAIN_THRESHOLD 이상 늘지 않았으면 (회선이 이미 가득 참) 한 단계 되돌리고,
+      HOLD_INTERVALS 구간 동안 다시 늘리지 않습니다. 이후 다시 시도하므로 네트워크 상태 변화를 따라갑니다.
+
+    줄일 때는 실행 중인 작업을 중단하지 않고 새 작업 시작만 제한합니다. 한도는 [minimum, maximum] 범위를 벗어나지 않습니다.
+    DownloadManager 가 생성하고 시작/중지합니다.
+    """
+    INTERVAL = 5.0 # 측정 및 조절 간격 (초)
+    DECREASE_FACTOR = 0.5 # 에러 발생 시 동시 다운로드 수에 곱하는 값
+    GAIN_THRESHOLD = 0.05 # 늘린 뒤 처리량이 이 비율 이상 늘어야 유지
+    HOLD_INTERVALS = 6 # 되돌리거나 줄인 뒤 다시 늘리기 전까지 기다리는 구간 수
+    CONGESTION_KINDS = frozenset((errors.NETWORK, errors.FORBIDDEN, errors.RATE_LIMITED)) # 줄이는 원인이 되는 에러 분류
+
+    def __init__(self, manager, maximum, minimum=1, interval=INTERVAL):
+        """
+        AdaptiveConcurrency 초기화.
+
+        Args:
+            manager (DownloadManager): 조절할 다운로드 매니저
+            maximum (int): 동시 다운로드 수 상한
+            minimum (int, optional): 동시 다운로드 수 하한. Defaults to 1.
+            interval (float, optional): 측정 및 조절 간격 (초). Defaults to INTERVAL.
+        """
+        self.manager = manager
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.interval = interval
+        self.lock = threading.Lock() # 에러 카운터 보호 lock (워커 스레드에서 기록)
+        self.congestion = 0 # 마지막 조절 이후 발생한 혼잡 신호 수 (에러, yt-dlp 재시도)
+        self.throughput = 0.0 # 마지막 구간의 처리량 (바이트/초)
+        self._probe = None # 마지막으로 늘리기 전 (동시 다운로드 수, 처리량). 다음 구간에 효과를 확인
+        self._hold = 0 # 다시 늘리기 전까지 남은 구간 수
+        self._last_bytes = None # 마지막 측정 시점의 전체 수신 바이트
+        self._last_time = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """측정 스레드를 시작합니다."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="adaptive-concurrency", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """측정 스레드를 중지합니다."""
+        self._stop_event.set()
+
+    def record_error(self, kind):
+        """
+        작업 실패를 기록합니다. 혼잡 신호(HTTP 429/403, 네트워크 에러)만 다음 조절에 반영합니다.
+
+        Args:
+            kind (str): 에러 분류 (errors.NETWORK 등)
+        """
+        if kind in self.CONGESTION_KINDS:
+            with self.lock:
+                self.congestion += 1
+
+    def record_retries(self, count):
+        """
+        작업 실행 중 yt-dlp 가 내부에서 다시 시도한 횟수를 기록합니다 (실패하기 전의 혼잡 신호).
+
+        Args:
+            count (int): 재시도 횟수
+        """
+        if count:
+            with self.lock:
+                self.congestion += count
+
+    def step(self, now=None):
+        """
+        처리량을 측정하고 동시 다운로드 수를 한 번 조절합니다. 측정 스레드가 interval 마다 호출합니다.
+
+        Args:
+            now (float, optional): 현재 시각 (time.monotonic 기준). Defaults to None (현재 시각).
+
+        Returns:
+            int: 조절 후 동시 다운로드 수
+        """
+        now = time.monotonic() if now is None else now
+        received = self.manager.progress.received_bytes
+        with self.lock:
+            congestion, self.congestion = self.congestion, 0
+        current = self.manager.concurrency
+        if self._last_time is None or now <= self._last_time:
+            self._last_bytes, self._last_time = received, now # 첫 측정: 기준값만 기록
+            return current
+        self.throughput = (received - self._last_bytes) / (now - self._last_time)
+        self._last_bytes, self._last_time = received, now
+
+        target = current
+        if congestion: # 감소: 서버 제한 또는 연결 포화
+            target = max(self.minimum, int(current * self.DECREASE_FACTOR))
+            self._probe = None
+            self._hold = self.HOLD_INTERVALS
+        elif self._probe is not None: # 지난 구간에 늘렸음: 효과 확인
+            previous, previous_throughput = self._probe
+            self._probe = None
+            if self.throughput < previous_throughput * (1 + self.GAIN_THRESHOLD):
+                target = previous # 늘려도 처리량이 그대로: 되돌림
+                self._hold = self.HOLD_INTERVALS
+        elif self._hold > 0:
+            self._hold -= 1
+        elif current < self.maximum and self.manager.is_saturated(): # 증가: 기다리는 작업이 있을 때만
+            target = current + 1
+            self._probe = (current, self.throughput)
+        target = min(self.maximum, max(self.minimum, target))
+        if target != current:
+            self.manager.set_concurrency(target, preempt=False) # 줄일 때 실행 중인 작업은 끝까지 진행
+        return target
+
+    def _run(self):
+        """측정 스레드 본체."""
+        while not self._stop_event.wait(self.interval):
+            self.step()
@@ -0,0 +1,419 @@
+import functools
+import json
+import queue
+import threading
+import urllib.parse
+
+from downloader import DownloadWorker
+from manager import DownloadJob, ManagerListener
+from startup import lazy_import
+
+
+PRIORITIES = { # 요청 본문의 우선순위 이름
+    "high": DownloadJob.PRIORITY_HIGH,
+    "normal": DownloadJob.PRIORITY_NORMAL,
+    "low": DownloadJob.PRIORITY_LOW,
+}
+MAX_FRAGMENTS = 16 # 요청 본문 fragments 최댓값 (설정 화면의 조각 동시 다운로드 범위와 같음)
+
+
+def job_to_dict(job, percent=None):
+    """
+    작업을 JSON 으로 보낼 dict 로 변환합니다.
+
+    Args:
+        job (DownloadJob): 작업
+        percent (float, optional): 진행률 (0.0 ~ 100.0). Defaults to None (포함하지 않음).
+
+    Returns:
+        dict: 작업 정보
+    """
+    data = {
+        "id": job.job_id,
+        "url": job.url,
+        "video_id": job.video_id,
+        "title": job.title,
+        "state": job.state,
+        "priority": job.priority,
+        "quality": job.quality,
+        "download_path": job.download_path,
+        "filepath": job.filepath,
+        "error": job.error,
+        "error_kind": job.error_kind,
+        "retries": job.retries,
+        "retry_delay": job.retry_delay,
+    }
+    if percent is not None:
+        data["progress"] = round(percent, 1)
+    return data
+
+
+class JobApiServer:
+    """
+    다른 프로그램이 작업을 추가, 조회, 취소하고 진행 상황을 받아볼 수 있는 로컬 HTTP/JSON API 서버입니다.
+    외부에서 접근하지 못하도록 localhost 에만 바인딩합니다.
+
+    - `GET /jobs[?state=queued,running]`: 작업 목록
+    - `GET /jobs/<id>`: 작업 하나
+    - `POST /jobs`: 작업 추가. 본문은 `{"urls": [...]}` 또는 `{"text": "..."}` 이며, 선택적으로
+      `quality`, `download_path`, `subtitles`, `fragments`, `priority` (high/normal/low), `playlists` 를 지정합니다.
+      한 번의 요청으로 수천 개를 추가해도 저장소 기록과 대기열 추가는 한 번에 처리됩니다.
+    - `DELETE /jobs/<id>[?delete_partial=1]`: 작업 취소
+    - `GET /events`: Server-Sent Events 로 작업 이벤트와 1초마다 실행 중인 작업의 진행률을 전송
+
+    브라우저의 웹 페이지가 요청을 보내지 못하도록 Host 헤더가 localhost 가 아니면 거부하고,
+    POST 는 `Content-Type: application/json` 만 받습니다 (다른 출처에서는 CORS 사전 요청이 필요하므로 전송되지 않음).
+    """
+    PROGRESS_INTERVAL = 1.0 # /events 진행률 전송 간격 (초)
+    EVENT_QUEUE_SIZE = 10000 # 클라이언트별 밀린 이벤트 최대 수 (넘으면 연결을 끊고 다시 조회하게 함)
+
+    def __init__(self, manager, port, defaults):
+        """
+        JobApiServer 초기화 및 시작. 포트를 사용할 수 없으면 OSError 가 발생합니다.
+
+        Args:
+            manager (DownloadManager): 작업을 추가할 다운로드 매니저
+            port (int): 포트 번호
+            defaults (callable): 요청에 지정하지 않은 항목의 기본값을 반환하는 함수. 반환하는 dict 의 키는
+                download_path, quality, download_subtitles, concurrent_fragments, expand_playlists 입니다.
+        """
+        self.manager = manager
+        self.defaults = defaults
+        self.events = _EventBroker(self.EVENT_QUEUE_SIZE)
+        self.stop_event = threading.Event() # 종료 시 /events 연결을 끊기 위한 이벤트
+        manager.add_listener(self.events)
+        http_server = lazy_import("http.server") # 서버를 켤 때만 import (어플리케이션 시작 시간 단축)
+        handler = type("JobApiHandler", (_api_handler_class(),), {"api": self})
+        self.httpd = http_server.ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="job-api-server", daemon=True)
+        self.thread.start()
+
+    def close(self):
+        """서버를 종료합니다."""
+        self.stop_event.set()
+        self.manager.remove_listener(self.events)
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def list_jobs(self, states=None):
+        """
+        작업 목록을 반환합니다.
+
+        Args:
+            states (set[str], optional): 이 상태의 작업만 반환. Defaults to None (전체).
+
+        Returns:
+            list[dict]: 작업 정보 목록 (작업 ID 순)
+        """
+        jobs = sorted(self.manager.jobs.values(), key=lambda job: job.job_id) # 다른 스레드가 추가 중이어도 복사본으로 순회
+        return [
+            job_to_dict(job, self.manager.progress.get(job.job_id))
+            for job in jobs if states is None or job.state in states
+        ]
+
+    def get_job(self, job_id):
+        """
+        작업 하나의 정보를 반환합니다.
+
+        Args:
+            job_id (int): 작업 ID
+
+        Returns:
+            dict: 작업 정보, 없는 작업이면 None
+        """
+        job = self.manager.jobs.get(job_id)
+        return None if job is None else job_to_dict(job, self.manager.progress.get(job_id))
+
+    def submit(self, request):
+        """
+        요청 본문의 URL 들을 대기열에 추가합니다. 아카이브에 있거나 진행 중인 비디오는 건너뜁니다.
+
+        Args:
+            request (dict): 요청 본문 (JSON)
+
+        Returns:
+            dict: 추가된 작업 ID 목록(added), 펼치기 시작한 재생목록(playlists), 건너뛴 비디오 수(skipped)
+
+        Raises:
+            ValueError: 요청 본문이 올바르지 않은 경우
+        """
+        if not isinstance(request, dict):
+            raise ValueError("요청 본문은 JSON 객체여야 합니다.")
+        urls = request.get("urls")
+        text = request.get("text")
+        if urls is not None:
+            if not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+                raise ValueError("urls 는 문자열 목록이어야 합니다.")
+            text = "\n".join(urls)
+        elif not isinstance(text, str):
+            raise ValueError("urls 또는 text 를 지정해야 합니다.")
+        options = self.defaults()
+        quality = request.get("quality", options["quality"])
+        if not isinstance(quality, str) or quality not in DownloadWorker.QUALITY_MAPPING:
+            raise ValueError(f"지원하지 않는 품질입니다: {quality}")
+        priority = request.get("priority", "normal")
+        if not isinstance(priority, str) or priority not in PRIORITIES:
+            raise ValueError(f"우선순위는 {', '.join(PRIORITIES)} 중 하나여야 합니다.")
+        fragments = request.get("fragments", options["concurrent_fragments"])
+        if isinstance(fragments, bool) or not isinstance(fragments, int) or not 1 <= fragments <= MAX_FRAGMENTS:
+            raise ValueError(f"fragments 는 1 ~ {MAX_FRAGMENTS} 사이의 정수여야 합니다.")
+        subtitles = request.get("subtitles", options["download_subtitles"])
+        expand_playlists = request.get("playlists", options["expand_playlists"])
+        if not isinstance(subtitles, bool) or not isinstance(expand_playlists, bool):
+            raise ValueError("subtitles, playlists 는 true 또는 false 여야 합니다.")
+        download_path = request.get("download_path") or options["download_path"]
+        if not isinstance(download_path, str):
+            raise ValueError("download_path 는 문자열이어야 합니다.")
+        if not download_path:
+            raise ValueError("다운로드 경로가 설정되지 않았습니다.")
+        jobs, playlists, skipped = self.manager.submit_text(
+            text,
+            download_path=download_path,
+            quality=quality,
+            download_subtitles=subtitles,
+            concurrent_fragments=fragments,
+            priority=PRIORITIES[priority],
+            expand_playlists=expand_playlists,
+        )
+        return {"added": [job.job_id for job in jobs], "playlists": playlists, "skipped": skipped}
+
+    def cancel(self, job_id, delete_partial=False):
+        """
+        작업을 취소합니다.
+
+        Args:
+            job_id (int): 작업 ID
+            delete_partial (bool, optional): 받던 임시 파일을 삭제할지 여부. Defaults to False.
+
+        Returns:
+            bool: 취소 요청이 받아들여졌으면 True, 이미 끝난 작업이면 False, 없는 작업이면 None
+        """
+        if job_id not in self.manager.jobs:
+            return None
+        return self.manager.cancel(job_id, delete_partial=delete_partial)
+
+    def running_progress(self):
+        """
+        실행 중인 작업의 진행 상황을 반환합니다 (/events 의 progress 이벤트).
+
+        Returns:
+            list[dict]: 작업 ID, 진행률, 받은 바이트 수, 전체 바이트 수 목록
+        """
+        running = {job.job_id for job in list(self.manager.jobs.values()) if job.state == DownloadJob.RUNNING}
+        return [
+            {
+                "id": job_id,
+                "progress": round(entry.percent, 1),
+                "downloaded_bytes": entry.downloaded_bytes,
+                "total_bytes": entry.total_bytes,
+            }
+            for job_id, entry in sorted(self.manager.progress.snapshot(running).items())
+        ]
+
+
+class _EventBroker(ManagerListener):
+    """매니저 이벤트를 /events 에 연결된 클라이언트별 큐로 나눠 보내는 listener 입니다 (워커 스레드에서 호출)."""
+    def __init__(self, queue_size):
+        self.queue_size = queue_size
+        self.lock = threading.Lock() # 구독자 목록 보호 lock
+        self.subscribers = set() # 클라이언트별 이벤트 큐
+
+    def subscribe(self):
+        """새 이벤트 큐를 만들어 등록합니다."""
+        subscriber = queue.Queue(self.queue_size)
+        with self.lock:
+            self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """이벤트 큐 등록을 해제합니다."""
+        with self.lock:
+            self.subscribers.discard(subscriber)
+
+    def is_subscribed(self, subscriber):
+        """이벤트 큐가 아직 등록되어 있는지 여부 (밀린 이벤트가 넘쳐 해제되면 False)."""
+        with self.lock:
+            return subscriber in self.subscribers
+
+    def publish(self, event, data):
+        """모든 구독자에게 이벤트를 보냅니다. 큐가 가득 찬 (읽지 않는) 구독자는 해제합니다."""
+        with self.lock:
+            for subscriber in list(self.subscribers):
+                try:
+                    subscriber.put_nowait((event, data))
+                except queue.Full:
+                    self.subscribers.discard(subscriber) # 연결을 끊어 클라이언트가 /jobs 로 다시 조회하게 함
+
+    def _publish_job(self, event, job):
+        self.publish(event, job_to_dict(job))
+
+    def job_added(self, job):
+        self._publish_job("added", job)
+
+    def job_started(self, job):
+        self._publish_job("started", job)
+
+    def job_finished(self, job):
+        self._publish_job("finished", job)
+
+    def job_failed(self, job):
+        self._publish_job("failed", job)
+
+    def job_info(self, job):
+        self._publish_job("info", job)
+
+    def job_postprocessing(self, job):
+        self._publish_job("postprocessing", job)
+
+    def job_paused(self, job):
+        self._publish_job("paused", job)
+
+    def job_queued(self, job):
+        self._publish_job("queued", job)
+
+    def job_cancelled(self, job):
+        self._publish_job("cancelled", job)
+
+    def job_retrying(self, job):
+        self._publish_job("retrying", job)
+
+    def concurrency_changed(self, concurrency):
+        self.publish("concurrency", {"concurrency": concurrency})
+
+    def playlist_expanded(self, url, count):
+        self.publish("playlist_expanded", {"url": url, "count": count})
+
+    def playlist_failed(self, url, message, kind):
+        self.publish("playlist_failed", {"url": url, "error": message, "error_kind": kind})
+
+
+@functools.lru_cache(maxsize=None)
+def _api_handler_class():
+    """_ApiHandler 클래스를 반환합니다. http.server 를 상속하므로 서버를 처음 시작할 때 만듭니다."""
+    http_server = lazy_import("http.server")
+
+    class _ApiHandler(http_server.BaseHTTPRequestHandler):
+        """JobApiServer 의 요청 핸들러."""
+        api = None
+        MAX_BODY_SIZE = 16 * 1024 * 1024 # 요청 본문 최대 크기 (URL 수십만 개 분량)
+
+        def do_GET(self):
+            if not self._check_host():
+                return
+            path, query = self._parse_path()
+            if path == ["jobs"]:
+                states = set(query["state"][0].split(",")) if "state" in query else None
+                self._send_json(200, {"jobs": self.api.list_jobs(states)})
+            elif len(path) == 2 and path[0] == "jobs":
+                job = self.api.get_job(self._job_id(path[1]))
+                if job is None:
+                    self._send_json(404, {"error": "작업을 찾을 수 없습니다."})
+                else:
+                    self._send_json(200, job)
+            elif path == ["events"]:
+                self._stream_events()
+            else:
+                self._send_json(404, {"error": "없는 경로입니다."})
+
+        def do_POST(self):
+            if not self._check_host():
+                return
+            path, _ = self._parse_path()
+            if path != ["jobs"]:
+                self._send_json(404, {"error": "없는 경로입니다."})
+                return
+            if self.headers.get_content_type() != "application/json":
+                self._send_json(415, {"error": "Content-Type 은 application/json 이어야 합니다."})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self._send_json(400, {"error": "Content-Length 가 올바르지 않습니다."})
+                return
+            if length > self.MAX_BODY_SIZE:
+                self._send_json(413, {"error": "요청 본문이 너무 큽니다."})
+                return
+            try:
+                request = json.loads(self.rfile.read(length) or b"null")
+                result = self.api.submit(request)
+            except (ValueError, TypeError) as e: # JSON 파싱 실패(JSONDecodeError 포함), 잘못된 값
+                self._send_json(400, {"error": str(e)})
+                return
+            self._send_json(201, result)
+
+        def do_DELETE(self):
+            if not self._check_host():
+                return
+            path, query = self._parse_path()
+            if len(path) != 2 or path[0] != "jobs":
+                self._send_json(404, {"error": "없는 경로입니다."})
+                return
+            delete_partial = query.get("delete_partial", ["0"])[0] in ("1", "true")
+            cancelled = self.api.cancel(self._job_id(path[1]), delete_partial=delete_partial)
+            if cancelled is None:
+                self._send_json(404, {"error": "작업을 찾을 수 없습니다."})
+            else:
+                self._send_json(200, {"cancelled": cancelled})
+
+        def _stream_events(self):
+            """이벤트가 생길 때마다, 그리고 PROGRESS_INTERVAL 마다 진행률을 Server-Sent Events 로 보냅니다."""
+            subscriber = self.api.events.subscribe()
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                while not self.api.stop_event.is_set() and self.api.events.is_subscribed(subscriber):
+                    try:
+                        event, data = subscriber.get(timeout=self.api.PROGRESS_INTERVAL)
+                    except queue.Empty: # 이벤트 없이 간격이 지남: 진행률 전송
+                        event, data = "progress", self.api.running_progress()
+                    self._write_event(event, data)
+                    if event != "progress" and subscriber.empty(): # 밀린 이벤트를 다 보냈으면 진행률도 전송
+                        self._write_event("progress", self.api.running_progress())
+            except OSError: # 클라이언트 연결 끊김 (BrokenPipeError, ConnectionResetError)
+                pass
+            finally:
+                self.api.events.unsubscribe(subscriber)
+                self.close_connection = True
+
+        def _write_event(self, event, data):
+            self.wfile.write(
+                f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+            )
+            self.wfile.flush()
+
+        def _check_host(self):
+            """Host 헤더가 localhost 인지 확인합니다 (DNS 리바인딩으로 웹 페이지가 요청하는 것을 막음)."""
+            host = self.headers.get("Host")
+            if host is None or urllib.parse.urlsplit(f"//{host}").hostname in ("127.0.0.1", "localhost"):
+                return True
+            self._send_json(403, {"error": "localhost 에서만 사용할 수 있습니다."})
+            return False
+
+        def _parse_path(self):
+            """요청 경로를 (경로 조각 목록, 쿼리 dict) 로 나눕니다."""
+            parts = urllib.parse.urlsplit(self.path)
+            return [part for part in parts.path.split("/") if part], urllib.parse.parse_qs(parts.query)
+
+        @staticmethod
+        def _job_id(value):
+            """경로의 작업 ID 를 정수로 바꿉니다 (숫자가 아니면 없는 작업으로 처리)."""
+            return int(value) if value.isdigit() else -1
+
+        def _send_json(self, status, data):
+            body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass # 요청 로그 출력 안 함
+
+    return _ApiHandler
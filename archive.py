@@ -0,0 +1,146 @@
+import os
+import sqlite3
+import threading
+import time
+
+
+class DownloadArchive:
+    """
+    다운로드 완료된 비디오를 기록하는 SQLite 기반 영구 아카이브입니다.
+
+    비디오 ID 를 기본 키로 사용하므로 수십만 건에서도 중복 여부를 인덱스 조회 한 번으로 확인할 수 있습니다.
+    제목, 포맷, 파일 경로, 파일 크기, 완료 시각을 함께 기록하며, yt-dlp `--download-archive` 파일을 가져올 수 있습니다.
+    여러 워커 스레드에서 동시에 사용하므로 하나의 연결을 lock 으로 보호합니다.
+    """
+    DEFAULT_FILENAME = "archive.sqlite3"
+    QUERY_CHUNK_SIZE = 500 # IN 쿼리 한 번에 넣는 최대 ID 수 (SQLite 변수 개수 제한)
+
+    def __init__(self, path):
+        """
+        DownloadArchive 초기화. 데이터베이스 파일과 테이블이 없으면 생성합니다.
+
+        Args:
+            path (str): SQLite 데이터베이스 파일 경로
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock() # 연결 보호 lock (thread-safe)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL") # 쓰기 중에도 읽기 가능
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS downloads (
+                    video_id TEXT PRIMARY KEY,
+                    title TEXT,
+                    format TEXT,
+                    filepath TEXT,
+                    filesize INTEGER,
+                    completed_at REAL
+                ) WITHOUT ROWID
+                """
+            )
+
+    def __contains__(self, video_id):
+        """비디오 ID 가 아카이브에 있는지 확인합니다."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT 1 FROM downloads WHERE video_id = ?", (video_id,)
+            ).fetchone()
+        return row is not None
+
+    def contains_many(self, video_ids):
+        """
+        여러 비디오 ID 중 아카이브에 있는 ID 를 한 번에 조회합니다 (IN 쿼리, 대량 붙여넣기 처리용).
+
+        Args:
+            video_ids (iterable[str]): 비디오 ID 목록
+
+        Returns:
+            set[str]: 아카이브에 있는 비디오 ID 집합
+        """
+        video_ids = list(video_ids)
+        found = set()
+        with self.lock:
+            for start in range(0, len(video_ids), self.QUERY_CHUNK_SIZE):
+                chunk = video_ids[start:start + self.QUERY_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                found.update(
+                    row[0] for row in self.connection.execute(
+                        f"SELECT video_id FROM downloads WHERE video_id IN ({placeholders})", chunk
+                    )
+                )
+        return found
+
+    def __len__(self):
+        """아카이브에 기록된 비디오 수."""
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM downloads").fetchone()[0]
+
+    def add(self, video_id, title=None, video_format=None, filepath=None, filesize=None):
+        """
+        다운로드 완료된 비디오를 기록합니다. 이미 있으면 새 정보로 덮어씁니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+            title (str, optional): 비디오 제목
+            video_format (str, optional): 다운로드한 포맷 (yt-dlp format 설명)
+            filepath (str, optional): 저장된 파일 경로
+            filesize (int, optional): 파일 크기 (바이트)
+        """
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO downloads VALUES (?, ?, ?, ?, ?, ?)",
+                (video_id, title, video_format, filepath, filesize, time.time()),
+            )
+
+    def get(self, video_id):
+        """
+        비디오 ID 에 해당하는 기록을 반환합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+
+        Returns:
+            dict: 기록 (video_id, title, format, filepath, filesize, completed_at). 없으면 None
+        """
+        with self.lock:
+            cursor = self.connection.execute(
+                "SELECT * FROM downloads WHERE video_id = ?", (video_id,)
+            )
+            row = cursor.fetchone()
+            columns = [description[0] for description in cursor.description]
+        return dict(zip(columns, row)) if row else None
+
+    def import_ytdlp_archive(self, path):
+        """
+        yt-dlp `--download-archive` 파일(한 줄에 "youtube <비디오 ID>")을 가져옵니다.
+        YouTube 이외의 항목과 이미 기록된 비디오는 건너뜁니다.
+
+        Args:
+            path (str): yt-dlp 아카이브 파일 경로
+
+        Returns:
+            int: 새로 추가된 비디오 수
+        """
+        video_ids = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[0].lower() == "youtube":
+                    video_ids.append((parts[1],))
+
+        with self.lock, self.connection:
+            before = self.connection.total_changes
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO downloads (video_id, completed_at) VALUES (?, NULL)",
+                video_ids,
+            )
+            return self.connection.total_changes - before
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self.lock:
+            self.connection.close()
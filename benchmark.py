@@ -0,0 +1,435 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import yt_dlp
+
+from manager import DownloadManager, ManagerListener
+
+
+DEFAULT_LEVELS = (1, 4, 10, 32) # 측정할 동시 다운로드 수
+MODES = ("progressive", "dash", "hls") # 단일 파일, DASH 조각, HLS 조각
+CHUNK_SIZE = 64 * 1024 # 가짜 미디어 서버의 전송 단위 (바이트)
+SEGMENT_SIZE = 256 * 1024 # DASH/HLS 조각 크기 (바이트)
+GUI_REFRESH_INTERVAL = 0.066 # GUI 진행률 갱신 주기 (초, MainWindow.PROGRESS_REFRESH_INTERVAL_MS 와 동일)
+
+
+class FakeMediaHandler(BaseHTTPRequestHandler):
+    """
+    합성 미디어를 응답하는 로컬 HTTP 핸들러입니다. 네트워크 없이 다운로드 경로를 측정하기 위해 사용합니다.
+
+    - `/progressive/<id>?size=N`: N 바이트 단일 파일 (Range 요청 지원, 이어받기용)
+    - `/dash/<id>/frag<i>.m4s?size=N`: DASH 조각
+    - `/hls/<id>/index.m3u8?segments=K&size=N`: K 개 조각의 HLS 재생목록, `/hls/<id>/seg<i>.ts?size=N`: HLS 조각
+    """
+    protocol_version = "HTTP/1.1" # keep-alive (yt-dlp 가 연결을 재사용하는 경우 반영)
+    PAYLOAD = bytes(range(256)) * (CHUNK_SIZE // 256) # 전송용 합성 데이터
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        if parsed.path.endswith(".m3u8"):
+            segments = int(query.get("segments", ["1"])[0])
+            size = int(query.get("size", [str(SEGMENT_SIZE)])[0])
+            lines = ["#EXTM3U", "#EXT-X-VERSION:3", "#EXT-X-TARGETDURATION:2", "#EXT-X-MEDIA-SEQUENCE:0"]
+            for index in range(segments):
+                lines += ["#EXTINF:2.0,", f"seg{index}.ts?size={size}"]
+            lines.append("#EXT-X-ENDLIST")
+            self._send_bytes(("\n".join(lines) + "\n").encode(), "application/vnd.apple.mpegurl")
+            return
+        size = int(query.get("size", ["0"])[0])
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and range_header.startswith("bytes="): # 이어받기 요청 (bytes=시작-[끝])
+            first, _, last = range_header[len("bytes="):].partition("-")
+            start = int(first or 0)
+            end = int(last) + 1 if last else size
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{size}")
+            size = end
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "video/mp2t" if parsed.path.endswith(".ts") else "video/mp4")
+        self.send_header("Content-Length", str(size - start))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        remaining = size - start
+        while remaining > 0:
+            chunk = self.PAYLOAD[:min(remaining, CHUNK_SIZE)]
+            self.wfile.write(chunk)
+            remaining -= len(chunk)
+
+    def _send_bytes(self, body, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass # 요청 로그 출력 안 함
+
+
+class FakeMediaServer:
+    """FakeMediaHandler 를 백그라운드 스레드에서 실행하는 로컬 HTTP 서버입니다 (임의 포트 사용)."""
+
+    def __init__(self):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeMediaHandler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="fake-media-server", daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class StubExtractor:
+    """
+    InfoCache 와 같은 인터페이스로, 추출 없이 가짜 미디어 서버를 가리키는 비디오 정보를 돌려주는 stub 입니다.
+
+    DownloadWorker 는 캐시에 정보가 있으면 `extract_info` 를 건너뛰고 `process_ie_result` 로 바로 다운로드하므로,
+    YouTube 에 접속하지 않고 포맷 선택부터 파일 저장까지의 실제 yt-dlp 경로를 측정할 수 있습니다.
+    """
+    def __init__(self, base_url, mode, size):
+        """
+        StubExtractor 초기화.
+
+        Args:
+            base_url (str): 가짜 미디어 서버 주소
+            mode (str): 미디어 형식 ("progressive", "dash", "hls")
+            size (int): 비디오 하나의 크기 (바이트)
+        """
+        self.base_url = base_url
+        self.mode = mode
+        self.size = size
+
+    def get(self, video_id):
+        """비디오 ID 에 해당하는 합성 비디오 정보를 반환합니다."""
+        segments = max(1, self.size // SEGMENT_SIZE)
+        video_format = {
+            "format_id": self.mode,
+            "ext": "mp4",
+            "vcodec": "avc1.4d401e",
+            "acodec": "mp4a.40.2",
+            "width": 640,
+            "height": 360,
+        }
+        if self.mode == "progressive":
+            video_format.update(
+                url=f"{self.base_url}/progressive/{video_id}?size={self.size}",
+                protocol="http",
+                filesize=self.size,
+            )
+        elif self.mode == "dash":
+            video_format.update(
+                url=f"{self.base_url}/dash/{video_id}/manifest.mpd",
+                protocol="http_dash_segments",
+                fragment_base_url=f"{self.base_url}/dash/{video_id}/",
+                fragments=[
+                    {"path": f"frag{index}.m4s?size={SEGMENT_SIZE}", "duration": 2.0}
+                    for index in range(segments)
+                ],
+                filesize=segments * SEGMENT_SIZE,
+            )
+        else:
+            video_format.update(
+                url=f"{self.base_url}/hls/{video_id}/index.m3u8?segments={segments}&size={SEGMENT_SIZE}",
+                protocol="m3u8_native",
+                ext="ts",
+            )
+        return {
+            "id": video_id,
+            "title": f"benchmark {video_id}",
+            "extractor": "youtube",
+            "extractor_key": "Youtube",
+            "webpage_url": f"https://www.youtube.com/watch?v={video_id}",
+            "duration": segments * 2.0,
+            "formats": [video_format],
+        }
+
+    def store(self, video_id, info):
+        pass
+
+    def remove(self, video_id):
+        pass
+
+
+class ScenarioStats(ManagerListener):
+    """
+    시나리오 하나의 측정값을 모으는 listener 입니다. 작업 시작 시각, 첫 바이트 수신 시각,
+    progress hook 호출 수와 소요 시간을 기록합니다. 여러 워커 스레드에서 호출되므로 lock 으로 보호합니다.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started_at = {} # 작업 시작 시각 (비디오 ID: monotonic)
+        self.first_byte_at = {} # 첫 바이트 수신 시각 (비디오 ID: monotonic)
+        self.hook_calls = 0 # progress hook 호출 수
+        self.hook_seconds = 0.0 # progress hook 총 소요 시간 (초)
+        self.failed = [] # 실패한 작업의 에러 메시지
+
+    def job_started(self, job):
+        with self.lock:
+            self.started_at[job.video_id] = time.monotonic()
+
+    def job_failed(self, job):
+        with self.lock:
+            self.failed.append(job.error)
+
+    def record_hook(self, d, elapsed):
+        """progress hook 한 번의 소요 시간과 첫 바이트 수신 시각을 기록합니다."""
+        now = time.monotonic()
+        video_id = (d.get("info_dict") or {}).get("id")
+        with self.lock:
+            self.hook_calls += 1
+            self.hook_seconds += elapsed
+            if video_id not in self.first_byte_at and d.get("downloaded_bytes"):
+                self.first_byte_at[video_id] = now
+
+    def ttfb(self):
+        """작업별 첫 바이트까지 걸린 시간 목록 (초)."""
+        return [
+            self.first_byte_at[video_id] - started
+            for video_id, started in self.started_at.items() if video_id in self.first_byte_at
+        ]
+
+
+@contextmanager
+def timed_progress_hooks(stats):
+    """
+    이 블록 안에서 만들어지는 YoutubeDL 객체의 progress hook 을 감싸서, 호출마다 소요 시간을 stats 에 기록합니다.
+    DownloadWorker 의 hook 과 그 안에서 호출되는 listener/진행률 저장 경로 전체가 측정 대상입니다.
+    """
+    original = yt_dlp.YoutubeDL.add_progress_hook
+
+    def add_progress_hook(ydl, hook):
+        def timed_hook(d):
+            start = time.perf_counter()
+            try:
+                hook(d)
+            finally:
+                stats.record_hook(d, time.perf_counter() - start)
+        original(ydl, timed_hook)
+
+    yt_dlp.YoutubeDL.add_progress_hook = add_progress_hook
+    try:
+        yield
+    finally:
+        yt_dlp.YoutubeDL.add_progress_hook = original
+
+
+class GuiProbe:
+    """
+    MainWindow 와 같은 방식(고정 주기 collect_changed -> 모델 갱신 -> 다시 그리기)으로 진행률을 표시하고,
+    갱신 한 번에 걸리는 시간을 측정합니다. 꺼져 있거나 PyQt5 가 없으면 진행률 수집 비용만 측정합니다.
+    """
+    def __init__(self, enabled=True):
+        """
+        GuiProbe 초기화.
+
+        Args:
+            enabled (bool, optional): 목록 모델/뷰 갱신 비용 측정 여부. Defaults to True.
+        """
+        self.app = None
+        self.view = None
+        self.model = None
+        self.tick_seconds = [] # 갱신별 소요 시간 (초)
+        if not enabled:
+            return
+        try:
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen") # 화면 없이 실행
+            from PyQt5.QtWidgets import QApplication
+
+            from ui.download_item import DownloadListView
+            from ui.download_model import DownloadListModel
+        except ImportError:
+            return
+        self.app = QApplication.instance() or QApplication([])
+        self.model = DownloadListModel()
+        self.view = DownloadListView()
+        self.view.setModel(self.model)
+        self.view.resize(600, 400)
+        self.view.show()
+
+    def reset(self, jobs):
+        """목록을 새 시나리오의 작업들로 바꿉니다."""
+        self.tick_seconds = []
+        if self.model is not None:
+            self.model.remove_jobs(self.model.job_ids())
+            for job in jobs:
+                self.model.add_job(job.job_id, job.url)
+
+    def tick(self, progress):
+        """바뀐 진행률을 가져와 목록에 반영하고 다시 그립니다."""
+        start = time.perf_counter()
+        changed = progress.collect_changed()
+        if self.model is not None:
+            self.model.set_progress({job_id: entry.percent for job_id, entry in changed.items()})
+            self.view.viewport().repaint() # 화면에 보이는 행을 즉시 다시 그림
+            self.app.processEvents()
+        self.tick_seconds.append(time.perf_counter() - start)
+
+
+def run_scenario(server, gui, mode, concurrency, jobs, size, fragments, reuse_sessions=True):
+    """
+    가짜 미디어 서버를 대상으로 DownloadManager 와 DownloadWorker 를 실행하고 측정값을 반환합니다.
+
+    Args:
+        server (FakeMediaServer): 가짜 미디어 서버
+        gui (GuiProbe): GUI 갱신 비용 측정기
+        mode (str): 미디어 형식 ("progressive", "dash", "hls")
+        concurrency (int): 동시 다운로드 수
+        jobs (int): 작업 수
+        size (int): 비디오 하나의 크기 (바이트)
+        fragments (int): DASH/HLS 조각 동시 다운로드 수
+        reuse_sessions (bool, optional): 작업 사이에 yt-dlp 세션을 재사용할지 여부. Defaults to True.
+
+    Returns:
+        dict: 측정값 (throughput, ttfb, hook 호출 수/시간, GUI 갱신 시간 등)
+    """
+    stats = ScenarioStats()
+    with tempfile.TemporaryDirectory(prefix="tubedown-bench-") as download_path, timed_progress_hooks(stats):
+        manager = DownloadManager(
+            concurrency, listener=stats, info_cache=StubExtractor(server.base_url, mode, size),
+            reuse_sessions=reuse_sessions,
+        )
+        urls = [f"https://www.youtube.com/watch?v=bench{index:06d}" for index in range(jobs)]
+        start = time.monotonic()
+        submitted = manager.submit_batch(
+            urls, download_path=download_path, quality="best", download_subtitles=False,
+            concurrent_fragments=fragments,
+        )
+        gui.reset(submitted)
+        while not manager.wait(GUI_REFRESH_INTERVAL):
+            gui.tick(manager.progress)
+        elapsed = time.monotonic() - start
+        gui.tick(manager.progress) # 마지막 갱신
+        downloaded = sum(
+            entry.stat().st_size for entry in os.scandir(download_path) if entry.is_file()
+        )
+
+    ttfb = stats.ttfb()
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "jobs": jobs,
+        "failed": len(stats.failed),
+        "errors": stats.failed[:3],
+        "seconds": elapsed,
+        "throughput": downloaded / elapsed if elapsed else 0.0,
+        "ttfb_median": statistics.median(ttfb) if ttfb else None,
+        "ttfb_p95": _percentile(ttfb, 95),
+        "hook_calls": stats.hook_calls,
+        "hook_us": stats.hook_seconds / stats.hook_calls * 1e6 if stats.hook_calls else None,
+        "gui_ms": statistics.mean(gui.tick_seconds) * 1e3 if gui.model is not None else None,
+        "gui_p95_ms": _percentile(gui.tick_seconds, 95) * 1e3 if gui.model is not None else None,
+    }
+
+
+def _percentile(values, percent):
+    """값 목록의 백분위수. 비어 있으면 None."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def _format(value, scale=1.0, digits=1):
+    return "-" if value is None else f"{value * scale:.{digits}f}"
+
+
+def parse_args(argv):
+    """
+    명령줄 인자를 파싱합니다.
+
+    Args:
+        argv (list[str]): 명령줄 인자 목록
+
+    Returns:
+        argparse.Namespace: 파싱된 인자
+    """
+    parser = argparse.ArgumentParser(
+        description="로컬 가짜 미디어 서버로 다운로드/스케줄러/GUI 갱신 경로의 성능을 측정합니다 (네트워크 사용 안 함).",
+    )
+    parser.add_argument(
+        "-j", "--levels", type=int, nargs="+", default=list(DEFAULT_LEVELS), metavar="N",
+        help="측정할 동시 다운로드 수 목록 (기본값: 1 4 10 32)",
+    )
+    parser.add_argument(
+        "--modes", nargs="+", choices=MODES, default=list(MODES),
+        help="측정할 미디어 형식 (기본값: 전부)",
+    )
+    parser.add_argument(
+        "--jobs-per-slot", type=int, default=2, metavar="N",
+        help="동시 다운로드 수 대비 작업 수 (기본값: 2, 대기열 처리 포함)",
+    )
+    parser.add_argument(
+        "--size", type=float, default=4.0, metavar="MB",
+        help="비디오 하나의 크기 (MB, 기본값: 4)",
+    )
+    parser.add_argument(
+        "--fragments", type=int, default=1, metavar="N",
+        help="DASH/HLS 조각 동시 다운로드 수 (기본값: 1)",
+    )
+    parser.add_argument(
+        "--no-gui", action="store_true", help="GUI 갱신 비용은 측정하지 않음",
+    )
+    parser.add_argument(
+        "--no-session-reuse", action="store_true", help="작업마다 yt-dlp 세션을 새로 만듦 (재사용 효과 비교용)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    벤치마크 메인 함수. 미디어 형식과 동시 다운로드 수 조합마다 시나리오를 실행하고 표로 출력합니다.
+
+    Returns:
+        int: 종료 코드 (실패한 작업이 있으면 1)
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    size = int(args.size * 1024 * 1024)
+    gui = GuiProbe(enabled=not args.no_gui)
+
+    header = (
+        f"{'mode':<12}{'jobs':>6}{'conc':>6}{'MB/s':>10}{'ttfb p50':>10}{'ttfb p95':>10}"
+        f"{'events':>9}{'us/event':>10}{'gui ms':>9}{'gui p95':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    failed = 0
+    with FakeMediaServer() as server:
+        for mode in args.modes:
+            for level in args.levels:
+                result = run_scenario(
+                    server, gui, mode, level, level * args.jobs_per_slot, size, args.fragments,
+                    reuse_sessions=not args.no_session_reuse,
+                )
+                failed += result["failed"]
+                print(
+                    f"{mode:<12}{result['jobs']:>6}{level:>6}"
+                    f"{_format(result['throughput'], 1 / (1024 * 1024)):>10}"
+                    f"{_format(result['ttfb_median'], 1e3):>10}{_format(result['ttfb_p95'], 1e3):>10}"
+                    f"{result['hook_calls']:>9}{_format(result['hook_us']):>10}"
+                    f"{_format(result['gui_ms'], digits=2):>9}{_format(result['gui_p95_ms'], digits=2):>9}",
+                    flush=True,
+                )
+                for error in result["errors"]:
+                    print(f"  실패: {error}", file=sys.stderr)
+    print("ttfb: 작업 시작부터 첫 바이트까지 (ms), us/event: progress hook 1회 비용, gui: 진행률 갱신 1회 비용 (ms)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,364 @@
+import argparse
+import os
+import sys
+import threading
+import time
+
+import errors
+from api import JobApiServer
+from archive import DownloadArchive
+from config import Config, get_app_data_dir
+from downloader import DownloadWorker
+from infocache import InfoCache
+from library import LibraryIndex
+from manager import DownloadManager, ManagerListener
+from metrics import MetricsRecorder, MetricsServer
+from procpool import ProcessPool
+from utils import PLAYLIST_REGEX, canonical_video_url, extract_video_id
+from watchfolder import WatchFolder
+
+
+SHUTDOWN_TIMEOUT = 5.0 # Ctrl+C 후 실행 중인 작업이 중단되기를 기다리는 최대 시간 (초)
+
+
+class ConsoleListener(ManagerListener):
+    """
+    DownloadManager 작업 이벤트를 콘솔(stderr)에 출력하는 listener 입니다.
+
+    여러 워커 스레드에서 동시에 호출되므로 출력은 lock 으로 직렬화합니다.
+    """
+    def __init__(self, stream=sys.stderr):
+        """
+        ConsoleListener 초기화.
+
+        Args:
+            stream (file, optional): 출력 스트림. Defaults to sys.stderr.
+        """
+        self.stream = stream
+        self.lock = threading.Lock() # 출력 lock (thread-safe)
+        self.playlist_errors = 0 # 목록을 가져오지 못한 재생목록 수
+
+    def _print(self, message):
+        with self.lock:
+            print(message, file=self.stream, flush=True)
+
+    def job_started(self, job):
+        self._print(f"[{job.job_id}] 다운로드 시작: {job.url}")
+
+    def job_finished(self, job):
+        self._print(f"[{job.job_id}] 다운로드 완료: {job.url}")
+
+    def job_failed(self, job):
+        self._print(f"[{job.job_id}] [{errors.label(job.error_kind)}] {job.error}")
+
+    def job_retrying(self, job):
+        self._print(
+            f"[{job.job_id}] [{errors.label(job.error_kind)}] {job.retry_delay:.0f}초 후 다시 시도합니다 "
+            f"({job.retries}번째 재시도): {job.url}"
+        )
+
+    def job_cancelled(self, job):
+        self._print(f"[{job.job_id}] 다운로드 중단됨: {job.url}")
+
+    def concurrency_changed(self, concurrency):
+        self._print(f"동시 다운로드 수 조절: {concurrency}")
+
+    def playlist_expanded(self, url, count):
+        self._print(f"재생목록에서 {count}개 비디오 추가됨: {url}")
+
+    def playlist_failed(self, url, message, kind):
+        self._print(f"[{errors.label(kind)}] {message}")
+        self.playlist_errors += 1
+
+
+def read_urls(lines, allow_playlists=False):
+    """
+    입력 줄에서 YouTube URL을 읽어옵니다.
+
+    빈 줄과 '#' 으로 시작하는 주석 줄은 무시하며, 같은 비디오 ID는 한 번만 반환합니다.
+
+    Args:
+        lines (iterable[str]): 입력 줄 목록 (파일 객체 또는 stdin)
+        allow_playlists (bool, optional): 재생목록/채널 URL 허용 여부. Defaults to False.
+
+    Returns:
+        tuple[list[str], list[str], list[str]]: (비디오 URL 목록, 재생목록/채널 URL 목록, YouTube URL이 아닌 줄 목록)
+    """
+    urls = []
+    playlists = []
+    invalid = []
+    seen_ids = set() # 중복 URL 방지 (비디오 ID 기준)
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"): # 빈 줄, 주석 줄 무시
+            continue
+        if allow_playlists and PLAYLIST_REGEX.match(line): # 재생목록/채널 URL 은 따로 모아서 펼침
+            if line not in playlists:
+                playlists.append(line)
+            continue
+        video_id = extract_video_id(line)
+        if not video_id: # YouTube URL 이 아닌 줄은 따로 모아서 보고
+            invalid.append(line)
+            continue
+        if video_id in seen_ids:
+            continue
+        seen_ids.add(video_id)
+        urls.append(canonical_video_url(video_id)) # 정규화된 URL 로 다운로드
+    return urls, playlists, invalid
+
+
+def parse_args(argv, config):
+    """
+    커맨드라인 인자를 파싱합니다. 지정하지 않은 옵션은 GUI 에서 저장한 설정(Config) 값을 사용합니다.
+
+    Args:
+        argv (list[str]): 커맨드라인 인자 (프로그램 이름 제외)
+        config (Config): 어플리케이션 설정 객체
+
+    Returns:
+        argparse.Namespace: 파싱된 인자
+    """
+    parser = argparse.ArgumentParser(
+        description="YouTube URL 목록을 GUI 없이 일괄 다운로드합니다."
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-",
+        help="URL 목록 파일 경로 (한 줄에 하나, 생략하거나 '-' 이면 stdin)",
+    )
+    parser.add_argument(
+        "-o", "--output", default=config.download_path, help="다운로드 경로"
+    )
+    parser.add_argument(
+        "-q", "--quality", default=config.video_quality,
+        choices=list(DownloadWorker.QUALITY_MAPPING), help="비디오 품질",
+    )
+    parser.add_argument(
+        "--format-tolerance", type=int, metavar="PCT", default=config.format_tolerance,
+        help="해상도·fps·음질 손실이 PCT%% 이내인 단일 파일이 있으면 비디오/오디오를 따로 받아 병합하지 않음 (기본값 0: 손실 없는 경우만)",
+    )
+    parser.add_argument(
+        "-j", "--concurrency", type=int, default=config.concurrent_downloads,
+        help="동시 다운로드 수 (--auto-jobs 를 지정하면 시작 값)",
+    )
+    parser.add_argument(
+        "--auto-jobs", type=int, metavar="MAX", default=config.auto_concurrency_max,
+        help="처리량과 HTTP 429/403, 네트워크 오류에 따라 동시 다운로드 수를 1 ~ MAX 범위에서 자동 조절 (0 이면 고정)",
+    )
+    parser.add_argument(
+        "--merge-jobs", type=int, metavar="N", default=config.postprocess_concurrency,
+        help="후처리(ffmpeg 병합) 동시 실행 수 (동시 다운로드 수와 별도, 기본값 CPU 코어 수)",
+    )
+    parser.add_argument(
+        "--retries", type=int, metavar="N", default=config.max_retries,
+        help="네트워크 오류, HTTP 403/429 로 실패한 다운로드의 자동 재시도 횟수 (0 이면 재시도 안 함)",
+    )
+    parser.add_argument(
+        "--subtitles", dest="subtitles", action="store_true",
+        default=config.download_subtitles, help="자막 다운로드",
+    )
+    parser.add_argument(
+        "--no-subtitles", dest="subtitles", action="store_false", help="자막 다운로드 안 함",
+    )
+    parser.add_argument(
+        "--playlists", dest="playlists", action="store_true",
+        default=config.expand_playlists, help="재생목록/채널 URL 을 개별 비디오로 펼쳐서 다운로드",
+    )
+    parser.add_argument(
+        "--no-playlists", dest="playlists", action="store_false", help="재생목록/채널 URL 무시",
+    )
+    parser.add_argument(
+        "--limit-rate", type=int, metavar="KB/s", default=config.bandwidth_limit,
+        help="전체 다운로드 대역폭 제한 (KB/s, 0 이면 무제한)",
+    )
+    parser.add_argument(
+        "--fragments", type=int, metavar="N", default=config.concurrent_fragments,
+        help="작업당 DASH/HLS 조각 동시 다운로드 수",
+    )
+    parser.add_argument(
+        "--processes", dest="processes", action="store_true",
+        default=config.use_process_pool, help="다운로드를 별도 프로세스에서 실행 (여러 CPU 코어 사용)",
+    )
+    parser.add_argument(
+        "--no-processes", dest="processes", action="store_false", help="다운로드를 스레드에서 실행",
+    )
+    parser.add_argument(
+        "--metrics-log", metavar="FILE",
+        default=os.path.join(get_app_data_dir(), MetricsRecorder.DEFAULT_FILENAME),
+        help="작업별 성능 지표를 기록할 JSON lines 파일 (기본값: GUI 와 같은 파일)",
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, metavar="PORT", default=config.metrics_port,
+        help="http://127.0.0.1:PORT/metrics 에서 Prometheus 형식 성능 지표 제공 (0 이면 사용 안 함)",
+    )
+    parser.add_argument(
+        "--api-port", type=int, metavar="PORT", default=0,
+        help="http://127.0.0.1:PORT/jobs 에서 작업 추가/조회/취소 API 제공. 지정하면 Ctrl+C 를 누를 때까지 계속 실행",
+    )
+    parser.add_argument(
+        "--watch", metavar="DIR",
+        help="DIR 에 놓인 .txt URL 목록 파일을 다운로드 (처리한 파일은 DIR/processed 로 이동). 지정하면 Ctrl+C 를 누를 때까지 계속 실행",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="다운로드 아카이브에 있거나 다운로드 경로에 이미 있는 비디오도 다시 다운로드",
+    )
+    parser.add_argument(
+        "--import-archive", metavar="FILE",
+        help="yt-dlp --download-archive 파일을 다운로드 아카이브로 가져오기 (input 없이 사용 가능)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    CLI 메인 함수.
+
+    - URL 목록 읽기 (파일 또는 stdin)
+    - DownloadManager 로 설정된 동시 다운로드 수만큼 병렬 다운로드
+    - 모든 작업 종료 후 결과 요약 출력 (--api-port, --watch 를 지정하면 Ctrl+C 를 누를 때까지 계속 작업을 받음)
+
+    Returns:
+        int: 종료 코드 (모두 성공 시 0, 실패한 작업이 있으면 1, 입력 오류 시 2)
+    """
+    config = Config() # GUI 와 같은 설정 사용 (QSettings 만 사용하며 QApplication 은 생성하지 않음)
+    args = parse_args(sys.argv[1:] if argv is None else argv, config)
+    archive = DownloadArchive( # GUI 와 같은 다운로드 아카이브 사용
+        os.path.join(get_app_data_dir(), DownloadArchive.DEFAULT_FILENAME)
+    )
+
+    if args.import_archive:
+        try:
+            added = archive.import_ytdlp_archive(args.import_archive)
+        except OSError as e:
+            print(f"아카이브 파일을 열 수 없습니다: {e}", file=sys.stderr)
+            archive.close()
+            return 2
+        print(f"아카이브에 {added}개 비디오를 추가했습니다.", file=sys.stderr)
+        if args.input == "-" and sys.stdin.isatty():
+            archive.close()
+            return 0 # 가져오기만 요청한 경우
+
+    serving = bool(args.api_port or args.watch) # 로컬 API/감시 폴더로 계속 작업을 받는 모드
+    if args.input == "-" and serving and sys.stdin.isatty():
+        urls, playlists, invalid = [], [], [] # 입력 목록 없이 API/감시 폴더만 사용
+    elif args.input == "-":
+        urls, playlists, invalid = read_urls(sys.stdin, args.playlists)
+    else:
+        try:
+            with open(args.input, encoding="utf-8") as f:
+                urls, playlists, invalid = read_urls(f, args.playlists)
+        except OSError as e:
+            print(f"URL 목록 파일을 열 수 없습니다: {e}", file=sys.stderr)
+            archive.close()
+            return 2
+
+    for line in invalid:
+        print(f"YouTube URL이 아니므로 건너뜀: {line}", file=sys.stderr)
+    if not args.force:
+        remaining = []
+        for url in urls:
+            if extract_video_id(url) in archive: # 이미 다운로드한 비디오
+                print(f"이미 다운로드한 비디오이므로 건너뜀: {url}", file=sys.stderr)
+            else:
+                remaining.append(url)
+        urls = remaining
+    if not urls and not playlists and not serving:
+        print("다운로드할 URL이 없습니다.", file=sys.stderr)
+        archive.close()
+        return 2
+
+    listener = ConsoleListener()
+    metrics = MetricsRecorder(args.metrics_log)
+    metrics_server = None
+    if args.metrics_port:
+        try:
+            metrics_server = MetricsServer(metrics, args.metrics_port)
+        except OSError as e: # 포트 사용 중 등: 다운로드는 계속 진행
+            print(f"성능 지표 서버를 시작할 수 없습니다: {e}", file=sys.stderr)
+    process_pool = ProcessPool(args.concurrency) if args.processes else None
+    library = None if args.force else LibraryIndex( # 다운로드 폴더에 이미 있는 비디오 건너뛰기
+        os.path.join(get_app_data_dir(), LibraryIndex.DEFAULT_FILENAME)
+    )
+    manager = DownloadManager(
+        concurrency=args.concurrency, listener=listener, archive=archive,
+        bandwidth_limit=args.limit_rate * 1024, # KB/s -> 바이트/초
+        info_cache=InfoCache(os.path.join(get_app_data_dir(), InfoCache.DEFAULT_DIRNAME)), # GUI 와 같은 비디오 정보 캐시
+        process_pool=process_pool,
+        library=library,
+        metrics=metrics,
+        postprocess_concurrency=args.merge_jobs, # 병합은 다운로드 슬롯을 반납한 뒤 별도 한도로 실행
+        max_retries=args.retries,
+        auto_concurrency_max=args.auto_jobs,
+        format_tolerance=args.format_tolerance / 100, # % -> 비율
+    )
+    for url in playlists: # 재생목록은 백그라운드에서 펼쳐지며, 받는 대로 다운로드 시작
+        manager.submit_playlist(
+            url,
+            download_path=args.output,
+            quality=args.quality,
+            download_subtitles=args.subtitles,
+            concurrent_fragments=args.fragments,
+        )
+    for url in urls:
+        manager.submit(
+            url,
+            download_path=args.output,
+            quality=args.quality,
+            download_subtitles=args.subtitles,
+            concurrent_fragments=args.fragments,
+        )
+
+    def submit_options(): # 로컬 API 와 감시 폴더로 추가하는 작업의 기본 다운로드 옵션
+        return {
+            "download_path": args.output,
+            "quality": args.quality,
+            "download_subtitles": args.subtitles,
+            "concurrent_fragments": args.fragments,
+            "expand_playlists": args.playlists,
+        }
+
+    api_server = None
+    watch_folder = None
+    try:
+        if args.api_port:
+            api_server = JobApiServer(manager, args.api_port, submit_options)
+            print(f"로컬 API: http://127.0.0.1:{api_server.port}/jobs", file=sys.stderr)
+        if args.watch:
+            watch_folder = WatchFolder(manager, args.watch, submit_options)
+            print(f"감시 폴더: {os.path.abspath(args.watch)}", file=sys.stderr)
+    except OSError as e: # 포트 사용 중, 폴더 권한 등: 계속 받을 수 없으므로 입력 목록만 다운로드
+        print(f"로컬 API/감시 폴더를 시작할 수 없습니다: {e}", file=sys.stderr)
+        serving = False
+
+    try:
+        while serving: # Ctrl+C 를 누를 때까지 계속 작업을 받음
+            time.sleep(1)
+        manager.wait()
+    except KeyboardInterrupt: # Ctrl+C 시 실행 중인 작업 중단 후 종료 (아래 shutdown)
+        print("중단 요청됨, 실행 중인 다운로드를 정리합니다...", file=sys.stderr)
+    finally:
+        if api_server is not None:
+            api_server.close()
+        if watch_folder is not None:
+            watch_folder.close()
+        # 실행 중인 작업 중단. 제한 시간 안에 끝나지 않은 워커는 아래에서 닫을 저장소(지표, 아카이브 등)에서 분리됨
+        if not manager.shutdown(SHUTDOWN_TIMEOUT): # 응답 없는 연결 등으로 늦어지는 작업은 기다리지 않음
+            print("일부 다운로드가 제한 시간 안에 중단되지 않아 기다리지 않고 종료합니다.", file=sys.stderr)
+        if process_pool is not None:
+            process_pool.shutdown(timeout=SHUTDOWN_TIMEOUT) # 자식 프로세스 종료 (시간 초과 시 강제 종료)
+        if metrics_server is not None:
+            metrics_server.close()
+        metrics.close()
+        if library is not None:
+            library.close()
+        archive.close() # WAL 체크포인트 (SQLite 저장소 정리)
+
+    failed = [job for job in manager.jobs.values() if job.state != job.COMPLETED]
+    print(
+        f"완료: {len(manager.jobs) - len(failed)}, 실패: {len(failed)}", file=sys.stderr
+    )
+    return 1 if failed or listener.playlist_errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main()) # main 함수 호출 (CLI 시작)
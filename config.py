@@ -31,12 +31,33 @@ def get_system_download_folder():
     return os.path.expanduser("~/Downloads")  # macOS 및 Linux 기본 다운로드 폴더 경로
 
 
+def get_app_data_dir():
+    """
+    어플리케이션 데이터(다운로드 아카이브 등)를 저장할 폴더 경로를 가져옵니다.
+
+    Windows: %APPDATA%/YouTubeDownloader
+    macOS: ~/Library/Application Support/YouTubeDownloader
+    Linux: $XDG_DATA_HOME/YouTubeDownloader (기본값 ~/.local/share/YouTubeDownloader)
+
+    Returns:
+        str: 어플리케이션 데이터 폴더 경로 (폴더 생성은 사용하는 쪽에서 수행)
+    """
+    if sys.platform.startswith("win"):
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, "YouTubeDownloader")
+
+
 class Config:
     """
     어플리케이션 설정을 관리하는 클래스입니다.
 
     QSettings를 사용하여 설정을 저장하고 불러옵니다.
-    설정 값은 동시 다운로드 수, 다운로드 경로, 비디오 품질, 자막 다운로드 여부입니다.
+    설정 값은 동시 다운로드 수, 다운로드 경로, 비디오 품질, 자막 다운로드 여부, 재생목록 펼치기 여부,
+    전체 대역폭 제한, 조각 동시 다운로드 수, 후처리 동시 실행 수, 병합 생략 화질 허용 손실, 프로세스 모드 사용 여부, 성능 지표 서버 포트입니다.
     """
 
     def __init__(self):
@@ -60,9 +81,45 @@ class Config:
         self.download_subtitles = self.settings.value(
             "download_subtitles", True, type=bool
         )
+        self.expand_playlists = self.settings.value(
+            "expand_playlists", False, type=bool # 재생목록/채널 URL 펼치기 (기본 비활성)
+        )
+        self.bandwidth_limit = self.settings.value(
+            "bandwidth_limit", 0, type=int # 전체 대역폭 제한 (KB/s, 0 이면 무제한)
+        )
+        self.concurrent_fragments = self.settings.value(
+            "concurrent_fragments", 1, type=int # 작업당 DASH/HLS 조각 동시 다운로드 수
+        )
+        self.postprocess_concurrency = self.settings.value(
+            "postprocess_concurrency", os.cpu_count() or 1, type=int # 후처리(ffmpeg 병합) 동시 실행 수 (기본 CPU 코어 수)
+        )
+        self.max_retries = self.settings.value(
+            "max_retries", 3, type=int # 일시적인 에러(네트워크, HTTP 403/429)로 실패한 다운로드의 자동 재시도 횟수
+        )
+        self.format_tolerance = self.settings.value(
+            "format_tolerance", 0, type=int # 병합 대신 단일 파일 등을 고를 때 허용할 화질 손실 (%, 0 이면 손실 없는 경우만)
+        )
+        self.auto_concurrency_max = self.settings.value(
+            "auto_concurrency_max", 0, type=int # 동시 다운로드 수 자동 조절 상한 (0 이면 자동 조절 안 함)
+        )
+        self.use_process_pool = self.settings.value(
+            "use_process_pool", False, type=bool # 다운로드를 별도 프로세스에서 실행 (기본 비활성)
+        )
+        self.metrics_port = self.settings.value(
+            "metrics_port", 0, type=int # Prometheus 형식 성능 지표 서버 포트 (0 이면 사용 안 함)
+        )
+        self.api_port = self.settings.value(
+            "api_port", 0, type=int # 작업 추가/조회/취소용 로컬 HTTP API 포트 (0 이면 사용 안 함)
+        )
+        self.watch_folder = self.settings.value(
+            "watch_folder", "", type=str # .txt URL 목록 파일을 가져올 감시 폴더 (비어 있으면 사용 안 함)
+        )
 
     def save_settings(
-            self, concurrent_downloads, download_path, video_quality, download_subtitles
+            self, concurrent_downloads, download_path, video_quality, download_subtitles,
+            expand_playlists=False, bandwidth_limit=0, concurrent_fragments=1, use_process_pool=False,
+            metrics_port=0, postprocess_concurrency=None, max_retries=3, auto_concurrency_max=0,
+            api_port=0, watch_folder="", format_tolerance=0,
     ):
         """
         변경된 설정을 QSettings에 저장하고, Config 객체 속성을 업데이트합니다.
@@ -72,9 +129,31 @@ class Config:
             download_path (str): 다운로드 경로
             video_quality (str): 비디오 품질 설정
             download_subtitles (bool): 자막 다운로드 여부
+            expand_playlists (bool): 재생목록/채널 URL 을 개별 비디오로 펼쳐서 다운로드할지 여부
+            bandwidth_limit (int): 전체 다운로드 대역폭 제한 (KB/s, 0 이면 무제한)
+            concurrent_fragments (int): 작업당 DASH/HLS 조각 동시 다운로드 수
+            use_process_pool (bool): 다운로드를 별도 프로세스에서 실행할지 여부
+            metrics_port (int): 성능 지표 서버 포트 (0 이면 사용 안 함)
+            postprocess_concurrency (int): 후처리(ffmpeg 병합) 동시 실행 수 (None 이면 CPU 코어 수)
+            max_retries (int): 일시적인 에러로 실패한 다운로드의 자동 재시도 횟수 (0 이면 재시도 안 함)
+            auto_concurrency_max (int): 동시 다운로드 수 자동 조절 상한 (0 이면 자동 조절 안 함)
+            api_port (int): 로컬 HTTP API 포트 (0 이면 사용 안 함)
+            watch_folder (str): .txt URL 목록 파일을 가져올 감시 폴더 (비어 있으면 사용 안 함)
+            format_tolerance (int): 병합 대신 단일 파일 등을 고를 때 허용할 화질 손실 (%)
         """
         self.settings.setValue("concurrent_downloads", concurrent_downloads)
         self.settings.setValue("download_path", download_path)
         self.settings.setValue("video_quality", video_quality)
         self.settings.setValue("download_subtitles", download_subtitles)
+        self.settings.setValue("expand_playlists", expand_playlists)
+        self.settings.setValue("bandwidth_limit", bandwidth_limit)
+        self.settings.setValue("concurrent_fragments", concurrent_fragments)
+        self.settings.setValue("use_process_pool", use_process_pool)
+        self.settings.setValue("metrics_port", metrics_port)
+        self.settings.setValue("postprocess_concurrency", postprocess_concurrency or os.cpu_count() or 1)
+        self.settings.setValue("max_retries", max_retries)
+        self.settings.setValue("auto_concurrency_max", auto_concurrency_max)
+        self.settings.setValue("api_port", api_port)
+        self.settings.setValue("watch_folder", watch_folder)
+        self.settings.setValue("format_tolerance", format_tolerance)
         self.load_settings()  # 설정 저장 후 객체 속성 즉시 업데이트
@@ -1,25 +1,195 @@
+import functools
+import glob
 import os
+import threading
 
-import yt_dlp
-from PyQt5.QtCore import QRunnable, pyqtSlot, pyqtSignal, QObject
+import errors
+from formatselect import FormatSelector
+from metrics import JobMetrics, RetryCountingLogger
+from startup import lazy_import
+from utils import extract_video_id
 
 
-class WorkerSignals(QObject):
+class WorkerListener:
     """
-    DownloadWorker 스레드에서 발생하는 시그널을 정의합니다.
+    DownloadWorker 에서 발생하는 이벤트를 전달받는 인터페이스입니다.
 
-    finished: 다운로드 완료 시그널, URL을 인자로 전달합니다.
-    error: 다운로드 에러 시그널, 에러 메시지를 인자로 전달합니다.
-    progress: 다운로드 진행률 시그널, URL과 진행률(0.0~100.0)을 인자로 전달합니다.
+    Qt 시그널 대신 일반 메서드 호출로 이벤트를 전달하므로, GUI 없이도 워커를 사용할 수 있습니다.
+    기본 구현은 아무 동작도 하지 않으며, 필요한 메서드만 재정의하여 사용합니다.
     """
-    finished = pyqtSignal(str)
-    error = pyqtSignal(str)
-    progress = pyqtSignal(str, float)
+    def progress(self, url, downloaded_bytes, total_bytes):
+        """
+        다운로드 진행 이벤트. 청크를 받을 때마다 호출되므로 가볍게 처리해야 합니다.
+
+        Args:
+            url (str): 다운로드 URL
+            downloaded_bytes (int): 현재 파일에서 받은 바이트 수
+            total_bytes (int): 현재 파일의 전체 바이트 수 (알 수 없으면 None)
+        """
 
+    def started(self, url):
+        """다운로드 시작 이벤트. URL을 전달합니다."""
 
-class DownloadWorker(QRunnable):
+    def extracted(self, url, info):
+        """
+        비디오 정보 추출 완료 이벤트. 파일을 받기 전에 호출되므로 제목 등을 미리 표시할 수 있습니다.
+
+        Args:
+            url (str): 다운로드 URL
+            info (dict): yt-dlp 비디오 정보 (id, title, formats 등)
+        """
+
+    def destination(self, url, filename):
+        """
+        새 파일 다운로드 시작 이벤트. 비디오/오디오를 따로 받는 경우 파일마다 호출됩니다.
+
+        Args:
+            url (str): 다운로드 URL
+            filename (str): 받는 중인 임시 파일 경로 (`.part`, 중단 후 이어받기에 사용)
+        """
+
+    def postprocessing(self, url):
+        """
+        네트워크 전송이 끝나고 후처리(ffmpeg 병합 등)를 시작하기 직전 이벤트. 후처리 슬롯을 기다리기 전에 호출되므로,
+        받는 쪽은 이 작업이 쓰던 다운로드 슬롯을 다음 작업에 넘겨줄 수 있습니다.
+
+        Args:
+            url (str): 다운로드 URL
+        """
+
+    def finished(self, url, info):
+        """
+        다운로드 완료 이벤트.
+
+        Args:
+            url (str): 다운로드 URL
+            info (dict): yt-dlp 가 반환한 비디오 정보 (id, title, format, requested_downloads 등)
+        """
+
+    def error(self, url, message, kind):
+        """
+        다운로드 에러 이벤트.
+
+        Args:
+            url (str): 다운로드 URL
+            message (str): 에러 메시지
+            kind (str): 에러 분류 (errors.NETWORK, RATE_LIMITED, EXTRACTOR, FFMPEG, CANCELLED 등)
+        """
+
+    def metrics(self, url, metrics):
+        """
+        작업 성능 지표 이벤트. 실행이 끝날 때 (완료/에러 이벤트 직전) 한 번 호출됩니다.
+
+        Args:
+            url (str): 다운로드 URL
+            metrics (dict): 단계별 시간, 바이트 수, 속도, 재시도 횟수 등 (JobMetrics.to_dict() 결과)
+        """
+
+
+_current = threading.local() # 현재 스레드에서 실행 중인 DownloadWorker (외부 프로세스 추적용)
+
+
+@functools.lru_cache(maxsize=None)
+def _instrumented_youtubedl_class():
     """
-    yt-dlp를 사용하여 비디오를 다운로드하는 워커 스레드입니다.
+    _InstrumentedYoutubeDL 클래스를 반환합니다. yt_dlp.YoutubeDL 을 상속하므로, yt_dlp 를 처음 사용할 때
+    (첫 다운로드 시작 시) 만들어 어플리케이션 시작 시간에 yt_dlp import 비용이 들지 않도록 합니다.
+
+    이때 yt-dlp 가 외부 프로그램(ffmpeg 등)을 실행하는 Popen 클래스에 추적을 한 번 설치하여,
+    워커 스레드에서 시작된 프로세스를 해당 워커에 등록합니다. 워커를 중단하면 등록된 프로세스를 종료합니다.
+
+    객체는 SessionPool 을 통해 여러 작업이 차례로 재사용하므로, 작업마다 달라지는 상태(워커, logger)는
+    생성자가 아니라 `bind()` 로 지정합니다.
+    """
+    yt_dlp = lazy_import("yt_dlp")
+
+    popen_init = yt_dlp.utils.Popen.__init__
+
+    def tracked_init(process, *args, **kwargs):
+        popen_init(process, *args, **kwargs)
+        worker = getattr(_current, "worker", None)
+        if worker is not None:
+            worker._track_process(process)
+
+    yt_dlp.utils.Popen.__init__ = tracked_init # 공개 확장 지점이 없어 생성자만 감쌈 (동작은 그대로)
+
+    class _InstrumentedYoutubeDL(yt_dlp.YoutubeDL):
+        """
+        자막 받기와 후처리(ffmpeg 병합 등) 시간을 작업 지표에 단계별로 기록하는 YoutubeDL.
+        후처리는 워커의 후처리 슬롯을 얻은 뒤에 실행하며, 그 전에 listener.postprocessing 으로 네트워크 단계가 끝났음을 알립니다.
+        """
+
+        def __init__(self, params, shared=None, format_tolerance=None):
+            self.worker = None # 이 세션을 빌려 쓰는 워커 (bind 로 지정)
+            super().__init__(params)
+            self.add_progress_hook(self._progress_hook) # 재사용해도 hook 은 하나: 현재 워커로 전달
+            if shared is not None:
+                self._share_extractor_caches(shared)
+            format_spec = self.params.get("format")
+            if format_tolerance is not None and isinstance(format_spec, str) and "+" in format_spec: # 병합하는 품질만
+                self.format_selector = FormatSelector( # 화질 손실이 허용 범위 안이면 병합하지 않는 포맷 선택
+                    self, self.format_selector, format_tolerance, on_choice=self._on_format_choice
+                )
+
+        def bind(self, worker):
+            """세션을 작업에 연결합니다. 옵션은 그대로 두고 작업마다 달라지는 워커와 재시도 기록 logger 만 바꿉니다."""
+            self.worker = worker
+            self.params["logger"] = RetryCountingLogger(worker.metrics) # 재시도 횟수 기록 (에러는 stderr 로 출력)
+
+        def _progress_hook(self, d):
+            self.worker._on_progress(d)
+
+        def _on_format_choice(self, choice):
+            self.worker.metrics.format_choice = choice
+
+        def _share_extractor_caches(self, shared):
+            """
+            YouTube 추출기의 플레이어 코드와 서명 함수 캐시를 풀의 모든 세션이 공유하는 dict 로 바꿉니다.
+            새 세션도 다른 세션이 이미 받은 플레이어(수 MB)를 다시 받거나 해석하지 않습니다.
+            """
+            ie = self.get_info_extractor("Youtube")
+            for name in ("_code_cache", "_player_cache"): # 공개 확장 지점이 없어 인스턴스 속성만 교체 (없으면 그대로)
+                if isinstance(getattr(ie, name, None), dict):
+                    setattr(ie, name, shared.setdefault(name, {}))
+
+        def urlopen(self, req):
+            if self.worker.is_interrupted: # 정보 추출, 재시도, 조각 요청 등 모든 HTTP 요청 전에 중단 확인
+                raise yt_dlp.utils.DownloadCancelled("다운로드 중단됨")
+            return super().urlopen(req)
+
+        def _write_subtitles(self, info_dict, filename):
+            with self.worker.metrics.phase("subtitles"):
+                return super()._write_subtitles(info_dict, filename)
+
+        def post_process(self, filename, info, files_to_move=None):
+            worker = self.worker
+            worker.listener.postprocessing(worker.url) # 다운로드 슬롯 반납 (다음 작업이 바로 전송 시작)
+            slots = worker.postprocess_slots
+            if slots is not None:
+                with worker.metrics.phase("postprocess_wait"):
+                    acquired = slots.acquire(lambda: worker.is_interrupted)
+                if not acquired: # 받은 파일은 남아 있으므로 재개 시 병합부터 다시 실행
+                    raise yt_dlp.utils.DownloadCancelled("다운로드 중단됨")
+            worker._files.add(filename) # 중단 시 병합 중이던 파일도 임시 파일로 취급
+            try:
+                with worker.metrics.phase("postprocess"):
+                    info = super().post_process(filename, info, files_to_move)
+                if worker.is_interrupted: # 후처리 도중 중단 요청 (종료된 외부 프로세스의 결과는 믿을 수 없음)
+                    raise yt_dlp.utils.DownloadCancelled("다운로드 중단됨")
+                return info
+            finally:
+                if slots is not None:
+                    slots.release()
+
+    return _InstrumentedYoutubeDL
+
+
+class DownloadWorker:
+    """
+    yt-dlp를 사용하여 비디오를 다운로드하는 워커입니다.
+
+    Qt에 의존하지 않으며, 호출한 스레드에서 `run()` 이 실행됩니다.
+    스레드 배치 및 동시 실행 수 제어는 DownloadManager 가 담당합니다.
 
     Attributes:
         QUALITY_MAPPING (dict): 비디오 품질 옵션과 yt-dlp format string 매핑
@@ -33,7 +203,11 @@ class DownloadWorker(QRunnable):
         "bestaudio": "bestaudio/best",
     }
 
-    def __init__(self, url, download_path, quality, signals, download_subtitles):
+    def __init__(
+            self, url, download_path, quality, listener, download_subtitles,
+            rate_limiter=None, weight=1.0, concurrent_fragments=1, info_cache=None, postprocess_slots=None,
+            session_pool=None, format_tolerance=0.0,
+    ):
         """
         DownloadWorker 초기화.
 
@@ -41,42 +215,97 @@ class DownloadWorker(QRunnable):
             url (str): 다운로드할 YouTube URL
             download_path (str): 다운로드 경로
             quality (str): 비디오 품질 설정
-            signals (WorkerSignals): WorkerSignals 객체 (시그널 emit 용)
+            listener (WorkerListener): 이벤트 수신 객체
             download_subtitles (bool): 자막 다운로드 여부
+            rate_limiter (TokenBucket, optional): 전체 워커가 공유하는 대역폭 제한기. Defaults to None.
+            weight (float, optional): 대역폭 분배 가중치. Defaults to 1.0.
+            concurrent_fragments (int, optional): DASH/HLS 조각 동시 다운로드 수. Defaults to 1.
+            info_cache (InfoCache, optional): 비디오 정보 디스크 캐시 (재시도/재개 시 추출 생략). Defaults to None.
+            postprocess_slots (SlotLimiter, optional): 작업들이 공유하는 후처리 동시 실행 수 제한기. Defaults to None (제한 없음).
+            session_pool (SessionPool, optional): 작업들이 재사용하는 yt-dlp 세션 풀. Defaults to None (작업마다 새로 생성).
+            format_tolerance (float, optional): 병합하지 않는 포맷을 고를 때 허용할 화질 손실 비율 (FormatSelector 참고,
+                None 이면 format string 그대로 선택). Defaults to 0.0 (손실 없는 경우만).
         """
-        super().__init__()
         self.url = url
         self.download_path = download_path
         self.quality = quality
-        self.signals = signals
+        self.listener = listener
         self.download_subtitles = download_subtitles
+        self.rate_limiter = rate_limiter
+        self.weight = weight # 실행 중 변경 가능 (DownloadManager.set_weight)
+        self.concurrent_fragments = concurrent_fragments
+        self.info_cache = info_cache
+        self.postprocess_slots = postprocess_slots
+        self.session_pool = session_pool
+        self.format_tolerance = format_tolerance
         self.is_interrupted = False # 다운로드 중단 플래그 추가
+        self.delete_partial = False # 중단 후 임시 파일 삭제 여부
+        self._files = set() # 이번 실행에서 만든 파일 경로 (중단 후 임시 파일 삭제용)
+        self._processes = set() # 실행 중인 외부 프로세스 (ffmpeg 등, 중단 시 종료)
+        self._processes_lock = threading.Lock()
+        self._received = {} # 파일별로 대역폭 제한기에 반영한 바이트 수 (filename: bytes)
+        self._received_lock = threading.Lock() # 조각 동시 다운로드 시 여러 스레드에서 hook 이 호출됨
+        self._destination = None # 현재 받는 중인 임시 파일 경로
+        self.metrics = JobMetrics() # 단계별 성능 지표 (실행 종료 시 listener.metrics 로 전달)
 
-    @pyqtSlot()
     def run(self):
         """
-        워커 스레드의 메인 실행 함수입니다. yt-dlp를 사용하여 다운로드를 실행하고,
-        진행률, 완료, 에러 시그널을 emit 합니다.
-        """
-        def progress_hook(d):
-            """yt-dlp progress hook function. 다운로드 진행 상황을 signals.progress 시그널로 emit 합니다."""
-            if self.is_interrupted:  # 다운로드 중단 요청 확인
-                raise yt_dlp.DownloadError("다운로드 중단됨", interrupted=True)
-            if d["status"] == "downloading":
-                total_bytes = d.get("total_bytes") or d.get("total_bytes_estimate")
-                if total_bytes:
-                    progress_percent = d.get("downloaded_bytes", 0) / total_bytes * 100
-                    self.signals.progress.emit(self.url, progress_percent)
-            elif d["status"] == "finished":
-                self.signals.progress.emit(self.url, 100.0)
+        워커의 메인 실행 함수입니다. yt-dlp를 사용하여 다운로드를 실행하고,
+        진행률, 완료, 에러 이벤트를 listener 로 전달합니다.
+        """
+        yt_dlp = lazy_import("yt_dlp") # 첫 다운로드 시 import (어플리케이션 시작 시간 단축)
+        ydl_opts = self._session_options()
+        session_key = repr((sorted(ydl_opts.items()), self.format_tolerance)) # 옵션이 모두 같은 세션끼리만 재사용
+
+        info = None
+        error_message = None
+        error_kind = None
+        ydl = None
+        _current.worker = self # 이 스레드에서 시작되는 외부 프로세스를 이 워커에 등록
+        try:
+            with self.metrics.phase("setup"):
+                ydl = self._acquire_session(ydl_opts, session_key)
+            self.listener.started(self.url) # 다운로드 시작 (초기 진행률 0%) 전달
+            info = self._extract_and_download(ydl) # 다운로드 후 비디오 정보 반환
+        except Exception as e:
+            if self.is_interrupted: # 어느 단계에서 중단했든 (HTTP 요청, progress hook, 후처리 프로세스 종료) 중단으로 처리
+                error_message = f"다운로드 중단됨: {self.url}" # 사용자에게 중단 메시지 표시
+                error_kind = errors.CANCELLED
+            elif isinstance(e, yt_dlp.DownloadError): # yt-dlp 다운로드 에러 처리
+                error_message = f"다운로드 오류: {self.url} - {e}"
+                error_kind = errors.classify_error(e) # 감싼 원래 예외로 분류 (네트워크, HTTP 403/429, 추출, ffmpeg)
+            else: # 예상치 못한 에러 처리
+                error_message = f"예상치 못한 오류 발생: {self.url} - {e}"
+                error_kind = errors.classify_error(e)
+        finally:
+            _current.worker = None
+            if ydl is not None:
+                self._release_session(ydl, session_key, reuse=error_message is None) # 실패한 세션은 재시도 시 새로 생성
+        if error_message is not None and self.is_interrupted and self.delete_partial:
+            self._remove_partial_files()
+
+        self.listener.metrics(self.url, self.metrics.to_dict()) # 작업 성능 지표 전달 (완료/에러 이벤트 전)
+        if error_message is None:
+            self.listener.finished(self.url, info) # 다운로드 완료 이벤트 전달 (제목, 파일 경로 등 포함)
+        else:
+            self.listener.error(self.url, error_message, error_kind) # 다운로드 에러 이벤트 전달
+
+    def _session_options(self):
+        """
+        yt-dlp 옵션을 만듭니다. 작업마다 달라지는 값(progress hook, logger)은 세션에 bind 할 때 지정하므로 포함하지 않습니다.
 
+        Returns:
+            dict: YoutubeDL 옵션 (같은 옵션의 세션은 서로 바꿔 쓸 수 있음)
+        """
         ydl_opts = {
-            "outtmpl": os.path.join(self.download_path, "%(title)s.%(ext)s"),
+            "outtmpl": os.path.join(self.download_path, "%(title)s [%(id)s].%(ext)s"), # 비디오 ID 포함 (라이브러리 인덱스용)
             "format": self.QUALITY_MAPPING.get(self.quality, "best"),
+            "concurrent_fragment_downloads": self.concurrent_fragments, # DASH/HLS 조각 동시 다운로드 수
+            "continuedl": True, # 남아 있는 .part 파일에서 이어받기 (중단 후 재시작 시)
             "noplaylist": True,
             "quiet": True,
             "no_warnings": True,
-            "progress_hooks": [progress_hook],
+            "noprogress": True, # 진행률은 listener 로만 전달 (quiet 여도 콘솔에 진행률 줄을 출력하므로 끔)
         }
 
         if self.download_subtitles:
@@ -88,24 +317,155 @@ class DownloadWorker(QRunnable):
                     "subtitle_format": "best", # 최적 자막 포맷
                 }
             )
+        return ydl_opts
 
-        try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                self.signals.progress.emit(self.url, 0.0) # 초기 진행률 0% emit
-                ydl.download([self.url])
-            self.signals.finished.emit(self.url) # 다운로드 완료 시 finished 시그널 emit
-        except yt_dlp.DownloadError as e: # yt-dlp 다운로드 에러 처리
-            if e.exc_info and isinstance(e.exc_info[1], yt_dlp.DownloadError) and e.exc_info[1].interrupted:
-                self.signals.error.emit(f"다운로드 중단됨: {self.url}") # 사용자에게 중단 메시지 표시
-            else:
-                error_message = f"다운로드 오류: {self.url} - {e}"
-                self.signals.error.emit(error_message) # 다운로드 에러 시 error 시그널 emit
-        except Exception as e: # 예상치 못한 에러 처리
-            error_message = f"예상치 못한 오류 발생: {self.url} - {e}"
-            self.signals.error.emit(error_message) # 예외 발생 시 error 시그널 emit
+    def _acquire_session(self, ydl_opts, session_key):
+        """
+        세션 풀에서 같은 옵션의 YoutubeDL 세션을 빌려 (없으면 새로 만들어) 이 작업에 연결합니다.
+
+        Args:
+            ydl_opts (dict): YoutubeDL 옵션
+            session_key (str): 옵션 키
+
+        Returns:
+            _InstrumentedYoutubeDL: 이 작업에 연결된 세션
+        """
+        shared = self.session_pool.shared if self.session_pool is not None else None
+
+        def factory():
+            return _instrumented_youtubedl_class()( # YoutubeDL 이 옵션 dict 를 수정하므로 복사
+                dict(ydl_opts), shared, self.format_tolerance
+            )
+
+        if self.session_pool is None:
+            ydl, reused = factory(), False
+        else:
+            ydl, reused = self.session_pool.acquire(session_key, factory)
+        self.metrics.session_reused = reused
+        ydl.bind(self)
+        return ydl
+
+    def _release_session(self, ydl, session_key, reuse):
+        """세션을 풀에 돌려줍니다. 풀이 없거나 재사용하지 않으면 닫습니다 (연결 정리)."""
+        ydl.worker = None # 끝난 작업(listener 등)을 붙잡고 있지 않도록
+        if self.session_pool is None:
+            ydl.close()
+        else:
+            self.session_pool.release(session_key, ydl, reuse=reuse)
+
+    def _on_progress(self, d):
+        """yt-dlp progress hook. 다운로드 진행 상황을 listener.progress 로 전달합니다 (세션의 hook 이 호출)."""
+        if self.is_interrupted:  # 다운로드 중단 요청 확인
+            yt_dlp = lazy_import("yt_dlp")
+            raise yt_dlp.utils.DownloadCancelled("다운로드 중단됨") # yt-dlp 가 감싸지 않고 그대로 전달하는 예외
+        self.metrics.on_progress(d) # 바이트 수, 속도, 조각 수 기록
+        if d["status"] == "downloading":
+            # 이번 실행이 받는 파일만 임시 파일로 기록 (이미 받아 둔 파일은 finished 만 전달되므로 삭제 대상에서 제외)
+            self._files.update(path for path in (d.get("tmpfilename"), d.get("filename")) if path)
+            if d.get("tmpfilename") and d["tmpfilename"] != self._destination: # 새 파일 시작
+                self._destination = d["tmpfilename"]
+                self.listener.destination(self.url, self._destination)
+            total_bytes = d.get("total_bytes") or d.get("total_bytes_estimate")
+            self.listener.progress(self.url, d.get("downloaded_bytes", 0), total_bytes) # 최신 바이트 수만 전달
+            if self.rate_limiter is not None:
+                self._throttle(d.get("filename"), d.get("downloaded_bytes", 0)) # 전체 대역폭 제한
+        elif d["status"] == "finished":
+            total_bytes = d.get("total_bytes") or d.get("downloaded_bytes", 0)
+            self.listener.progress(self.url, total_bytes, total_bytes)
+
+    def _extract_and_download(self, ydl):
+        """
+        비디오 정보를 추출하고 다운로드합니다. 캐시에 유효한 정보가 있으면 추출을 건너뛰고 바로 다운로드하며,
+        캐시된 URL 로 다운로드에 실패하면 (만료 등) 캐시를 지우고 새로 추출하여 한 번 더 시도합니다.
+
+        Args:
+            ydl (yt_dlp.YoutubeDL): 다운로드 옵션이 설정된 YoutubeDL 객체
+
+        Returns:
+            dict: 다운로드가 끝난 비디오 정보 (requested_downloads 포함)
+        """
+        yt_dlp = lazy_import("yt_dlp")
+        video_id = extract_video_id(self.url)
+        if self.info_cache is not None:
+            cached = self.info_cache.get(video_id)
+            if cached is not None:
+                self.metrics.extract_cached = True
+                self.listener.extracted(self.url, cached)
+                try:
+                    with self.metrics.phase("transfer"):
+                        return ydl.process_ie_result(cached, download=True) # 저장된 정보로 포맷 선택 및 다운로드
+                except yt_dlp.DownloadError:
+                    if self.is_interrupted:
+                        raise
+                    self.metrics.extract_cached = False
+                    self.info_cache.remove(video_id) # 만료되었거나 더 이상 유효하지 않은 URL
 
-    def stop(self):
+        with self.metrics.phase("extract"):
+            info = ydl.extract_info(self.url, download=False) # 추출만 수행 (포맷, 제목, 자막 목록)
+        if self.info_cache is not None:
+            self.info_cache.store(info.get("id") or video_id, ydl.sanitize_info(info))
+        self.listener.extracted(self.url, info)
+        with self.metrics.phase("transfer"):
+            return ydl.process_ie_result(info, download=True)
+
+    def _throttle(self, filename, downloaded_bytes):
+        """
+        지난 호출 이후 받은 바이트 수만큼 공유 대역폭 제한기의 토큰을 소비합니다.
+        토큰이 부족하면 이 워커의 다운로드 스레드가 대기하므로 수신 속도가 줄어듭니다.
+        """
+        with self._received_lock:
+            received = downloaded_bytes - self._received.get(filename, downloaded_bytes) # 이어받기 시 기존 바이트는 제외
+            self._received[filename] = downloaded_bytes
+        if received > 0:
+            self.rate_limiter.consume(
+                received, self.weight, lambda: self.is_interrupted, key=id(self) # 조각 스레드들이 같은 몫을 공유
+            )
+
+    def stop(self, delete_partial=False):
         """
-        다운로드 작업을 중단합니다. `is_interrupted` 플래그를 설정하고, progress_hook 에서 확인하여 yt-dlp 다운로드를 중단시킵니다.
+        다운로드 작업을 중단합니다. 어느 단계에서든 곧바로 중단되도록 `is_interrupted` 플래그를 설정하고 외부 프로세스를 종료합니다.
+
+        - 정보 추출, 전송: 다음 HTTP 요청 전(urlopen)과 progress_hook 에서 플래그를 확인하여 중단
+        - 대역폭 제한/후처리 슬롯 대기: 대기 중 플래그를 확인하여 중단
+        - 후처리(ffmpeg 병합 등): 실행 중인 프로세스를 종료하여 중단
+
+        Args:
+            delete_partial (bool, optional): 중단 후 임시 파일(.part, 조각, 병합 전 파일)을 삭제할지 여부.
+                Defaults to False (남겨서 다음에 이어받기).
         """
-        self.is_interrupted = True
\ No newline at end of file
+        if delete_partial:
+            self.delete_partial = True
+        self.is_interrupted = True
+        with self._processes_lock:
+            processes, self._processes = self._processes, set()
+        for process in processes:
+            self._kill(process)
+
+    def _track_process(self, process):
+        """yt-dlp 가 이 워커 스레드에서 시작한 외부 프로세스를 등록합니다. 이미 중단 요청된 경우 바로 종료합니다."""
+        with self._processes_lock:
+            self._processes = {p for p in self._processes if p.poll() is None} # 끝난 프로세스 정리
+            self._processes.add(process)
+        if self.is_interrupted:
+            self._kill(process)
+
+    @staticmethod
+    def _kill(process):
+        """외부 프로세스를 종료합니다 (이미 끝났으면 무시)."""
+        try:
+            if process.poll() is None:
+                process.kill()
+        except OSError:
+            pass
+
+    def _remove_partial_files(self):
+        """중단된 작업이 남긴 임시 파일(.part, 조각, 조각 상태 파일, 병합 전 포맷 파일, 병합 중이던 파일)을 삭제합니다."""
+        for path in self._files:
+            base, ext = os.path.splitext(path)
+            candidates = [path, path + ".part", path + ".ytdl", f"{base}.temp{ext}"] # .temp: 병합 중이던 출력 파일
+            candidates += glob.glob(glob.escape(path) + "-Frag*") # 조각 다운로드 임시 파일
+            for candidate in candidates:
+                try:
+                    os.remove(candidate)
+                except OSError:
+                    pass # 없는 파일
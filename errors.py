@@ -0,0 +1,143 @@
+import random
+import re
+import socket
+
+from startup import lazy_import
+
+
+NETWORK = "network" # 연결 실패, 타임아웃, 전송 중 끊김, 서버 오류(5xx)
+FORBIDDEN = "http_403" # HTTP 403 (만료된 스트림 URL, 일시적 차단)
+RATE_LIMITED = "http_429" # HTTP 429 (요청 과다, 잠시 후 다시 시도해야 함)
+EXTRACTOR = "extractor" # 비디오 정보 추출 실패 (비공개, 삭제, 지원하지 않는 URL 등)
+FFMPEG = "ffmpeg" # 후처리(병합, 변환) 실패
+CANCELLED = "cancelled" # 사용자 중단 (에러 아님)
+UNKNOWN = "unknown" # 분류할 수 없는 에러
+
+TRANSIENT = frozenset((NETWORK, FORBIDDEN, RATE_LIMITED)) # 잠시 후 다시 시도하면 성공할 수 있는 에러
+
+LABELS = { # 화면에 표시할 분류 이름
+    NETWORK: "네트워크",
+    FORBIDDEN: "HTTP 403",
+    RATE_LIMITED: "HTTP 429",
+    EXTRACTOR: "정보 추출",
+    FFMPEG: "ffmpeg",
+    CANCELLED: "중단",
+    UNKNOWN: "기타",
+}
+
+RETRY_BASE_DELAY = 2.0 # 첫 재시도 대기 시간(초), 재시도마다 두 배
+RATE_LIMIT_BASE_DELAY = 30.0 # HTTP 429 의 첫 재시도 대기 시간(초)
+RETRY_MAX_DELAY = 600.0 # 재시도 대기 시간 상한(초)
+
+HTTP_STATUS_REGEX = re.compile(r"HTTP Error (\d{3})") # yt-dlp 에러 메시지 안의 HTTP 상태 코드
+
+
+def classify_error(error):
+    """
+    다운로드 중 발생한 예외를 분류합니다. yt-dlp 의 DownloadError 가 감싼 원래 예외와 원인(cause) 예외까지 확인합니다.
+
+    Args:
+        error (BaseException): 워커에서 잡은 예외
+
+    Returns:
+        str: 에러 분류 (NETWORK, FORBIDDEN, RATE_LIMITED, EXTRACTOR, FFMPEG, CANCELLED, UNKNOWN)
+    """
+    yt_dlp = lazy_import("yt_dlp")
+    extractor_error = False
+    for exc in _error_chain(error):
+        if isinstance(exc, yt_dlp.utils.DownloadCancelled):
+            return CANCELLED
+        status = getattr(exc, "status", None) or getattr(exc, "code", None) # yt-dlp HTTPError, urllib HTTPError
+        if isinstance(exc, yt_dlp.networking.exceptions.HTTPError) or isinstance(status, int):
+            kind = _classify_status(status)
+            if kind is not None:
+                return kind
+        if isinstance(exc, yt_dlp.utils.PostProcessingError):
+            return FFMPEG
+        if isinstance(exc, (
+                yt_dlp.networking.exceptions.TransportError,
+                yt_dlp.utils.ContentTooShortError,
+                ConnectionError,
+                socket.timeout,
+                TimeoutError,
+        )):
+            return NETWORK
+        if isinstance(exc, yt_dlp.utils.ExtractorError):
+            extractor_error = True # 원인 예외가 네트워크 에러인지 계속 확인
+    match = HTTP_STATUS_REGEX.search(str(error)) # 원래 예외 없이 메시지만 남은 경우
+    if match:
+        kind = _classify_status(int(match.group(1)))
+        if kind is not None:
+            return kind
+    return EXTRACTOR if extractor_error else UNKNOWN
+
+
+def is_transient(kind):
+    """
+    다시 시도하면 성공할 수 있는 에러인지 여부.
+
+    Args:
+        kind (str): 에러 분류
+
+    Returns:
+        bool: 자동 재시도 대상이면 True
+    """
+    return kind in TRANSIENT
+
+
+def label(kind):
+    """
+    에러 분류의 표시 이름을 반환합니다.
+
+    Args:
+        kind (str): 에러 분류 (None 이면 UNKNOWN 으로 취급)
+
+    Returns:
+        str: 표시 이름
+    """
+    return LABELS.get(kind, LABELS[UNKNOWN])
+
+
+def retry_delay(kind, attempt):
+    """
+    재시도 전 대기 시간을 계산합니다 (exponential backoff + jitter).
+    대기 시간은 재시도마다 두 배로 늘고, 같은 시각에 실패한 작업들이 한꺼번에 다시 요청하지 않도록
+    절반은 고정, 절반은 무작위로 정합니다.
+
+    Args:
+        kind (str): 에러 분류 (RATE_LIMITED 는 더 길게 대기)
+        attempt (int): 재시도 순번 (0 부터)
+
+    Returns:
+        float: 대기 시간(초)
+    """
+    base = RATE_LIMIT_BASE_DELAY if kind == RATE_LIMITED else RETRY_BASE_DELAY
+    delay = min(RETRY_MAX_DELAY, base * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _classify_status(status):
+    """HTTP 상태 코드를 에러 분류로 바꿉니다. 해당 없으면 None."""
+    if status == 429:
+        return RATE_LIMITED
+    if status == 403:
+        return FORBIDDEN
+    if status is not None and (status >= 500 or status == 408):
+        return NETWORK
+    return None
+
+
+def _error_chain(error):
+    """예외와, 그 예외가 감싼 원래 예외(exc_info), 원인 예외(cause, __cause__, __context__)를 차례로 반환합니다."""
+    seen = set()
+    stack = [error]
+    while stack:
+        exc = stack.pop(0)
+        if exc is None or id(exc) in seen or not isinstance(exc, BaseException):
+            continue
+        seen.add(id(exc))
+        yield exc
+        exc_info = getattr(exc, "exc_info", None) # yt-dlp DownloadError: 원래 예외의 sys.exc_info()
+        if isinstance(exc_info, tuple) and len(exc_info) > 1:
+            stack.append(exc_info[1])
+        stack += [getattr(exc, "cause", None), exc.__cause__, exc.__context__]
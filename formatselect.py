@@ -0,0 +1,147 @@
+from startup import lazy_import
+
+
+class FormatSelector:
+    """
+    병합(비디오 + 오디오)이 필요한 품질 설정에서, 화질 손실이 허용 범위 안이면 병합을 줄이는 경로를 고르는 yt-dlp 포맷 선택기입니다.
+
+    먼저 원래 format string 으로 포맷을 고른 뒤 (기준), 사용 가능한 포맷을 해상도, fps, 오디오 비트레이트로
+    기준과 비교하여 다음 순서로 선택합니다.
+
+    1. 단일 파일 (SINGLE): 비디오와 오디오가 함께 들어 있는 포맷. 한 번만 받고 ffmpeg 병합이 필요 없음
+    2. 같은 컨테이너 쌍 (COMPATIBLE_PAIR): 기준 쌍의 코덱이 한 컨테이너(mp4/webm)에 들어가지 않아 mkv 로 병합될 때,
+       mp4 또는 webm 에 그대로 담을 수 있는 비디오/오디오 쌍. 병합이 스트림 복사(remux)만으로 끝나고 결과가 원래 컨테이너에 맞음
+    3. 기준 (DEFAULT): 원래 format string 의 선택
+
+    같은 해상도 안에서는 yt-dlp 의 포맷 정렬 순서(코덱, 비트레이트 선호)를 따릅니다.
+    fps, 오디오 비트레이트를 한쪽만 알 수 있으면 손실로 취급하므로, 허용 손실이 0 이면 기준과 같거나 좋다고 확인된 포맷만 고릅니다.
+    기준보다 해상도가 높은 포맷은 고르지 않으므로 품질 설정의 해상도 상한(FHD 등)을 넘지 않습니다.
+
+    Attributes:
+        DEFAULT (str): 원래 format string 의 선택을 사용함
+        SINGLE (str): 병합이 필요 없는 단일 파일 포맷을 사용함
+        COMPATIBLE_PAIR (str): 같은 컨테이너에 담을 수 있는 비디오/오디오 쌍을 사용함
+    """
+    DEFAULT = "default"
+    SINGLE = "single"
+    COMPATIBLE_PAIR = "compatible_pair"
+
+    def __init__(self, ydl, default_selector, tolerance=0.0, on_choice=None):
+        """
+        FormatSelector 초기화.
+
+        Args:
+            ydl (yt_dlp.YoutubeDL): 포맷 선택기를 만들 YoutubeDL 객체
+            default_selector (callable): 원래 format string 으로 만든 yt-dlp 포맷 선택기 (기준)
+            tolerance (float, optional): 허용할 화질 손실 비율 (0.1 이면 기준 해상도·fps·오디오 비트레이트의 90% 까지 허용).
+                Defaults to 0.0 (손실 없는 경우만).
+            on_choice (callable, optional): 선택한 경로(DEFAULT, SINGLE, COMPATIBLE_PAIR)를 받는 함수. Defaults to None.
+        """
+        self.default_selector = default_selector
+        self.tolerance = min(max(tolerance, 0.0), 1.0)
+        self.on_choice = on_choice
+        self.merge_selector = ydl.build_format_selector("bv*+ba") # 고른 두 포맷을 yt-dlp 방식 그대로 병합 정보로 묶음
+        self.get_compatible_ext = lazy_import("yt_dlp").utils.get_compatible_ext # yt-dlp 가 병합 결과 확장자를 정하는 규칙
+
+    def __call__(self, ctx):
+        """
+        yt-dlp 포맷 선택기 인터페이스. 다운로드할 포맷(병합 시 병합 정보)을 반환합니다.
+
+        Args:
+            ctx (dict): yt-dlp 가 전달하는 선택 정보 (formats: 나쁜 것부터 좋은 것 순으로 정렬된 포맷 목록 등)
+
+        Returns:
+            list[dict]: 선택한 포맷 목록
+        """
+        selected = list(self.default_selector(ctx))
+        requested = selected[0].get("requested_formats") if len(selected) == 1 else None
+        videos = [f for f in requested or () if _has_video(f)]
+        audios = [f for f in requested or () if _has_audio(f)]
+        if len(requested or ()) != 2 or len(videos) != 1 or len(audios) != 1:
+            return selected # 병합이 아닌 선택 (단일 파일, 오디오만 등): 그대로 사용
+        video, audio = videos[0], audios[0]
+        formats = ctx["formats"]
+        rank = {id(f): index for index, f in enumerate(formats)} # yt-dlp 정렬 순서 (클수록 선호)
+
+        singles = [
+            f for f in formats
+            if _has_video(f) and _has_audio(f)
+            and self._video_within(f, video) and self._audio_within(f, audio)
+        ]
+        if singles:
+            return self._choose(self.SINGLE, [max(singles, key=lambda f: (_video_score(f), rank[id(f)]))])
+
+        if selected[0].get("ext") == "mkv" and not self._fits_one_container(video, audio): # 병합 결과가 mkv 로 바뀌는 쌍
+            pairs = [
+                (v, a)
+                for v in formats if _has_video(v) and not _has_audio(v) and self._video_within(v, video)
+                for a in formats if _has_audio(a) and not _has_video(a) and self._audio_within(a, audio)
+                if self._fits_one_container(v, a)
+            ]
+            if pairs:
+                v, a = max(pairs, key=lambda pair: (
+                    _video_score(pair[0]), _audio_bitrate(pair[1]) or 0, rank[id(pair[0])], rank[id(pair[1])],
+                ))
+                merged = list(self.merge_selector(dict(ctx, formats=[v, a])))
+                if merged:
+                    return self._choose(self.COMPATIBLE_PAIR, merged)
+        return self._choose(self.DEFAULT, selected)
+
+    def _choose(self, choice, formats):
+        """선택한 경로를 on_choice 로 알리고 포맷 목록을 그대로 반환합니다."""
+        if self.on_choice is not None:
+            self.on_choice(choice)
+        return formats
+
+    def _video_within(self, candidate, target):
+        """후보 포맷의 해상도·fps 가 기준 비디오보다 높지 않고, 손실이 허용 범위 안인지 확인합니다."""
+        height, target_height = candidate.get("height") or 0, target.get("height")
+        if not target_height:
+            return False # 기준 해상도를 모르면 비교할 수 없음
+        if height > target_height:
+            return False # 품질 설정의 해상도 상한을 넘지 않도록
+        ratio = height / target_height
+        fps, target_fps = candidate.get("fps"), target.get("fps")
+        if bool(fps) != bool(target_fps):
+            return False # 한쪽만 알면 같은 fps 인지 확인할 수 없음: 손실로 취급
+        if fps and target_fps:
+            ratio *= min(1.0, fps / target_fps) # 60fps -> 30fps 는 절반의 화질로 취급
+        return ratio >= 1.0 - self.tolerance
+
+    def _audio_within(self, candidate, target):
+        """후보 포맷의 오디오 비트레이트 손실이 허용 범위 안인지 확인합니다 (어느 한쪽이라도 모르면 손실로 취급)."""
+        abr, target_abr = _audio_bitrate(candidate), _audio_bitrate(target)
+        if not abr or not target_abr:
+            return False # YouTube 의 단일 파일(18 등)은 abr 이 없는 경우가 많음: 더 나쁠 수 있으므로 고르지 않음
+        return abr >= target_abr * (1.0 - self.tolerance)
+
+    def _fits_one_container(self, video, audio):
+        """비디오와 오디오를 병합할 때 mkv 가 아닌 컨테이너(mp4/webm)에 그대로 담을 수 있는지 확인합니다."""
+        return self.get_compatible_ext(
+            vcodecs=[video.get("vcodec")], acodecs=[audio.get("acodec")],
+            vexts=[video.get("ext")], aexts=[audio.get("ext")],
+        ) != "mkv"
+
+
+def _has_video(f):
+    """비디오 스트림이 있는 포맷인지 확인합니다."""
+    return f.get("vcodec") not in (None, "none")
+
+
+def _has_audio(f):
+    """오디오 스트림이 있는 포맷인지 확인합니다."""
+    return f.get("acodec") not in (None, "none")
+
+
+def _audio_bitrate(f):
+    """오디오 비트레이트 (kbps). abr 이 없으면 오디오만 있는 포맷의 전체 비트레이트(tbr)를 사용하고, 모르면 None."""
+    if f.get("abr"):
+        return f["abr"]
+    if not _has_video(f):
+        return f.get("tbr") # 오디오만 있으면 전체 비트레이트가 곧 오디오 비트레이트
+    return None # 비디오가 함께 있는 포맷의 tbr 은 오디오 비트레이트로 쓸 수 없음
+
+
+def _video_score(f):
+    """같은 허용 범위 안의 후보끼리 비교하는 화질 점수 (해상도, fps)."""
+    return (f.get("height") or 0, f.get("fps") or 0)
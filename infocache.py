@@ -0,0 +1,123 @@
+import gzip
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+
+class InfoCache:
+    """
+    yt-dlp `extract_info` 결과(포맷 목록, 제목, 자막 목록 등)를 비디오 ID 별로 저장하는 디스크 캐시입니다.
+
+    재시도, 재개, 품질 변경 시 추출 과정(웹 페이지/플레이어 요청)을 건너뛰고 저장된 정보로 바로 다운로드합니다.
+    스트림 URL 에는 만료 시각(`expire=`)이 들어 있으므로, 각 항목은 TTL 과 가장 이른 URL 만료 시각 중
+    먼저 오는 시각에 만료됩니다. 여러 워커 스레드에서 동시에 사용하므로 파일은 원자적으로 교체합니다.
+    """
+    DEFAULT_TTL = 6 * 60 * 60 # 기본 유효 시간 (초, YouTube 스트림 URL 유효 시간과 비슷하게)
+    EXPIRE_MARGIN = 10 * 60 # URL 만료 전 여유 시간 (초, 다운로드 도중 만료되지 않도록)
+    DEFAULT_DIRNAME = "info_cache" # 어플리케이션 데이터 폴더 내 기본 캐시 디렉토리 이름
+    EXTENSION = ".json.gz"
+    VIDEO_ID_REGEX = re.compile(r"[\w-]+") # 파일 이름으로 사용할 수 있는 비디오 ID 형식
+
+    def __init__(self, directory, ttl=DEFAULT_TTL):
+        """
+        InfoCache 초기화. 캐시 디렉토리를 만들고 만료된 항목을 정리합니다.
+
+        Args:
+            directory (str): 캐시 디렉토리
+            ttl (int, optional): 항목 유효 시간 (초). Defaults to DEFAULT_TTL.
+        """
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(self.directory, exist_ok=True)
+        self.prune()
+
+    def get(self, video_id):
+        """
+        저장된 비디오 정보를 반환합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+
+        Returns:
+            dict: yt-dlp 비디오 정보 (sanitize 된 dict). 없거나 만료되었으면 None
+        """
+        path = self._path(video_id)
+        if path is None:
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("expires_at", 0) <= time.time():
+            self.remove(video_id) # 만료된 항목
+            return None
+        return entry.get("info")
+
+    def store(self, video_id, info):
+        """
+        비디오 정보를 저장합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+            info (dict): JSON 으로 저장 가능한 yt-dlp 비디오 정보 (`YoutubeDL.sanitize_info()` 결과)
+        """
+        path = self._path(video_id)
+        if path is None:
+            return
+        entry = {"expires_at": self._expires_at(info), "info": info}
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(temp_path, path) # 원자적 교체 (읽는 쪽이 중간 상태를 보지 않도록)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error caching video info for {video_id}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def remove(self, video_id):
+        """
+        저장된 비디오 정보를 삭제합니다 (URL 이 더 이상 유효하지 않은 경우 등).
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+        """
+        path = self._path(video_id)
+        if path is None:
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def prune(self):
+        """TTL 이 지난 항목 파일을 삭제합니다. (URL 만료 시각은 읽을 때 확인)"""
+        deadline = time.time() - self.ttl
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.stat().st_mtime < deadline:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+
+    def _expires_at(self, info):
+        """TTL 과 포맷 URL 의 가장 이른 만료 시각(`expire=`) 중 먼저 오는 시각."""
+        expires_at = time.time() + self.ttl
+        for video_format in info.get("formats") or []:
+            expire = parse_qs(urlparse(video_format.get("url") or "").query).get("expire")
+            if expire and expire[0].isdigit():
+                expires_at = min(expires_at, int(expire[0]) - self.EXPIRE_MARGIN)
+        return expires_at
+
+    def _path(self, video_id):
+        """비디오 ID 에 해당하는 캐시 파일 경로. 파일 이름으로 쓸 수 없는 ID 이면 None."""
+        if not video_id or not self.VIDEO_ID_REGEX.fullmatch(video_id):
+            return None
+        return os.path.join(self.directory, video_id + self.EXTENSION)
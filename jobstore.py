@@ -0,0 +1,144 @@
+import os
+import sqlite3
+import threading
+import time
+
+
+class JobStore:
+    """
+    끝나지 않은 다운로드 작업(대기 중, 실행 중)을 기록하는 SQLite 기반 작업 대기열 저장소입니다.
+
+    작업이 추가되거나 상태가 바뀔 때마다 한 행씩 바로 기록하므로, 어플리케이션이 비정상 종료되어도
+    마지막 상태가 남아 있습니다. 다음 실행 시 `load()` 로 읽어 작업을 다시 대기열에 넣으면,
+    yt-dlp 가 남아 있는 `.part` 파일에서 이어서 다운로드합니다.
+    여러 워커 스레드에서 동시에 사용하므로 하나의 연결을 lock 으로 보호합니다.
+    """
+    DEFAULT_FILENAME = "jobs.sqlite3"
+
+    def __init__(self, path):
+        """
+        JobStore 초기화. 데이터베이스 파일과 테이블이 없으면 생성합니다.
+
+        Args:
+            path (str): SQLite 데이터베이스 파일 경로
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock() # 연결 보호 lock (thread-safe)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL") # 쓰기 중에도 읽기 가능
+            self.connection.execute("PRAGMA synchronous=NORMAL") # WAL 모드에서는 프로세스 비정상 종료에도 안전
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    key INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT NOT NULL,
+                    download_path TEXT,
+                    quality TEXT,
+                    download_subtitles INTEGER,
+                    concurrent_fragments INTEGER,
+                    weight REAL,
+                    priority INTEGER,
+                    state TEXT,
+                    partial_path TEXT,
+                    added_at REAL
+                )
+                """
+            )
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(jobs)")]
+            if "priority" not in columns: # 우선순위 컬럼이 없던 이전 버전 데이터베이스
+                self.connection.execute("ALTER TABLE jobs ADD COLUMN priority INTEGER")
+
+    def add(self, job):
+        """
+        새 작업을 기록합니다.
+
+        Args:
+            job (DownloadJob): 기록할 작업
+
+        Returns:
+            int: 저장소 내 작업 키 (이후 update/remove 에 사용)
+        """
+        with self.lock, self.connection:
+            return self._insert(job)
+
+    def add_many(self, jobs):
+        """
+        여러 작업을 하나의 트랜잭션으로 기록합니다.
+
+        Args:
+            jobs (list[DownloadJob]): 기록할 작업 목록
+
+        Returns:
+            list[int]: 작업별 저장소 키 (jobs 와 같은 순서)
+        """
+        keys = []
+        with self.lock, self.connection:
+            for job in jobs:
+                keys.append(self._insert(job))
+        return keys
+
+    def update(self, key, **fields):
+        """
+        작업의 상태나 임시 파일 경로 등을 갱신합니다.
+
+        Args:
+            key (int): 작업 키
+            **fields: 갱신할 컬럼 값 (state, partial_path, priority 등)
+        """
+        if not fields:
+            return
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self.lock, self.connection:
+            self.connection.execute(
+                f"UPDATE jobs SET {columns} WHERE key = ?", (*fields.values(), key)
+            )
+
+    def remove(self, key):
+        """
+        끝난 작업(완료, 실패, 취소)을 삭제합니다.
+
+        Args:
+            key (int): 작업 키
+        """
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM jobs WHERE key = ?", (key,))
+
+    def load(self):
+        """
+        저장된 작업 목록을 반환합니다. 중단 당시 실행 중이던 작업(임시 파일이 있는 작업)이 먼저 오고,
+        나머지는 추가된 순서대로 정렬됩니다.
+
+        Returns:
+            list[dict]: 작업 기록 목록 (key, url, download_path, quality, download_subtitles,
+                concurrent_fragments, weight, priority, state, partial_path, added_at)
+        """
+        with self.lock:
+            cursor = self.connection.execute(
+                "SELECT * FROM jobs ORDER BY partial_path IS NULL, key"
+            )
+            rows = cursor.fetchall()
+            columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self.lock:
+            self.connection.close()
+
+    def _insert(self, job):
+        """작업 한 건을 INSERT 하고 키를 반환합니다 (lock 보유, 트랜잭션 안에서 호출)."""
+        cursor = self.connection.execute(
+            "INSERT INTO jobs (url, download_path, quality, download_subtitles,"
+            " concurrent_fragments, weight, priority, state, partial_path, added_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                job.url, job.download_path, job.quality, int(job.download_subtitles),
+                job.concurrent_fragments, job.weight, job.priority, job.state,
+                job.partial_path, time.time(),
+            ),
+        )
+        return cursor.lastrowid
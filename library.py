@@ -0,0 +1,135 @@
+import os
+import re
+import sqlite3
+import threading
+
+
+class LibraryIndex:
+    """
+    다운로드 폴더에 이미 있는 파일을 비디오 ID 별로 기록하는 SQLite 기반 라이브러리 인덱스입니다.
+
+    다운로드 파일 이름에는 `제목 [비디오 ID].확장자` 형식으로 비디오 ID 가 들어가므로, 파일 이름만으로 인덱스를 만듭니다.
+    폴더의 수정 시각(파일 추가/삭제/이름 변경 시 바뀜)을 함께 기록하여, 바뀐 폴더만 다시 읽고
+    추가/삭제된 파일만 반영합니다. 네트워크 요청 없이 이미 받은 비디오를 건너뛸 수 있습니다.
+    여러 워커 스레드에서 동시에 사용하므로 하나의 연결을 lock 으로 보호합니다.
+    """
+    DEFAULT_FILENAME = "library.sqlite3"
+    FILENAME_REGEX = re.compile(r"\[([\w-]{11})\]\.(\w+)$") # 완성된 파일 이름 (.part, 자막, 포맷별 임시 파일 제외)
+
+    def __init__(self, path):
+        """
+        LibraryIndex 초기화. 데이터베이스 파일과 테이블이 없으면 생성합니다.
+
+        Args:
+            path (str): SQLite 데이터베이스 파일 경로
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock() # 연결 보호 lock (thread-safe)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL") # 쓰기 중에도 읽기 가능
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS directories (path TEXT PRIMARY KEY, mtime INTEGER) WITHOUT ROWID"
+            )
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    directory TEXT NOT NULL,
+                    video_id TEXT NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS files_by_video ON files (directory, video_id)"
+            )
+
+    def find(self, directory, video_id):
+        """
+        폴더에 비디오 ID 에 해당하는 파일이 있는지 찾습니다. 폴더가 바뀌었으면 먼저 인덱스를 갱신합니다.
+
+        Args:
+            directory (str): 다운로드 폴더 경로
+            video_id (str): YouTube 비디오 ID
+
+        Returns:
+            str: 파일 경로. 없으면 None
+        """
+        directory = os.path.abspath(directory)
+        self.refresh(directory)
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT path FROM files WHERE directory = ? AND video_id = ?", (directory, video_id)
+            ).fetchall()
+        for (path,) in rows:
+            if os.path.exists(path): # 인덱스 갱신 이후 삭제된 경우 대비
+                return path
+        return None
+
+    def refresh(self, directory):
+        """
+        폴더의 수정 시각이 바뀌었으면 파일 목록을 다시 읽어 추가/삭제된 파일만 인덱스에 반영합니다.
+
+        Args:
+            directory (str): 다운로드 폴더 경로
+        """
+        directory = os.path.abspath(directory)
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return # 폴더 없음
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT mtime FROM directories WHERE path = ?", (directory,)
+            ).fetchone()
+            if row is not None and row[0] == mtime:
+                return # 바뀌지 않은 폴더
+
+            current = {}
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        match = self.FILENAME_REGEX.search(entry.name)
+                        if match and entry.is_file():
+                            current[entry.path] = match.group(1)
+            except OSError:
+                return
+            indexed = {
+                path for (path,) in self.connection.execute(
+                    "SELECT path FROM files WHERE directory = ?", (directory,)
+                )
+            }
+            with self.connection:
+                self.connection.executemany(
+                    "DELETE FROM files WHERE path = ?", [(path,) for path in indexed - current.keys()]
+                )
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                    [(path, directory, current[path]) for path in current.keys() - indexed],
+                )
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO directories VALUES (?, ?)", (directory, mtime)
+                )
+
+    def add(self, filepath, video_id):
+        """
+        다운로드가 끝난 파일을 인덱스에 바로 추가합니다.
+
+        Args:
+            filepath (str): 파일 경로
+            video_id (str): YouTube 비디오 ID
+        """
+        filepath = os.path.abspath(filepath)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                (filepath, os.path.dirname(filepath), video_id),
+            )
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self.lock:
+            self.connection.close()
@@ -1,12 +1,16 @@
+import startup # 가장 먼저 import (시작 시간 측정 기준 시각)
+
 import shutil
 import sys
 
-from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtCore import QCoreApplication, QTimer
 from PyQt5.QtWidgets import QApplication, QMessageBox
 
 from config import Config
 from ui.main_window import MainWindow
 
+startup.mark("모듈 import")
+
 
 def check_ffmpeg():
     """
@@ -26,10 +30,12 @@ def main():
     - QSettings organization/application name 설정
     - FFmpeg 존재 여부 확인 및 에러 메시지 표시 (미설치 시)
     - Config, MainWindow 객체 생성 및 실행
+    - TUBEDOWN_STARTUP_TIMING=1 환경 변수가 있으면 시작 단계별 소요 시간을 stderr 로 출력
     """
     app = QApplication(sys.argv)
     QCoreApplication.setOrganizationName("MyCompany") # QSettings organization name 설정
     QCoreApplication.setApplicationName("YouTubeDownloader") # QSettings application name 설정
+    startup.mark("QApplication 생성")
 
     if not check_ffmpeg(): # FFmpeg 설치 여부 확인
         QMessageBox.critical(
@@ -41,10 +47,14 @@ def main():
 
     config = Config() # Config 객체 생성 (설정 관리)
     window = MainWindow(config, app.clipboard()) # MainWindow 객체 생성 (UI, 기능 통합)
+    startup.mark("MainWindow 생성")
     window.show() # 메인 윈도우 표시
+    QTimer.singleShot(0, lambda: startup.mark("창 표시 (첫 이벤트 루프)"))
 
     sys.exit(app.exec_()) # 어플리케이션 이벤트 루프 실행 (GUI 시작)
 
 
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False): # 실행 파일로 패키징한 경우 프로세스 모드의 자식 프로세스 시작 지원
+        startup.lazy_import("multiprocessing").freeze_support()
     main() # main 함수 호출 (어플리케이션 시작)
\ No newline at end of file
@@ -0,0 +1,1079 @@
+import heapq
+import itertools
+import os
+import threading
+import time
+
+import errors
+from adaptive import AdaptiveConcurrency
+from downloader import DownloadWorker, WorkerListener
+from playlist import iter_playlist_entries
+from progress import ProgressAggregator
+from ratelimit import SlotLimiter, TokenBucket
+from sessionpool import SessionPool
+from startup import lazy_import
+from utils import extract_video_id, scan_playlist_urls, scan_youtube_urls
+
+
+class DownloadJob:
+    """
+    DownloadManager 가 관리하는 다운로드 작업 하나를 나타내는 클래스입니다.
+
+    Attributes:
+        QUEUED, RUNNING, PAUSED, COMPLETED, FAILED, CANCELLED (str): 작업 상태 값
+        PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW (int): 우선순위 값 (클수록 먼저 실행)
+    """
+    QUEUED = "queued"
+    RUNNING = "running"
+    PAUSED = "paused"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    PRIORITY_HIGH = 1
+    PRIORITY_NORMAL = 0
+    PRIORITY_LOW = -1
+
+    def __init__(
+            self, job_id, url, download_path, quality, download_subtitles,
+            concurrent_fragments=1, weight=1.0, priority=PRIORITY_NORMAL,
+    ):
+        """
+        DownloadJob 초기화.
+
+        Args:
+            job_id (int): 작업 ID (DownloadManager 내에서 고유)
+            url (str): 다운로드할 YouTube URL
+            download_path (str): 다운로드 경로
+            quality (str): 비디오 품질 설정
+            download_subtitles (bool): 자막 다운로드 여부
+            concurrent_fragments (int, optional): DASH/HLS 조각 동시 다운로드 수. Defaults to 1.
+            weight (float, optional): 대역폭 분배 가중치. Defaults to 1.0.
+            priority (int, optional): 우선순위 (클수록 먼저 실행). Defaults to PRIORITY_NORMAL.
+        """
+        self.job_id = job_id
+        self.url = url
+        self.download_path = download_path
+        self.quality = quality
+        self.download_subtitles = download_subtitles
+        self.concurrent_fragments = concurrent_fragments
+        self.weight = weight
+        self.priority = priority
+        self.video_id = extract_video_id(url) # 비디오 ID (아카이브 기록 및 중복 확인용)
+        self.state = self.QUEUED # 초기 상태: 대기 중
+        self.title = None # 완료 후 비디오 제목
+        self.filepath = None # 완료 후 저장된 파일 경로
+        self.error = None # 실패 시 에러 메시지
+        self.error_kind = None # 실패 시 에러 분류 (errors.NETWORK, RATE_LIMITED, EXTRACTOR, FFMPEG 등)
+        self.retries = 0 # 일시적인 에러로 자동 재시도한 횟수
+        self.retry_delay = None # 재시도 대기 중일 때 대기 시간(초)
+        self.worker = None # 실행 중인 DownloadWorker
+        self.partial_path = None # 받는 중인 임시 파일 (.part) 경로
+        self.store_key = None # 작업 대기열 저장소(JobStore) 내 키
+        self.interrupt_state = None # 실행 중 중단 요청 후 돌아갈 상태 (PAUSED: 일시정지, QUEUED: 선점)
+        self.metrics = None # 마지막 실행의 성능 지표 (JobMetrics.to_dict() 결과)
+
+    @property
+    def is_done(self):
+        """작업이 끝났는지 (완료, 실패 또는 취소) 여부."""
+        return self.state in (self.COMPLETED, self.FAILED, self.CANCELLED)
+
+
+class ManagerListener:
+    """
+    DownloadManager 의 작업 이벤트를 전달받는 인터페이스입니다.
+
+    이벤트는 작업을 실행하는 워커 스레드에서 호출되므로, GUI 에서 사용할 때는
+    Qt 시그널 등을 통해 메인 스레드로 전달해야 합니다.
+    청크 단위 진행률은 이벤트로 전달하지 않으며, `DownloadManager.progress` 에서 주기적으로 읽어갑니다.
+    """
+    def job_added(self, job):
+        """작업이 대기열에 추가되었을 때 호출됩니다."""
+
+    def job_started(self, job):
+        """작업이 실행되기 시작했을 때 호출됩니다."""
+
+    def job_finished(self, job):
+        """작업이 완료되었을 때 호출됩니다."""
+
+    def job_failed(self, job):
+        """작업이 실패했을 때 호출됩니다. 에러 메시지는 `job.error` 에 저장됩니다."""
+
+    def job_info(self, job):
+        """다운로드 전에 비디오 정보를 가져왔을 때 호출됩니다. 제목은 `job.title` 에 저장됩니다."""
+
+    def job_postprocessing(self, job):
+        """작업의 전송이 끝나고 후처리(ffmpeg 병합 등) 단계로 넘어갔을 때 호출됩니다."""
+
+    def job_paused(self, job):
+        """작업이 일시정지되었을 때 호출됩니다."""
+
+    def job_queued(self, job):
+        """일시정지했거나 선점된 작업이 다시 대기열에 들어갔을 때 호출됩니다."""
+
+    def job_cancelled(self, job):
+        """작업이 `cancel()` 로 취소되었을 때 호출됩니다 (실행 중이던 작업은 중단이 끝난 뒤)."""
+
+    def job_retrying(self, job):
+        """
+        일시적인 에러(네트워크, HTTP 403/429)로 실패한 작업이 잠시 후 다시 시도하도록 예약되었을 때 호출됩니다.
+        에러는 `job.error`, `job.error_kind`, 대기 시간은 `job.retry_delay`, 재시도 횟수는 `job.retries` 에 저장됩니다.
+        대기 시간이 지나 대기열에 다시 들어가면 `job_queued` 가 호출됩니다.
+        """
+
+    def concurrency_changed(self, concurrency):
+        """동시 다운로드 수가 바뀌었을 때 호출됩니다 (설정 변경 또는 자동 조절)."""
+
+    def playlist_expanded(self, url, count):
+        """재생목록/채널 펼치기가 끝났을 때 호출됩니다. count 는 새로 추가된 작업 수입니다."""
+
+    def playlist_failed(self, url, message, kind):
+        """재생목록/채널 목록을 가져오지 못했을 때 호출됩니다. kind 는 에러 분류입니다 (errors.NETWORK 등)."""
+
+
+class _JobReporter(WorkerListener):
+    """DownloadWorker 이벤트를 DownloadJob 상태에 반영하고 ManagerListener 로 전달하는 어댑터."""
+
+    def __init__(self, manager, job):
+        self.manager = manager
+        self.job = job
+
+    def progress(self, url, downloaded_bytes, total_bytes):
+        self.manager.progress.update(self.job.job_id, downloaded_bytes, total_bytes) # 공유 상태에 기록만 함
+
+    def started(self, url):
+        self.manager.progress.set_percent(self.job.job_id, 0.0)
+
+    def extracted(self, url, info):
+        self.job.title = info.get("title")
+        self.manager._notify("job_info", self.job)
+
+    def destination(self, url, filename):
+        self.job.partial_path = filename
+        self.manager._persist(self.job, partial_path=filename) # 재시작 시 이어받을 임시 파일 기록
+
+    def postprocessing(self, url):
+        self.manager._start_postprocessing(self.job)
+
+    def finished(self, url, info):
+        self.manager.progress.set_percent(self.job.job_id, 100.0)
+        self.job.title = info.get("title")
+        requested = info.get("requested_downloads") or [{}]
+        self.job.filepath = requested[0].get("filepath") # 병합까지 끝난 최종 파일 경로
+        self.job.video_id = info.get("id") or self.job.video_id
+        if self.manager.library is not None and self.job.filepath and self.job.video_id:
+            self.manager.library.add(self.job.filepath, self.job.video_id) # 라이브러리 인덱스에 바로 반영
+        if self.manager.archive is not None and self.job.video_id:
+            filesize = None
+            if self.job.filepath and os.path.exists(self.job.filepath):
+                filesize = os.path.getsize(self.job.filepath)
+            self.manager.archive.add( # 다운로드 아카이브에 기록 (재시작 후에도 중복 다운로드 방지)
+                self.job.video_id,
+                title=self.job.title,
+                video_format=info.get("format"),
+                filepath=self.job.filepath,
+                filesize=filesize,
+            )
+        self.job.error = self.job.error_kind = None # 재시도 끝에 성공한 경우
+        self.manager._rate_limit_strikes = 0
+        self.job.state = DownloadJob.COMPLETED
+        self.manager._notify("job_finished", self.job)
+
+    def metrics(self, url, metrics):
+        self.job.metrics = metrics # 실행이 끝나면 DownloadManager 가 기록
+
+    def error(self, url, message, kind):
+        if self.manager._suspended or self.job.interrupt_state: # 종료/일시정지/선점으로 중단됨 (실패 아님)
+            self.job.state = self.job.interrupt_state or DownloadJob.QUEUED
+            return
+        self.job.error = message
+        self.job.error_kind = kind
+        if self.manager.autotuner is not None:
+            self.manager.autotuner.record_error(kind) # 혼잡 신호: 동시 다운로드 수 자동 조절에 반영
+        self.job.retry_delay = self.manager._next_retry_delay(self.job)
+        if self.job.retry_delay is not None: # 일시적인 에러: 대기 후 재시도 (_run_job 에서 예약)
+            self.job.state = DownloadJob.QUEUED
+            return
+        self.job.state = DownloadJob.FAILED
+        self.manager._notify("job_failed", self.job)
+
+
+class DownloadManager:
+    """
+    GUI 에 의존하지 않는 다운로드 스케줄러입니다.
+
+    작업을 우선순위 대기열(heap)에 보관하고, 동시 다운로드 수(concurrency) 만큼 스레드를 띄워 실행합니다.
+    같은 우선순위에서는 먼저 추가된 작업이 먼저 실행되며, 작업별로 우선순위 변경, 맨 앞으로 이동,
+    일시정지/재개를 할 수 있습니다. 동시 다운로드 수는 실행 중에도 변경할 수 있으며, 줄어든 경우
+    우선순위가 낮은 실행 중 작업을 중단하고 대기열 맨 앞에 다시 넣습니다 (`.part` 파일에서 이어받음).
+    전송이 끝난 작업의 후처리(ffmpeg 병합 등)는 다운로드 슬롯을 반납한 뒤 별도 한도(postprocess_concurrency,
+    기본값 CPU 코어 수) 안에서 실행되므로, 병합하는 동안에도 다음 작업이 바로 전송을 시작합니다.
+    일시적인 에러(네트워크, HTTP 403/429)로 실패한 작업은 대기 시간을 두 배씩 늘려 가며(jitter 포함) 최대 max_retries 번
+    자동으로 다시 시도합니다. HTTP 429 를 받으면 대기 시간 동안 새 작업도 시작하지 않아, 대량 작업이 한꺼번에 다시 요청하지 않습니다.
+    auto_concurrency_max 를 지정하면 측정한 처리량과 에러율로 동시 다운로드 수를 그 범위 안에서 자동 조절합니다 (AdaptiveConcurrency).
+    작업 대기열 저장소(JobStore)를 지정하면 끝나지 않은 작업을 디스크에 기록하여, 종료나 비정상 종료 후
+    `restore()` 로 다시 대기열에 넣을 수 있습니다.
+    MainWindow 와 CLI(cli.py) 가 공통으로 사용합니다.
+    """
+    def __init__(
+            self, concurrency, listener=None, archive=None, bandwidth_limit=0, store=None, info_cache=None,
+            process_pool=None, library=None, metrics=None, postprocess_concurrency=None, max_retries=3,
+            auto_concurrency_max=0, reuse_sessions=True, format_tolerance=0.0,
+    ):
+        """
+        DownloadManager 초기화.
+
+        Args:
+            concurrency (int): 동시 다운로드 수
+            listener (ManagerListener, optional): 작업 이벤트 수신 객체. Defaults to None.
+            archive (DownloadArchive, optional): 완료된 다운로드를 기록할 아카이브. Defaults to None.
+            bandwidth_limit (int, optional): 전체 다운로드 대역폭 제한 (바이트/초, 0 이면 무제한). Defaults to 0.
+            store (JobStore, optional): 끝나지 않은 작업을 기록할 작업 대기열 저장소. Defaults to None.
+            info_cache (InfoCache, optional): 워커가 공유하는 비디오 정보 디스크 캐시. Defaults to None.
+            process_pool (ProcessPool, optional): 지정하면 작업을 자식 프로세스에서 실행. Defaults to None (스레드에서 실행).
+            library (LibraryIndex, optional): 다운로드 폴더 인덱스. 이미 있는 비디오는 받지 않고 완료 처리. Defaults to None.
+            metrics (MetricsRecorder, optional): 작업 실행별 성능 지표 기록기. Defaults to None.
+            postprocess_concurrency (int, optional): 후처리(ffmpeg 병합 등) 동시 실행 수. Defaults to None (CPU 코어 수).
+            max_retries (int, optional): 일시적인 에러로 실패한 작업의 최대 자동 재시도 횟수 (0 이면 재시도 안 함). Defaults to 3.
+            auto_concurrency_max (int, optional): 동시 다운로드 수 자동 조절 상한 (0 이면 자동 조절 안 함,
+                concurrency 를 시작 값으로 사용). Defaults to 0.
+            reuse_sessions (bool, optional): 작업이 끝난 yt-dlp 세션(연결, 쿠키, 플레이어 캐시)을 다음 작업에 재사용할지 여부.
+                프로세스 모드에서는 자식 프로세스마다 따로 재사용합니다. Defaults to True.
+            format_tolerance (float, optional): 병합(비디오 + 오디오) 대신 단일 파일 등을 고를 때 허용할 화질 손실 비율
+                (0.1 이면 해상도·fps·오디오 비트레이트의 90% 까지). Defaults to 0.0 (손실 없는 경우만).
+        """
+        self.concurrency = max(1, concurrency)
+        self.listeners = [listener] if listener else []
+        self.archive = archive
+        self.store = store
+        self.info_cache = info_cache
+        self.process_pool = process_pool
+        self.library = library
+        self.metrics = metrics
+        self.max_retries = max_retries
+        self.format_tolerance = format_tolerance
+        self.rate_limiter = TokenBucket(bandwidth_limit) # 모든 워커가 공유하는 대역폭 제한기
+        self.postprocess_slots = SlotLimiter( # 모든 워커가 공유하는 후처리 동시 실행 수 제한기
+            postprocess_concurrency or os.cpu_count() or 1
+        )
+        self.session_pool = SessionPool() if reuse_sessions else None # 스레드 모드 워커가 빌려 쓰는 yt-dlp 세션 풀
+        self.autotuner = None # 동시 다운로드 수 자동 조절기 (자동 조절을 켰을 때 생성)
+        if auto_concurrency_max:
+            self.autotuner = AdaptiveConcurrency(self, auto_concurrency_max)
+        if process_pool is not None:
+            self._configure_pool(process_pool)
+        self.jobs = {} # 전체 작업 목록 (job_id: DownloadJob)
+        self.progress = ProgressAggregator() # 작업별 최신 진행 상황 (워커가 기록, UI 가 주기적으로 읽음)
+        self._pending = [] # 실행 대기 중인 작업 우선순위 대기열 (heap: (-priority, 순번, job_id))
+        self._sequence = itertools.count() # 같은 우선순위 내 추가 순서
+        self._front_sequence = itertools.count(-1, -1) # 맨 앞으로 이동한 작업의 순번 (항상 기존 작업보다 앞)
+        self._running = set() # 실행 중인 (다운로드 슬롯을 쓰는) 작업 ID 목록
+        self._postprocessing = set() # 다운로드 슬롯을 반납하고 후처리 중인 작업 ID 목록
+        self._retrying = set() # 재시도 대기 중인 작업 ID 목록 (대기 시간이 지나면 대기열로)
+        self._hold_until = 0.0 # HTTP 429 이후 새 작업 시작을 미루는 시각 (time.monotonic 기준)
+        self._hold_timer = None # 대기가 끝나면 _dispatch 를 호출하는 타이머
+        self._rate_limit_strikes = 0 # 연속으로 받은 HTTP 429 횟수 (성공하면 초기화, 새 작업 시작 대기 시간 계산용)
+        self._active_video_ids = {} # 대기 중/실행 중인 작업의 비디오 ID 인덱스 (video_id: job_id)
+        self._expansions = set() # 진행 중인 재생목록 펼치기의 중단 이벤트 목록
+        self._job_ids = itertools.count(1) # 작업 ID 생성기
+        self._condition = threading.Condition() # 대기열/실행 목록 보호 및 완료 대기용
+        self._suspended = False # shutdown() 호출 여부 (이후 중단된 작업은 저장소에 남김)
+        if self.autotuner is not None:
+            self.autotuner.start()
+
+    def add_listener(self, listener):
+        """작업 이벤트 수신 객체를 추가합니다."""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """작업 이벤트 수신 객체를 제거합니다. 다른 스레드가 이벤트를 전달하는 중일 수 있으므로 새 목록으로 바꿉니다."""
+        self.listeners = [registered for registered in self.listeners if registered is not listener]
+
+    def submit(
+            self, url, download_path, quality, download_subtitles,
+            concurrent_fragments=1, weight=1.0, priority=DownloadJob.PRIORITY_NORMAL,
+    ):
+        """
+        새로운 다운로드 작업을 대기열에 추가하고, 실행 가능한 슬롯이 있으면 바로 시작합니다.
+
+        Args:
+            url (str): 다운로드할 YouTube URL
+            download_path (str): 다운로드 경로
+            quality (str): 비디오 품질 설정
+            download_subtitles (bool): 자막 다운로드 여부
+            concurrent_fragments (int, optional): DASH/HLS 조각 동시 다운로드 수. Defaults to 1.
+            weight (float, optional): 대역폭 분배 가중치. Defaults to 1.0.
+            priority (int, optional): 우선순위 (클수록 먼저 실행). Defaults to DownloadJob.PRIORITY_NORMAL.
+
+        Returns:
+            DownloadJob: 생성된 작업 객체
+        """
+        job = DownloadJob(
+            next(self._job_ids), url, download_path, quality, download_subtitles,
+            concurrent_fragments=concurrent_fragments, weight=weight, priority=priority,
+        )
+        if self.store is not None:
+            job.store_key = self.store.add(job) # 시작 전에 기록 (비정상 종료 시에도 유지)
+        self._enqueue([job])
+        return job
+
+    def submit_batch(
+            self, urls, download_path, quality, download_subtitles,
+            concurrent_fragments=1, priority=DownloadJob.PRIORITY_NORMAL,
+    ):
+        """
+        여러 URL 을 한 번에 대기열에 추가합니다. 저장소 기록은 하나의 트랜잭션으로, 대기열 추가는 한 번의 lock 으로 처리합니다.
+
+        Args:
+            urls (list[str]): 다운로드할 YouTube URL 목록
+            download_path (str): 다운로드 경로
+            quality (str): 비디오 품질 설정
+            download_subtitles (bool): 자막 다운로드 여부
+            concurrent_fragments (int, optional): DASH/HLS 조각 동시 다운로드 수. Defaults to 1.
+            priority (int, optional): 우선순위 (클수록 먼저 실행). Defaults to DownloadJob.PRIORITY_NORMAL.
+
+        Returns:
+            list[DownloadJob]: 생성된 작업 목록
+        """
+        jobs = [
+            DownloadJob(
+                next(self._job_ids), url, download_path, quality, download_subtitles,
+                concurrent_fragments=concurrent_fragments, priority=priority,
+            )
+            for url in urls
+        ]
+        if self.store is not None and jobs:
+            for job, key in zip(jobs, self.store.add_many(jobs)):
+                job.store_key = key
+        self._enqueue(jobs)
+        return jobs
+
+    def submit_text(
+            self, text, download_path, quality, download_subtitles,
+            concurrent_fragments=1, priority=DownloadJob.PRIORITY_NORMAL, expand_playlists=False,
+    ):
+        """
+        텍스트 안의 모든 YouTube URL 을 찾아 새 비디오만 한 번에 대기열에 추가합니다 (클립보드, 로컬 API, 감시 폴더 공용).
+        비디오 ID 기준으로 중복을 제거하고, 아카이브에 있거나 진행 중인 비디오는 건너뜁니다.
+
+        Args:
+            text (str): URL 이 들어 있는 텍스트 (한 줄에 하나씩이거나 다른 내용과 섞여 있어도 됨)
+            download_path (str): 다운로드 경로
+            quality (str): 비디오 품질 설정
+            download_subtitles (bool): 자막 다운로드 여부
+            concurrent_fragments (int, optional): DASH/HLS 조각 동시 다운로드 수. Defaults to 1.
+            priority (int, optional): 우선순위 (클수록 먼저 실행). Defaults to DownloadJob.PRIORITY_NORMAL.
+            expand_playlists (bool, optional): 재생목록/채널 URL 도 펼쳐서 추가할지 여부. Defaults to False.
+
+        Returns:
+            tuple[list[DownloadJob], list[str], int]: (추가된 작업 목록, 펼치기 시작한 재생목록/채널 URL 목록, 건너뛴 비디오 수)
+        """
+        playlists = scan_playlist_urls(text) if expand_playlists else []
+        for url in playlists:
+            self.submit_playlist(url, download_path, quality, download_subtitles, concurrent_fragments)
+        found = scan_youtube_urls(text) # (비디오 ID, 정규화된 URL) 목록, 중복 제거됨
+        archived = set()
+        if self.archive is not None and found:
+            archived = self.archive.contains_many(video_id for video_id, _ in found) # 아카이브 일괄 조회
+        urls = [ # 중복 다운로드 방지 (이미 다운로드했거나 진행 중인 비디오 제외)
+            url for video_id, url in found
+            if video_id not in archived and not self.is_active(video_id)
+        ]
+        jobs = self.submit_batch(
+            urls, download_path, quality, download_subtitles,
+            concurrent_fragments=concurrent_fragments, priority=priority,
+        ) if urls else []
+        return jobs, playlists, len(found) - len(urls)
+
+    def restore(self):
+        """
+        작업 대기열 저장소에 남아 있는 (이전 실행에서 끝나지 않은) 작업을 다시 대기열에 추가합니다.
+        중단 당시 실행 중이던 작업이 먼저 시작되며, 남아 있는 `.part` 파일에서 이어서 다운로드합니다.
+        그 사이 아카이브에 기록되었거나 이미 진행 중인 비디오는 저장소에서 삭제합니다.
+
+        Returns:
+            list[DownloadJob]: 다시 추가된 작업 목록
+        """
+        if self.store is None:
+            return []
+        restored = []
+        restored_ids = set() # 저장소 안의 중복 비디오 확인용
+        for record in self.store.load():
+            job = DownloadJob(
+                next(self._job_ids),
+                record["url"],
+                record["download_path"],
+                record["quality"],
+                bool(record["download_subtitles"]),
+                concurrent_fragments=record["concurrent_fragments"] or 1,
+                weight=record["weight"] or 1.0,
+                priority=record["priority"] or DownloadJob.PRIORITY_NORMAL,
+            )
+            if record["state"] == DownloadJob.PAUSED:
+                job.state = DownloadJob.PAUSED # 일시정지한 작업은 재개할 때까지 대기열에 넣지 않음
+            job.store_key = record["key"]
+            job.partial_path = record["partial_path"]
+            if job.video_id and (
+                (self.archive is not None and job.video_id in self.archive)
+                or job.video_id in restored_ids
+                or self.is_active(job.video_id)
+            ):
+                self.store.remove(job.store_key) # 이미 다운로드했거나 중복된 작업
+                continue
+            if job.video_id:
+                restored_ids.add(job.video_id)
+            restored.append(job)
+        self._enqueue(restored)
+        return restored
+
+    def submit_playlist(
+            self, url, download_path, quality, download_subtitles, concurrent_fragments=1,
+    ):
+        """
+        재생목록 또는 채널 URL을 백그라운드 스레드에서 펼쳐, 각 비디오를 개별 작업으로 대기열에 추가합니다.
+
+        목록을 받는 대로 작업을 추가하므로, 뒤쪽 페이지를 받는 동안 앞쪽 비디오의 다운로드가 먼저 시작됩니다.
+        여러 재생목록을 동시에 펼칠 수 있으며, 아카이브에 있거나 진행 중인 비디오는 건너뜁니다.
+
+        Args:
+            url (str): 재생목록 또는 채널 URL
+            download_path (str): 다운로드 경로
+            quality (str): 비디오 품질 설정
+            download_subtitles (bool): 자막 다운로드 여부
+            concurrent_fragments (int, optional): DASH/HLS 조각 동시 다운로드 수. Defaults to 1.
+        """
+        stop_event = threading.Event()
+        with self._condition:
+            self._expansions.add(stop_event)
+        thread = threading.Thread(
+            target=self._expand_playlist,
+            args=(url, download_path, quality, download_subtitles, concurrent_fragments, stop_event),
+            name="playlist-expand",
+            daemon=True,
+        )
+        thread.start()
+
+    def set_concurrency(self, concurrency, preempt=True):
+        """
+        동시 다운로드 수를 변경합니다. 늘어난 경우 대기 중인 작업을 즉시 시작하고,
+        줄어든 경우 우선순위가 낮고 늦게 추가된 실행 중 작업부터 중단하여 대기열 맨 앞에 다시 넣습니다.
+
+        Args:
+            concurrency (int): 새 동시 다운로드 수
+            preempt (bool, optional): 줄어든 경우 실행 중인 작업을 중단할지 여부. False 면 끝날 때까지 두고
+                새 작업 시작만 제한합니다 (자동 조절 시). Defaults to True.
+        """
+        with self._condition:
+            previous = self.concurrency
+            self.concurrency = max(1, concurrency)
+            if self.process_pool is not None:
+                self._configure_pool(self.process_pool) # 프로세스 풀의 작업 슬롯 수로 제한
+            changed = self.concurrency != previous
+            running = [] if not preempt else [
+                self.jobs[job_id] for job_id in self._running
+                if self.jobs[job_id].interrupt_state is None and self.jobs[job_id].worker
+            ]
+            excess = len(running) - self.concurrency
+            if excess > 0:
+                running.sort(key=lambda job: (job.priority, -job.job_id))
+                for job in running[:excess]:
+                    job.interrupt_state = DownloadJob.QUEUED # 선점: 끝나면 대기열 맨 앞으로
+                    job.worker.stop()
+        if changed:
+            for listener in self.listeners:
+                listener.concurrency_changed(self.concurrency)
+        self._dispatch()
+
+    def set_auto_concurrency(self, maximum):
+        """
+        동시 다운로드 수 자동 조절을 켜거나 끕니다. 켜면 현재 동시 다운로드 수에서 시작하여 1 ~ maximum 범위에서 조절합니다.
+        끄면 마지막으로 조절된 값이 유지되므로, 필요하면 `set_concurrency()` 로 고정 값을 다시 지정합니다.
+
+        Args:
+            maximum (int): 동시 다운로드 수 상한 (0 이면 자동 조절 끔)
+        """
+        with self._condition:
+            if self.autotuner is not None:
+                self.autotuner.stop()
+                self.autotuner = None
+            if maximum:
+                self.autotuner = AdaptiveConcurrency(self, maximum)
+                self.autotuner.start()
+            if self.process_pool is not None:
+                self._configure_pool(self.process_pool)
+
+    def set_priority(self, job_id, priority):
+        """
+        작업의 우선순위를 변경합니다. 대기 중인 작업은 즉시 새 순서로 재배치됩니다.
+
+        Args:
+            job_id (int): 작업 ID
+            priority (int): 새 우선순위 (DownloadJob.PRIORITY_HIGH/NORMAL/LOW, 클수록 먼저 실행)
+        """
+        with self._condition:
+            job = self.jobs[job_id]
+            job.priority = priority
+            if self._remove_pending(job):
+                self._push_pending(job)
+        self._persist(job, priority=priority)
+
+    def move_to_front(self, job_id):
+        """
+        대기 중인 작업을 대기열 맨 앞으로 옮깁니다. 다음 실행 슬롯이 비면 가장 먼저 시작됩니다.
+
+        Args:
+            job_id (int): 작업 ID
+
+        Returns:
+            bool: 옮겼으면 True, 대기 중인 작업이 아니면 False
+        """
+        with self._condition:
+            job = self.jobs[job_id]
+            if not self._remove_pending(job):
+                return False
+            if self._pending:
+                job.priority = max(job.priority, -self._pending[0][0]) # 가장 높은 우선순위로 올림
+            self._push_pending(job, front=True)
+        self._persist(job, priority=job.priority)
+        return True
+
+    def pause(self, job_id):
+        """
+        작업을 일시정지합니다. 대기 중인 작업은 대기열에서 빠지고, 실행 중인 작업은 중단됩니다
+        (받던 `.part` 파일은 남아 재개 시 이어서 받습니다). 일시정지되면 `job_paused` 이벤트가 발생합니다.
+
+        Args:
+            job_id (int): 작업 ID
+
+        Returns:
+            bool: 일시정지 요청이 받아들여졌으면 True
+        """
+        with self._condition:
+            job = self.jobs[job_id]
+            if job.state == DownloadJob.RUNNING and job.worker:
+                job.interrupt_state = DownloadJob.PAUSED # 워커가 끝나면 _run_job 에서 일시정지 처리
+                job.worker.stop()
+                return True
+            if job.state != DownloadJob.QUEUED:
+                return False
+            self._remove_pending(job)
+            self._retrying.discard(job.job_id) # 재시도 대기 중이던 작업
+            job.retry_delay = None
+            job.state = DownloadJob.PAUSED
+        self._persist(job, state=DownloadJob.PAUSED)
+        self._notify("job_paused", job)
+        return True
+
+    def resume(self, job_id):
+        """
+        일시정지한 작업을 다시 대기열에 넣습니다. 실행 슬롯이 비어 있으면 바로 시작합니다.
+
+        Args:
+            job_id (int): 작업 ID
+
+        Returns:
+            bool: 재개했으면 True, 일시정지한 작업이 아니면 False
+        """
+        with self._condition:
+            job = self.jobs[job_id]
+            if job.state != DownloadJob.PAUSED:
+                return False
+            job.state = DownloadJob.QUEUED
+            if not self._suspended:
+                self._push_pending(job)
+        self._persist(job, state=DownloadJob.QUEUED)
+        self._notify("job_queued", job)
+        self._dispatch()
+        return True
+
+    def cancel(self, job_id, delete_partial=False):
+        """
+        작업을 취소합니다. 대기 중이거나 일시정지한 작업은 바로 취소되고, 실행 중인 작업은 어느 단계에 있든
+        (정보 추출, 전송, 후처리 대기, ffmpeg 병합) 곧바로 중단됩니다. 취소되면 `job_cancelled` 이벤트가 발생합니다.
+
+        Args:
+            job_id (int): 작업 ID
+            delete_partial (bool, optional): 받던 임시 파일(.part, 조각, 병합 전 파일)을 삭제할지 여부. Defaults to False.
+
+        Returns:
+            bool: 취소 요청이 받아들여졌으면 True, 이미 끝난 작업이면 False
+        """
+        with self._condition:
+            job = self.jobs[job_id]
+            if job.is_done:
+                return False
+            if job.state == DownloadJob.RUNNING and job.worker:
+                job.interrupt_state = DownloadJob.CANCELLED # 워커가 끝나면 _run_job 에서 취소 처리
+                job.worker.stop(delete_partial=delete_partial)
+                return True
+            self._remove_pending(job)
+            self._retrying.discard(job.job_id)
+            job.state = DownloadJob.CANCELLED
+            self._release_video_id(job)
+            self._condition.notify_all()
+        if delete_partial and job.partial_path:
+            self._remove_file(job.partial_path) # 일시정지/선점으로 남아 있던 임시 파일
+        self._forget(job)
+        self._notify("job_cancelled", job)
+        return True
+
+    def set_process_pool(self, process_pool):
+        """
+        작업 실행 방식을 변경합니다. 실행 중인 작업은 기존 방식으로 계속 실행되고, 새로 시작하는 작업부터 적용됩니다.
+
+        Args:
+            process_pool (ProcessPool): 작업을 실행할 프로세스 풀 (None 이면 스레드에서 실행)
+        """
+        with self._condition:
+            previous = self.concurrency
+            if process_pool is not None:
+                self._configure_pool(process_pool)
+            self.process_pool = process_pool
+            changed = self.concurrency != previous
+        if changed:
+            for listener in self.listeners:
+                listener.concurrency_changed(self.concurrency)
+
+    def set_bandwidth_limit(self, bandwidth_limit):
+        """
+        전체 다운로드 대역폭 제한을 변경합니다. 실행 중인 작업에도 즉시 적용됩니다.
+
+        Args:
+            bandwidth_limit (int): 초당 허용 바이트 수 (0 이면 무제한)
+        """
+        self.rate_limiter.set_rate(bandwidth_limit)
+
+    def set_postprocess_concurrency(self, concurrency):
+        """
+        후처리(ffmpeg 병합 등) 동시 실행 수를 변경합니다. 늘어난 경우 후처리를 기다리던 작업이 바로 시작합니다.
+
+        Args:
+            concurrency (int): 새 후처리 동시 실행 수
+        """
+        with self._condition:
+            self.postprocess_slots.set_limit(concurrency)
+            if self.process_pool is not None:
+                self._configure_pool(self.process_pool)
+
+    def set_max_retries(self, max_retries):
+        """
+        일시적인 에러로 실패한 작업의 최대 자동 재시도 횟수를 변경합니다. 다음 실패부터 적용됩니다.
+
+        Args:
+            max_retries (int): 최대 재시도 횟수 (0 이면 재시도 안 함)
+        """
+        self.max_retries = max_retries
+
+    def set_format_tolerance(self, tolerance):
+        """
+        포맷 선택 시 허용할 화질 손실 비율을 변경합니다. 새로 시작하는 작업부터 적용됩니다.
+
+        Args:
+            tolerance (float): 허용할 화질 손실 비율 (0 이면 손실 없는 경우만 병합 생략)
+        """
+        self.format_tolerance = tolerance
+
+    def set_weight(self, job_id, weight):
+        """
+        작업의 대역폭 분배 가중치를 변경합니다. 실행 중인 작업에도 즉시 적용됩니다.
+
+        Args:
+            job_id (int): 작업 ID
+            weight (float): 대역폭 분배 가중치 (기본 1.0, 클수록 더 많은 대역폭)
+        """
+        with self._condition:
+            job = self.jobs[job_id]
+            job.weight = weight
+            if job.worker:
+                job.worker.weight = weight
+
+    def is_saturated(self):
+        """
+        모든 다운로드 슬롯이 차 있고 기다리는 작업이 있는지 여부. 동시 다운로드 수를 늘리면 바로 효과가 있는 상태입니다.
+
+        Returns:
+            bool: 대기 중인 작업이 있고 실행 중인 작업 수가 동시 다운로드 수 이상이면 True
+        """
+        with self._condition:
+            return bool(self._pending) and len(self._running) >= self.concurrency
+
+    def is_active(self, video_id):
+        """
+        같은 비디오 ID 의 작업이 대기 중이거나 실행 중인지 확인합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+
+        Returns:
+            bool: 진행 중인 작업이 있으면 True
+        """
+        with self._condition:
+            return video_id in self._active_video_ids
+
+    def active_jobs(self):
+        """
+        아직 끝나지 않은 (대기 중, 재시도 대기 중 또는 실행 중) 작업 목록을 반환합니다.
+
+        Returns:
+            list[DownloadJob]: 진행 중인 작업 목록
+        """
+        with self._condition:
+            return [job for job in self.jobs.values() if not job.is_done]
+
+    def wait(self, timeout=None):
+        """
+        대기 중이거나 (재시도 대기 포함) 실행 중인 모든 작업이 끝날 때까지 기다립니다.
+
+        Args:
+            timeout (float, optional): 최대 대기 시간(초). Defaults to None (무제한).
+
+        Returns:
+            bool: 모든 작업이 끝났으면 True, 시간 초과 시 False
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: (
+                    not self._pending and not self._retrying and not self._running
+                    and not self._postprocessing and not self._expansions
+                ),
+                timeout,
+            )
+
+    def stop_all(self):
+        """대기 중인 작업을 모두 취소하고, 실행 중인 작업을 중단하여 취소합니다."""
+        with self._condition:
+            for stop_event in self._expansions:
+                stop_event.set() # 진행 중인 재생목록 펼치기 중단
+            cancelled = [self.jobs[entry[2]] for entry in self._pending]
+            cancelled += [self.jobs[job_id] for job_id in self._retrying]
+            cancelled += [job for job in self.jobs.values() if job.state == DownloadJob.PAUSED]
+            for job in cancelled:
+                job.state = DownloadJob.CANCELLED # 시작되지 않은 작업은 취소 처리
+                self._release_video_id(job)
+            self._pending.clear()
+            self._retrying.clear()
+            self._stop_running(DownloadJob.CANCELLED)
+            self._condition.notify_all()
+        for job in cancelled:
+            self._forget(job)
+
+    def shutdown(self, timeout=None):
+        """
+        어플리케이션 종료 시 호출합니다. 실행 중인 작업에 중단을 요청하고 끝날 때까지 기다립니다.
+        대기 중이거나 중단된 작업은 작업 대기열 저장소에 남아, 다음 실행 시 `restore()` 로 이어서 받을 수 있습니다.
+
+        중단은 모든 단계에서 곧바로 반영되지만, 응답 없는 서버에서 읽는 중인 작업은 소켓 타임아웃까지 걸릴 수 있습니다.
+        timeout 이 지나면 남은 작업을 기다리지 않고, 이후 닫힐 저장소(작업 대기열, 아카이브, 라이브러리 인덱스, 지표)를
+        매니저에서 분리하여 남은 워커가 기록하지 않도록 합니다. 이 작업들은 저장소에 실행 중으로 남아 다음 실행 시 이어받습니다.
+
+        Args:
+            timeout (float, optional): 최대 대기 시간(초). Defaults to None (무제한).
+
+        Returns:
+            bool: 모든 작업이 끝났으면 True, 시간 초과 시 False
+        """
+        with self._condition:
+            self._suspended = True
+            if self.autotuner is not None:
+                self.autotuner.stop()
+            for stop_event in self._expansions:
+                stop_event.set() # 진행 중인 재생목록 펼치기 중단
+            self._pending.clear() # 대기 중인 작업은 저장소에만 남김
+            self._retrying.clear() # 재시도 대기 중인 작업도 대기 중으로 저장소에 남음
+            self._stop_running()
+            self._condition.notify_all()
+        finished = self.wait(timeout)
+        if self.session_pool is not None:
+            self.session_pool.clear() # 유휴 세션의 연결 정리
+        if not finished:
+            with self._condition: # 남은 워커(데몬 스레드)는 프로세스 종료와 함께 사라짐
+                self.store = self.archive = self.library = self.metrics = None
+        return finished
+
+    def _stop_running(self, interrupt_state=None):
+        """
+        실행 중인 (후처리 중 포함) 모든 작업에 중단을 요청합니다 (lock 보유 상태에서 호출).
+
+        Args:
+            interrupt_state (str, optional): 중단 후 작업 상태 (CANCELLED). Defaults to None (종료 시 중단: 저장소에 남김).
+        """
+        for job_id in self._running | self._postprocessing:
+            job = self.jobs[job_id]
+            if job.worker:
+                if interrupt_state is not None:
+                    job.interrupt_state = interrupt_state
+                job.worker.stop()
+
+    def _configure_pool(self, process_pool):
+        """
+        프로세스 풀의 후처리 한도를 맞추고, 후처리 중인 작업이 자식 프로세스를 차지해도 다운로드 슬롯이 모두
+        실행될 수 있도록 프로세스 수를 늘립니다 (lock 보유 상태에서 호출).
+        자동 조절 중이면 조절할 때마다 풀을 다시 만들지 않도록 상한 기준으로 한 번에 늘립니다.
+        동시 다운로드 수와 자동 조절 상한은 풀의 작업 슬롯 수(max_slots)를 넘지 않도록 줄입니다.
+        """
+        self.concurrency = min(self.concurrency, process_pool.max_slots)
+        if self.autotuner is not None:
+            self.autotuner.maximum = min(self.autotuner.maximum, process_pool.max_slots)
+        process_pool.postprocess_slots.set_limit(self.postprocess_slots.limit)
+        concurrency = max(self.concurrency, self.autotuner.maximum if self.autotuner is not None else 0)
+        process_pool.resize(concurrency + self.postprocess_slots.limit)
+
+    def _start_postprocessing(self, job):
+        """작업이 후처리 단계로 넘어갈 때 호출됩니다. 다운로드 슬롯을 반납하고 대기 중인 작업을 시작합니다."""
+        with self._condition:
+            if job.job_id not in self._running:
+                return # 이미 후처리 중 (여러 번 호출된 경우)
+            self._running.discard(job.job_id)
+            self._postprocessing.add(job.job_id)
+        self._notify("job_postprocessing", job)
+        self._dispatch()
+
+    def _enqueue(self, jobs):
+        """작업들을 한 번에 대기열에 추가하고, 실행 가능한 슬롯이 있으면 바로 시작합니다."""
+        with self._condition:
+            for job in jobs:
+                self.jobs[job.job_id] = job
+            if self._suspended:
+                return # 종료 중: 저장소에만 남기고 다음 실행 시 시작
+            for job in jobs:
+                if job.state == DownloadJob.QUEUED:
+                    self._push_pending(job)
+                if job.video_id:
+                    self._active_video_ids[job.video_id] = job.job_id
+        for job in jobs:
+            self._notify("job_added", job)
+        self._dispatch()
+
+    def _push_pending(self, job, front=False):
+        """작업을 우선순위 대기열에 넣습니다 (lock 보유 상태에서 호출)."""
+        sequence = next(self._front_sequence) if front else next(self._sequence)
+        heapq.heappush(self._pending, (-job.priority, sequence, job.job_id))
+
+    def _remove_pending(self, job):
+        """
+        작업을 우선순위 대기열에서 꺼냅니다 (lock 보유 상태에서 호출). 사용자 조작 시에만 호출되므로 O(n) 재구성.
+
+        Returns:
+            bool: 대기열에 있었으면 True
+        """
+        remaining = [entry for entry in self._pending if entry[2] != job.job_id]
+        if len(remaining) == len(self._pending):
+            return False
+        heapq.heapify(remaining)
+        self._pending = remaining
+        return True
+
+    def _dispatch(self):
+        """
+        실행 슬롯에 여유가 있는 만큼 우선순위가 높은 작업부터 스레드로 시작합니다.
+        HTTP 429 이후 대기 중이면 시작하지 않고, 대기가 끝나면 다시 호출되도록 타이머를 예약합니다.
+        """
+        with self._condition:
+            if self._pending and time.monotonic() < self._hold_until and not self._suspended:
+                if self._hold_timer is None:
+                    self._hold_timer = threading.Timer(self._hold_until - time.monotonic(), self._end_hold)
+                    self._hold_timer.daemon = True
+                    self._hold_timer.start()
+                return
+            while self._pending and len(self._running) < self.concurrency and not self._suspended:
+                if (self.process_pool is not None
+                        and len(self._running) + len(self._postprocessing) >= self.process_pool.max_slots):
+                    break # 후처리 중인 작업도 풀의 작업 슬롯을 차지: 빈 슬롯을 기다리며 멈추지 않도록 대기열에 둠
+                job = self.jobs[heapq.heappop(self._pending)[2]]
+                job.state = DownloadJob.RUNNING
+                job.worker = self._create_worker(job)
+                self._running.add(job.job_id)
+                thread = threading.Thread(
+                    target=self._run_job, args=(job,), name=f"download-{job.job_id}", daemon=True
+                )
+                thread.start()
+
+    def _create_worker(self, job):
+        """작업을 실행할 워커를 생성합니다. 프로세스 풀이 있으면 자식 프로세스 워커 (lock 보유 상태에서 호출)."""
+        if self.process_pool is not None:
+            return lazy_import("procpool").ProcessWorker( # 프로세스 모드를 켠 경우에만 import (multiprocessing 등)
+                self.process_pool,
+                url=job.url,
+                download_path=job.download_path,
+                quality=job.quality,
+                listener=_JobReporter(self, job),
+                download_subtitles=job.download_subtitles,
+                rate_limit=int(self.rate_limiter.rate * job.weight / self.concurrency), # 프로세스 간 공유 불가: 작업별 몫
+                weight=job.weight,
+                concurrent_fragments=job.concurrent_fragments,
+                info_cache=self.info_cache,
+                reuse_session=self.session_pool is not None, # 세션은 자식 프로세스마다 따로 재사용
+                format_tolerance=self.format_tolerance,
+            )
+        return DownloadWorker(
+            url=job.url,
+            download_path=job.download_path,
+            quality=job.quality,
+            listener=_JobReporter(self, job),
+            download_subtitles=job.download_subtitles,
+            rate_limiter=self.rate_limiter,
+            weight=job.weight,
+            concurrent_fragments=job.concurrent_fragments,
+            info_cache=self.info_cache,
+            postprocess_slots=self.postprocess_slots,
+            session_pool=self.session_pool,
+            format_tolerance=self.format_tolerance,
+        )
+
+    def _run_job(self, job):
+        """워커 스레드 본체. 작업을 실행하고, 끝나면 다음 작업을 배치합니다."""
+        self._persist(job, state=DownloadJob.RUNNING)
+        try:
+            existing = None
+            if self.library is not None and job.video_id:
+                existing = self.library.find(job.download_path, job.video_id) # 네트워크 요청 없이 확인
+            if existing:
+                job.worker.listener.finished(job.url, { # 다운로드 폴더에 이미 있는 비디오: 완료 처리
+                    "id": job.video_id,
+                    "title": os.path.basename(existing).rsplit(" [", 1)[0],
+                    "requested_downloads": [{"filepath": existing}],
+                })
+            else:
+                self._notify("job_started", job)
+                job.worker.run()
+        finally:
+            if self.autotuner is not None and job.metrics is not None:
+                self.autotuner.record_retries(job.metrics.get("retries")) # yt-dlp 내부 재시도도 혼잡 신호
+            if self.metrics is not None and job.metrics is not None:
+                self.metrics.record(job, job.metrics) # 최종 상태와 함께 실행 지표 기록
+                job.metrics = None
+            if job.is_done:
+                self._forget(job) # 완료, 실패한 작업은 저장소에서 삭제
+            else:
+                self._persist(job, state=job.state) # 종료/일시정지/선점으로 중단됨: 나중에 이어받기
+            with self._condition:
+                self._running.discard(job.job_id)
+                self._postprocessing.discard(job.job_id)
+                job.worker = None
+                interrupt_state, job.interrupt_state = job.interrupt_state, None
+                if job.is_done:
+                    self._release_video_id(job) # 일시정지/선점된 작업은 계속 진행 중인 비디오로 취급
+                requeued = (
+                    interrupt_state == DownloadJob.QUEUED
+                    and job.state == DownloadJob.QUEUED
+                    and not self._suspended
+                )
+                if requeued:
+                    self._push_pending(job, front=True) # 선점된 작업은 슬롯이 생기면 가장 먼저 재개
+                retrying = (
+                    job.retry_delay is not None
+                    and job.state == DownloadJob.QUEUED
+                    and not requeued
+                    and not self._suspended
+                )
+                if retrying:
+                    job.retries += 1
+                    self._retrying.add(job.job_id)
+                    timer = threading.Timer(job.retry_delay, self._retry, args=(job,))
+                    timer.daemon = True
+                    timer.start()
+                self._condition.notify_all()
+            if retrying:
+                self._notify("job_retrying", job)
+            elif job.state == DownloadJob.PAUSED:
+                self._notify("job_paused", job)
+            elif job.state == DownloadJob.CANCELLED and interrupt_state == DownloadJob.CANCELLED:
+                self._notify("job_cancelled", job)
+            elif requeued:
+                self._notify("job_queued", job)
+            self._dispatch()
+
+    def _expand_playlist(
+            self, url, download_path, quality, download_subtitles, concurrent_fragments, stop_event,
+    ):
+        """재생목록 펼치기 스레드 본체. 목록 항목을 받는 대로 작업을 추가합니다."""
+        count = 0
+        try:
+            for video_id, video_url in iter_playlist_entries(url):
+                if stop_event.is_set():
+                    break # stop_all() 로 중단 요청됨
+                if self.archive is not None and video_id in self.archive:
+                    continue # 이미 다운로드한 비디오
+                if self.is_active(video_id):
+                    continue # 이미 대기 중이거나 실행 중인 비디오
+                self.submit(
+                    video_url, download_path, quality, download_subtitles,
+                    concurrent_fragments=concurrent_fragments,
+                )
+                count += 1
+        except Exception as e: # 목록 추출 실패 (yt-dlp DownloadError, 네트워크 에러 등)
+            for listener in self.listeners:
+                listener.playlist_failed(url, f"재생목록 가져오기 오류: {url} - {e}", errors.classify_error(e))
+        else:
+            for listener in self.listeners:
+                listener.playlist_expanded(url, count)
+        finally:
+            with self._condition:
+                self._expansions.discard(stop_event)
+                self._condition.notify_all()
+
+    def _next_retry_delay(self, job):
+        """
+        실패한 작업의 재시도 대기 시간을 계산합니다. HTTP 429 면 같은 시간 동안 새 작업 시작도 미룹니다.
+
+        Args:
+            job (DownloadJob): error_kind 가 설정된 실패한 작업
+
+        Returns:
+            float: 대기 시간(초). 재시도하지 않으면 (일시적이지 않은 에러, 재시도 횟수 초과) None
+        """
+        if not errors.is_transient(job.error_kind) or job.retries >= self.max_retries:
+            return None
+        delay = errors.retry_delay(job.error_kind, job.retries)
+        if job.error_kind == errors.RATE_LIMITED:
+            with self._condition:
+                self._rate_limit_strikes += 1
+                delay = max(delay, errors.retry_delay(job.error_kind, self._rate_limit_strikes - 1)) # 계속 거부되면 더 오래 대기
+                self._hold_until = max(self._hold_until, time.monotonic() + delay)
+        return delay
+
+    def _retry(self, job):
+        """재시도 타이머 본체. 대기 시간이 지난 작업을 대기열 맨 앞에 다시 넣습니다 (그 사이 취소/일시정지/종료되었으면 무시)."""
+        with self._condition:
+            if job.job_id not in self._retrying:
+                return
+            self._retrying.discard(job.job_id)
+            job.retry_delay = None
+            self._push_pending(job, front=True)
+        self._notify("job_queued", job)
+        self._dispatch()
+
+    def _end_hold(self):
+        """HTTP 429 대기 타이머 본체. 대기가 끝났으면 대기 중인 작업을 시작합니다 (그 사이 늘어났으면 다시 예약)."""
+        with self._condition:
+            self._hold_timer = None
+        self._dispatch()
+
+    def _release_video_id(self, job):
+        """끝난 작업의 비디오 ID 를 진행 중 인덱스에서 제거합니다 (lock 보유 상태에서 호출)."""
+        if self._active_video_ids.get(job.video_id) == job.job_id:
+            del self._active_video_ids[job.video_id]
+
+    @staticmethod
+    def _remove_file(path):
+        """파일을 삭제합니다 (없으면 무시)."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _persist(self, job, **fields):
+        """작업 대기열 저장소의 작업 기록을 갱신합니다."""
+        if self.store is not None and job.store_key is not None:
+            self.store.update(job.store_key, **fields)
+
+    def _forget(self, job):
+        """끝난 작업을 작업 대기열 저장소에서 삭제합니다."""
+        if self.store is not None and job.store_key is not None:
+            self.store.remove(job.store_key)
+            job.store_key = None
+
+    def _notify(self, event, job):
+        """등록된 모든 listener 의 `event` 메서드를 호출합니다."""
+        for listener in self.listeners:
+            getattr(listener, event)(job)
@@ -0,0 +1,369 @@
+import functools
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from startup import lazy_import
+
+
+class JobMetrics:
+    """
+    다운로드 작업 한 번의 단계별 성능 지표를 모으는 클래스입니다 (워커 쪽에서 사용).
+
+    yt-dlp 세션 준비, 정보 추출, 네트워크 전송, 후처리 슬롯 대기, 후처리(ffmpeg 병합 등), 자막 받기 단계의 소요 시간과
+    전송 바이트 수, 평균/최고 속도, 재시도 횟수, 첫 바이트까지 걸린 시간, 조각 수를 기록합니다.
+    조각 동시 다운로드 시 progress hook 이 여러 스레드에서 호출되므로 lock 으로 보호합니다.
+
+    Attributes:
+        PHASES (tuple): 시간을 기록하는 단계 이름
+    """
+    PHASES = ("setup", "extract", "transfer", "postprocess_wait", "postprocess", "subtitles")
+
+    def __init__(self):
+        """JobMetrics 초기화. 생성 시각을 작업 시작 시각으로 사용합니다."""
+        self.lock = threading.Lock() # 상태 보호 lock (thread-safe)
+        self.started_at = time.time() # 작업 시작 시각 (epoch)
+        self.start = time.monotonic()
+        self.phase_seconds = dict.fromkeys(self.PHASES, 0.0) # 단계별 소요 시간 (초)
+        self.current_phase = "transfer" # progress hook 에서 받은 바이트를 어느 단계로 기록할지
+        self.extract_cached = False # 정보 추출을 캐시로 건너뛰었는지 여부
+        self.session_reused = False # 세션 풀의 yt-dlp 세션을 재사용했는지 여부 (준비 시간 생략)
+        self.format_choice = None # FormatSelector 가 고른 경로 (single: 병합 생략 등, 병합하지 않는 품질은 None)
+        self.bytes = {"transfer": 0, "subtitles": 0} # 단계별 이번 실행에서 받은 바이트 수
+        self.peak_speed = 0.0 # 최고 속도 (바이트/초)
+        self.retries = 0 # 재시도 횟수 (HTTP 요청, 조각)
+        self.ttfb = None # 작업 시작부터 첫 바이트까지 걸린 시간 (초)
+        self.fragments = {} # 파일별 조각 수 (filename: fragment_count)
+        self._received = {} # 파일별 마지막으로 받은 바이트 수
+
+    @contextmanager
+    def phase(self, name):
+        """
+        블록 실행 시간을 단계 시간에 더합니다. 블록 안에서 받은 바이트는 해당 단계로 기록됩니다.
+
+        Args:
+            name (str): 단계 이름 (PHASES 중 하나)
+        """
+        previous, self.current_phase = self.current_phase, name
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            with self.lock:
+                self.phase_seconds[name] += elapsed
+            self.current_phase = previous
+
+    def on_progress(self, d):
+        """
+        yt-dlp progress hook 의 진행 정보를 기록합니다. 청크마다 호출되므로 가볍게 처리합니다.
+
+        Args:
+            d (dict): yt-dlp progress hook 인자 (status, filename, downloaded_bytes, speed, fragment_count 등)
+        """
+        filename = d.get("filename")
+        downloaded = d.get("downloaded_bytes") or 0
+        speed = d.get("speed")
+        with self.lock:
+            previous = self._received.get(filename, 0)
+            if downloaded > previous:
+                self.bytes[self.current_phase] = self.bytes.get(self.current_phase, 0) + downloaded - previous
+                self._received[filename] = downloaded
+            if self.ttfb is None and downloaded and self.current_phase == "transfer":
+                self.ttfb = time.monotonic() - self.start
+            if speed and speed > self.peak_speed:
+                self.peak_speed = speed
+            if d.get("fragment_count"):
+                self.fragments[filename] = d["fragment_count"]
+
+    def add_retry(self):
+        """재시도 횟수를 하나 늘립니다."""
+        with self.lock:
+            self.retries += 1
+
+    def add_resumed(self, nbytes):
+        """
+        이어받기로 건너뛴 바이트 수를 전송 바이트에서 뺍니다 (진행 이벤트의 바이트 수에는 기존 바이트가 포함됨).
+
+        Args:
+            nbytes (int): 남아 있던 `.part` 파일의 바이트 수
+        """
+        with self.lock:
+            self.bytes[self.current_phase] -= nbytes
+
+    def to_dict(self):
+        """
+        지금까지 기록한 지표를 JSON 으로 저장 가능한 dict 로 반환합니다.
+        전송 시간은 다운로드 단계 전체 시간에서 후처리 (슬롯 대기 포함) 와 자막 시간을 뺀 값입니다.
+
+        Returns:
+            dict: 단계별 시간(초), 바이트 수, 평균/최고 속도, 재시도 횟수, ttfb, 조각 수, 캐시/세션 재사용 여부, 포맷 선택 경로
+        """
+        with self.lock:
+            nested = sum(self.phase_seconds[name] for name in ("postprocess_wait", "postprocess", "subtitles"))
+            transfer = max(0.0, self.phase_seconds["transfer"] - nested) # 다운로드 단계 안에서 중첩 실행된 단계 제외
+            return {
+                "started_at": self.started_at,
+                "total_seconds": time.monotonic() - self.start,
+                "setup_seconds": self.phase_seconds["setup"],
+                "session_reused": self.session_reused,
+                "extract_seconds": self.phase_seconds["extract"],
+                "extract_cached": self.extract_cached,
+                "transfer_seconds": transfer,
+                "postprocess_wait_seconds": self.phase_seconds["postprocess_wait"],
+                "postprocess_seconds": self.phase_seconds["postprocess"],
+                "subtitles_seconds": self.phase_seconds["subtitles"],
+                "bytes": self.bytes["transfer"],
+                "subtitle_bytes": self.bytes["subtitles"],
+                "average_speed": self.bytes["transfer"] / transfer if transfer > 0 else None,
+                "peak_speed": self.peak_speed or None,
+                "retries": self.retries,
+                "ttfb_seconds": self.ttfb,
+                "fragments": sum(self.fragments.values()),
+                "format_choice": self.format_choice,
+            }
+
+
+class RetryCountingLogger:
+    """
+    yt-dlp `logger` 옵션으로 전달하는 logger 입니다. 재시도 메시지를 세고 이어받기 위치를 JobMetrics 에 기록합니다.
+
+    logger 를 지정하면 yt-dlp 는 quiet 여부와 관계없이 화면 메시지를 `debug()` 로 보내므로 재시도 메시지를 받을 수 있습니다.
+    에러 메시지는 logger 가 없을 때와 같이 stderr 로 출력합니다.
+    """
+    RETRY_REGEX = re.compile(r"Retrying\b.*\(\d+/(?:\d+|inf)\)") # 예: "... Retrying fragment 3 (1/10)..."
+    RESUME_REGEX = re.compile(r"Resuming download at byte (\d+)")
+
+    def __init__(self, metrics):
+        """
+        RetryCountingLogger 초기화.
+
+        Args:
+            metrics (JobMetrics): 재시도 횟수를 기록할 지표 객체
+        """
+        self.metrics = metrics
+
+    def debug(self, message):
+        if self.RETRY_REGEX.search(message):
+            self.metrics.add_retry()
+            return
+        match = self.RESUME_REGEX.search(message)
+        if match:
+            self.metrics.add_resumed(int(match.group(1)))
+
+    def info(self, message):
+        pass
+
+    def warning(self, message):
+        self.debug(message)
+
+    def error(self, message):
+        print(message, file=sys.stderr)
+
+
+class MetricsRecorder:
+    """
+    끝난 작업(완료, 실패, 취소, 일시정지/선점으로 중단된 실행)의 지표를 JSON lines 파일에 한 줄씩 기록하고,
+    Prometheus 텍스트 형식으로 내보낼 누적 값을 유지합니다. 여러 워커 스레드에서 호출되므로 lock 으로 보호합니다.
+
+    Attributes:
+        DEFAULT_FILENAME (str): 어플리케이션 데이터 폴더 내 기본 로그 파일 이름
+        TTFB_BUCKETS (tuple): 첫 바이트까지 걸린 시간 히스토그램 구간 (초)
+    """
+    DEFAULT_FILENAME = "metrics.jsonl"
+    TTFB_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, path=None):
+        """
+        MetricsRecorder 초기화.
+
+        Args:
+            path (str, optional): JSON lines 로그 파일 경로. Defaults to None (파일에 기록하지 않음).
+        """
+        self.lock = threading.Lock() # 파일/누적 값 보호 lock (thread-safe)
+        self.file = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.file = open(path, "a", encoding="utf-8")
+        self.jobs = {} # 상태별 작업 수 (state: count)
+        self.phase_seconds = dict.fromkeys(JobMetrics.PHASES, 0.0) # 단계별 누적 시간 (초)
+        self.bytes = 0 # 누적 전송 바이트 수
+        self.subtitle_bytes = 0 # 누적 자막 바이트 수
+        self.retries = 0 # 누적 재시도 횟수
+        self.extract_cache_hits = 0 # 정보 추출을 캐시로 건너뛴 횟수
+        self.session_reuses = 0 # yt-dlp 세션을 재사용한 횟수
+        self.format_choices = {} # 포맷 선택 경로별 횟수 (choice: count)
+        self.peak_speed = 0.0 # 지금까지의 최고 속도 (바이트/초)
+        self.ttfb_counts = [0] * len(self.TTFB_BUCKETS) # 구간별 ttfb 수 (누적 아님)
+        self.ttfb_sum = 0.0
+        self.ttfb_count = 0
+
+    def record(self, job, metrics):
+        """
+        작업 실행 한 번의 지표를 기록합니다.
+
+        Args:
+            job (DownloadJob): 작업 (job_id, video_id, url, state, title, error, error_kind 사용)
+            metrics (dict): JobMetrics.to_dict() 결과
+        """
+        entry = {
+            "job_id": job.job_id,
+            "video_id": job.video_id,
+            "url": job.url,
+            "state": job.state,
+            "title": job.title,
+            "error": job.error,
+            "error_kind": job.error_kind,
+            **metrics,
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self.lock:
+            if self.file is not None:
+                self.file.write(line + "\n")
+                self.file.flush() # 비정상 종료 시에도 남도록 한 줄씩 기록
+            self.jobs[job.state] = self.jobs.get(job.state, 0) + 1
+            for phase in JobMetrics.PHASES:
+                self.phase_seconds[phase] += metrics.get(f"{phase}_seconds") or 0.0
+            self.bytes += metrics.get("bytes") or 0
+            self.subtitle_bytes += metrics.get("subtitle_bytes") or 0
+            self.retries += metrics.get("retries") or 0
+            self.extract_cache_hits += bool(metrics.get("extract_cached"))
+            self.session_reuses += bool(metrics.get("session_reused"))
+            choice = metrics.get("format_choice")
+            if choice:
+                self.format_choices[choice] = self.format_choices.get(choice, 0) + 1
+            self.peak_speed = max(self.peak_speed, metrics.get("peak_speed") or 0.0)
+            ttfb = metrics.get("ttfb_seconds")
+            if ttfb is not None:
+                self.ttfb_sum += ttfb
+                self.ttfb_count += 1
+                for index, bound in enumerate(self.TTFB_BUCKETS):
+                    if ttfb <= bound:
+                        self.ttfb_counts[index] += 1
+                        break
+
+    def render(self):
+        """
+        누적 지표를 Prometheus 텍스트 형식(exposition format 0.0.4)으로 반환합니다.
+
+        Returns:
+            str: `/metrics` 응답 본문
+        """
+        with self.lock:
+            lines = [
+                "# HELP tubedown_jobs_total Download runs by final state.",
+                "# TYPE tubedown_jobs_total counter",
+            ]
+            lines += [f'tubedown_jobs_total{{state="{state}"}} {count}' for state, count in sorted(self.jobs.items())]
+            lines += [
+                "# HELP tubedown_phase_seconds_total Wall-clock time spent per phase.",
+                "# TYPE tubedown_phase_seconds_total counter",
+            ]
+            lines += [
+                f'tubedown_phase_seconds_total{{phase="{phase}"}} {seconds:.6f}'
+                for phase, seconds in self.phase_seconds.items()
+            ]
+            lines += [
+                "# HELP tubedown_downloaded_bytes_total Bytes received, by kind.",
+                "# TYPE tubedown_downloaded_bytes_total counter",
+                f'tubedown_downloaded_bytes_total{{kind="media"}} {self.bytes}',
+                f'tubedown_downloaded_bytes_total{{kind="subtitles"}} {self.subtitle_bytes}',
+                "# HELP tubedown_retries_total HTTP and fragment retries.",
+                "# TYPE tubedown_retries_total counter",
+                f"tubedown_retries_total {self.retries}",
+                "# HELP tubedown_extract_cache_hits_total Runs that skipped extraction using the info cache.",
+                "# TYPE tubedown_extract_cache_hits_total counter",
+                f"tubedown_extract_cache_hits_total {self.extract_cache_hits}",
+                "# HELP tubedown_session_reuses_total Runs that reused a pooled yt-dlp session instead of creating one.",
+                "# TYPE tubedown_session_reuses_total counter",
+                f"tubedown_session_reuses_total {self.session_reuses}",
+                "# HELP tubedown_format_choices_total Runs by format path (single avoids the merge).",
+                "# TYPE tubedown_format_choices_total counter",
+            ]
+            lines += [
+                f'tubedown_format_choices_total{{choice="{choice}"}} {count}'
+                for choice, count in sorted(self.format_choices.items())
+            ]
+            lines += [
+                "# HELP tubedown_peak_speed_bytes Highest transfer speed seen, in bytes per second.",
+                "# TYPE tubedown_peak_speed_bytes gauge",
+                f"tubedown_peak_speed_bytes {self.peak_speed:.1f}",
+                "# HELP tubedown_ttfb_seconds Time from job start to first media byte.",
+                "# TYPE tubedown_ttfb_seconds histogram",
+            ]
+            cumulative = 0
+            for bound, count in zip(self.TTFB_BUCKETS, self.ttfb_counts):
+                cumulative += count
+                lines.append(f'tubedown_ttfb_seconds_bucket{{le="{bound}"}} {cumulative}')
+            lines += [
+                f'tubedown_ttfb_seconds_bucket{{le="+Inf"}} {self.ttfb_count}',
+                f"tubedown_ttfb_seconds_sum {self.ttfb_sum:.6f}",
+                f"tubedown_ttfb_seconds_count {self.ttfb_count}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        """로그 파일을 닫습니다."""
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+class MetricsServer:
+    """
+    MetricsRecorder 의 누적 지표를 `http://127.0.0.1:<port>/metrics` 로 제공하는 로컬 HTTP 서버입니다.
+    Prometheus 등에서 수집할 수 있으며, 외부에서 접근하지 못하도록 localhost 에만 바인딩합니다.
+    """
+    def __init__(self, recorder, port):
+        """
+        MetricsServer 초기화 및 시작. 포트를 사용할 수 없으면 OSError 가 발생합니다.
+
+        Args:
+            recorder (MetricsRecorder): 지표를 제공할 기록기
+            port (int): 포트 번호
+        """
+        http_server = lazy_import("http.server") # 서버를 켤 때만 import (어플리케이션 시작 시간 단축)
+        handler = type("MetricsHandler", (_metrics_handler_class(),), {"recorder": recorder})
+        self.httpd = http_server.ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="metrics-server", daemon=True)
+        self.thread.start()
+
+    def close(self):
+        """서버를 종료합니다."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@functools.lru_cache(maxsize=None)
+def _metrics_handler_class():
+    """_MetricsHandler 클래스를 반환합니다. http.server 를 상속하므로 서버를 처음 시작할 때 만듭니다."""
+    http_server = lazy_import("http.server")
+
+    class _MetricsHandler(http_server.BaseHTTPRequestHandler):
+        """`/metrics` 요청에 Prometheus 텍스트 형식으로 응답하는 핸들러."""
+        recorder = None
+
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = self.recorder.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass # 요청 로그 출력 안 함
+
+    return _MetricsHandler
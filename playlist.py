@@ -0,0 +1,58 @@
+from startup import lazy_import
+
+
+MAX_REDIRECTS = 5 # url 타입 결과를 따라가는 최대 횟수
+MAX_DEPTH = 2 # 채널 홈 -> 탭 -> 재생목록 처럼 중첩된 목록을 펼치는 최대 깊이
+
+
+def iter_playlist_entries(url):
+    """
+    재생목록 또는 채널 URL을 flat extraction 으로 펼쳐 비디오를 하나씩 반환합니다.
+
+    yt-dlp 의 `process=False` 결과를 직접 순회하므로, 다음 페이지 목록은 필요할 때 요청됩니다.
+    따라서 호출하는 쪽은 첫 비디오를 받자마자 다운로드를 시작할 수 있고, 나머지 목록은 그동안 계속 받아옵니다.
+
+    Args:
+        url (str): 재생목록 또는 채널 URL
+
+    Yields:
+        tuple[str, str]: (비디오 ID, 비디오 URL)
+
+    Raises:
+        yt_dlp.utils.DownloadError: 목록을 가져오지 못한 경우
+    """
+    yt_dlp = lazy_import("yt_dlp") # 첫 사용 시 import (어플리케이션 시작 시간 단축)
+    ydl_opts = {
+        "extract_flat": "in_playlist", # 비디오 정보는 추출하지 않고 목록만 가져옴
+        "quiet": True,
+        "no_warnings": True,
+    }
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        result = ydl.extract_info(url, download=False, process=False) # 목록 항목은 lazy generator 로 반환됨
+        yield from _iter_result(ydl, result, MAX_DEPTH)
+
+
+def _iter_result(ydl, result, depth):
+    """extract_info(process=False) 결과에서 비디오 항목을 순서대로 꺼냅니다."""
+    for _ in range(MAX_REDIRECTS): # 채널 주소 -> /videos 탭 같은 url 타입 결과 따라가기
+        if result.get("_type") not in ("url", "url_transparent"):
+            break
+        if result.get("ie_key") == "Youtube": # 단일 비디오로 연결되는 경우
+            yield result["id"], result["url"]
+            return
+        result = ydl.extract_info(
+            result["url"], download=False, process=False, ie_key=result.get("ie_key")
+        )
+
+    if result.get("_type", "video") == "video": # 재생목록이 아닌 단일 비디오 URL
+        yield result["id"], result.get("webpage_url") or result.get("original_url")
+        return
+
+    for entry in result.get("entries") or []: # 순회하는 동안 다음 페이지를 요청함
+        if not entry:
+            continue
+        if entry.get("_type") == "playlist" or entry.get("ie_key") == "YoutubeTab": # 하위 목록 (채널 홈의 탭 등)
+            if depth > 0:
+                yield from _iter_result(ydl, entry, depth - 1)
+        elif entry.get("id"):
+            yield entry["id"], entry.get("url") or f"https://www.youtube.com/watch?v={entry['id']}"
@@ -0,0 +1,362 @@
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import errors
+from downloader import DownloadWorker, WorkerListener
+from ratelimit import SlotLimiter, TokenBucket
+from sessionpool import SessionPool
+
+
+MAX_SLOTS = 64 # 동시에 실행할 수 있는 최대 작업 수 (중단 플래그 배열 크기)
+PROGRESS_INTERVAL = 0.1 # 자식 프로세스가 진행률을 보내는 최소 간격 (초)
+CANCEL_POLL_INTERVAL = 0.1 # 자식 프로세스가 중단 플래그를 확인하는 간격 (초, 외부 프로세스 종료용)
+
+CANCEL = 1 # 중단 플래그 값: 중단 (임시 파일 유지)
+CANCEL_DELETE = 2 # 중단 플래그 값: 중단 후 임시 파일 삭제
+
+_events = None # 자식 프로세스: 부모로 이벤트를 보내는 큐
+_cancel_flags = None # 자식 프로세스: 작업별 중단 플래그 (공유 메모리)
+_postprocess_slots = None # 자식 프로세스: 모든 자식 프로세스가 공유하는 후처리 동시 실행 수 제한기
+_session_pool = None # 자식 프로세스: 이 프로세스에서 실행되는 작업들이 재사용하는 yt-dlp 세션 풀
+
+
+class ProcessPool:
+    """
+    다운로드 작업을 별도 프로세스에서 실행하는 재사용 가능한 프로세스 풀입니다.
+
+    yt-dlp 의 추출, JSON 파싱, 조각 관리, progress hook 같은 Python 코드가 GUI 프로세스의 GIL 을
+    두고 Qt 이벤트 루프와 경쟁하지 않도록 하고, 동시 작업이 많을 때 여러 코어를 사용합니다.
+    자식 프로세스의 이벤트는 하나의 multiprocessing 큐로 모이며, pump 스레드가 작업별로 나누어 전달합니다.
+    중단 요청은 공유 메모리의 작업 슬롯별 플래그로 전달합니다.
+    후처리(ffmpeg 병합) 동시 실행 수는 공유 메모리의 SlotLimiter(`postprocess_slots`) 로 모든 자식 프로세스가 함께 제한합니다.
+    """
+    def __init__(self, max_workers):
+        """
+        ProcessPool 초기화. 자식 프로세스는 첫 작업 실행 시 생성됩니다.
+
+        Args:
+            max_workers (int): 자식 프로세스 수
+        """
+        self.context = multiprocessing.get_context("spawn") # Qt/스레드 상태를 물려받지 않도록 spawn 사용
+        self.events = self.context.Queue() # 자식 -> 부모 이벤트 큐 (task_id, 이벤트 이름, 인자)
+        self.cancel_flags = self.context.Array("b", MAX_SLOTS, lock=False) # 슬롯별 중단 플래그
+        self.postprocess_slots = SlotLimiter(os.cpu_count() or 1, context=self.context) # 한도는 DownloadManager 가 설정
+        self.lock = threading.Lock() # 실행기/슬롯/작업 큐 보호 lock (thread-safe)
+        self.slot_available = threading.Condition(self.lock)
+        self.max_slots = MAX_SLOTS # 동시에 실행할 수 있는 최대 작업 수 (DownloadManager 가 동시 다운로드 수를 제한)
+        self.free_slots = list(range(MAX_SLOTS))
+        self.task_queues = {} # 실행 중인 작업의 이벤트 큐 (task_id: queue.SimpleQueue)
+        self.task_ids = itertools.count(1) # 작업 ID 생성기
+        self.max_workers = max(1, max_workers)
+        self.executor = None
+        self.pump_thread = threading.Thread(target=self._pump, name="process-pool-pump", daemon=True)
+        self.pump_thread.start()
+
+    def resize(self, max_workers):
+        """
+        자식 프로세스 수를 늘립니다. 실행 중인 작업은 기존 프로세스에서 계속 실행되고, 새 작업부터 새 풀을 사용합니다.
+
+        Args:
+            max_workers (int): 자식 프로세스 수
+        """
+        with self.lock:
+            if max_workers <= self.max_workers:
+                return # 줄이는 경우는 동시 다운로드 수 제한으로 충분하므로 프로세스를 유지
+            self.max_workers = max_workers
+            old_executor, self.executor = self.executor, None
+        if old_executor is not None:
+            old_executor.shutdown(wait=False) # 실행 중인 작업이 끝나면 종료
+
+    def shutdown(self, timeout=None):
+        """
+        모든 작업에 중단을 요청하고 자식 프로세스를 종료합니다.
+
+        Args:
+            timeout (float, optional): 자식 프로세스가 스스로 끝나기를 기다리는 최대 시간(초).
+                지나면 남은 자식 프로세스를 강제 종료합니다. Defaults to None (무제한).
+        """
+        with self.lock:
+            for slot in range(MAX_SLOTS):
+                self.cancel_flags[slot] = CANCEL
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            processes = list((executor._processes or {}).values()) # 강제 종료용 (공개 API 없음)
+            executor.shutdown(wait=False, cancel_futures=True)
+            deadline = None if timeout is None else time.monotonic() + timeout
+            for process in processes:
+                process.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+                if process.is_alive(): # 시간 초과: 강제 종료 (자식의 ffmpeg 는 중단 플래그로 이미 종료됨)
+                    process.terminate()
+        self.events.put(None) # pump 스레드 종료
+
+    def _submit(self, kwargs):
+        """작업 슬롯을 할당하고 자식 프로세스에 작업을 제출합니다. (task_id, slot, future, 이벤트 큐) 반환."""
+        with self.lock:
+            while not self.free_slots:
+                self.slot_available.wait()
+            slot = self.free_slots.pop()
+            self.cancel_flags[slot] = 0
+            task_id = next(self.task_ids)
+            events = self.task_queues[task_id] = queue.SimpleQueue()
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=self.context,
+                    initializer=_init_child,
+                    initargs=(self.events, self.cancel_flags, self.postprocess_slots),
+                )
+            try:
+                future = self.executor.submit(_run_task, task_id, slot, kwargs)
+            except BrokenProcessPool: # 자식 프로세스가 비정상 종료된 풀: 새로 만들어 다시 제출
+                self.executor = None
+                self._release(task_id, slot)
+                raise
+        return task_id, slot, future, events
+
+    def _release(self, task_id, slot):
+        """작업 슬롯과 이벤트 큐를 반납합니다 (lock 보유 상태에서 호출)."""
+        self.task_queues.pop(task_id, None)
+        self.free_slots.append(slot)
+        self.slot_available.notify()
+
+    def _finish(self, task_id, slot, broken):
+        """작업이 끝났을 때 슬롯을 반납합니다. 풀이 깨졌으면 다음 작업에서 새로 만듭니다."""
+        with self.lock:
+            self._release(task_id, slot)
+            if broken:
+                self.executor = None
+
+    def _pump(self):
+        """pump 스레드 본체. 자식 프로세스 이벤트를 작업별 큐로 전달합니다."""
+        while True:
+            message = self.events.get()
+            if message is None:
+                return
+            with self.lock:
+                events = self.task_queues.get(message[0])
+            if events is not None:
+                events.put(message)
+
+
+class ProcessWorker:
+    """
+    DownloadWorker 와 같은 인터페이스로, 다운로드를 ProcessPool 의 자식 프로세스에서 실행하는 워커입니다.
+
+    `run()` 은 호출한 스레드에서 자식 프로세스의 이벤트를 받아 listener 로 전달하며, 작업이 끝나면 반환합니다.
+    진행률은 자식 프로세스에서 PROGRESS_INTERVAL 간격으로 모아서 보내므로 IPC 비용이 청크 수와 무관합니다.
+    대역폭 제한은 프로세스 간에 공유할 수 없으므로, 작업별로 나눈 한도(rate_limit)를 자식 프로세스에서 적용합니다.
+    """
+    def __init__(
+            self, pool, url, download_path, quality, listener, download_subtitles,
+            rate_limit=0, weight=1.0, concurrent_fragments=1, info_cache=None, reuse_session=True,
+            format_tolerance=0.0,
+    ):
+        """
+        ProcessWorker 초기화.
+
+        Args:
+            pool (ProcessPool): 작업을 실행할 프로세스 풀
+            url (str): 다운로드할 YouTube URL
+            download_path (str): 다운로드 경로
+            quality (str): 비디오 품질 설정
+            listener (WorkerListener): 이벤트 수신 객체
+            download_subtitles (bool): 자막 다운로드 여부
+            rate_limit (int, optional): 이 작업의 대역폭 제한 (바이트/초, 0 이면 무제한). Defaults to 0.
+            weight (float, optional): 대역폭 분배 가중치 (프로세스 모드에서는 시작 시 rate_limit 계산에만 사용). Defaults to 1.0.
+            concurrent_fragments (int, optional): DASH/HLS 조각 동시 다운로드 수. Defaults to 1.
+            info_cache (InfoCache, optional): 비디오 정보 디스크 캐시. Defaults to None.
+            reuse_session (bool, optional): 자식 프로세스의 yt-dlp 세션 풀을 사용할지 여부. Defaults to True.
+            format_tolerance (float, optional): 병합하지 않는 포맷을 고를 때 허용할 화질 손실 비율. Defaults to 0.0.
+        """
+        self.pool = pool
+        self.url = url
+        self.listener = listener
+        self.weight = weight
+        self.kwargs = {
+            "url": url,
+            "download_path": download_path,
+            "quality": quality,
+            "download_subtitles": download_subtitles,
+            "rate_limit": rate_limit,
+            "concurrent_fragments": concurrent_fragments,
+            "info_cache": info_cache,
+            "reuse_session": reuse_session,
+            "format_tolerance": format_tolerance,
+        }
+        self.is_interrupted = False
+        self.delete_partial = False
+        self.slot = None
+
+    def run(self):
+        """자식 프로세스에 작업을 제출하고, 끝날 때까지 이벤트를 listener 로 전달합니다."""
+        try:
+            task_id, slot, future, events = self.pool._submit(self.kwargs)
+        except BrokenProcessPool as e:
+            self.listener.error(self.url, f"예상치 못한 오류 발생: {self.url} - {e}", errors.UNKNOWN)
+            return
+        with self.pool.lock: # stop() 과 슬롯 할당 사이의 경쟁 방지
+            self.slot = slot
+            if self.is_interrupted: # 제출 전에 중단 요청된 경우
+                self.pool.cancel_flags[slot] = CANCEL_DELETE if self.delete_partial else CANCEL
+
+        done = False
+        reported = False # 완료/에러 이벤트를 받았는지 여부
+        try:
+            while not done:
+                try:
+                    _, event, args = events.get(timeout=0.2)
+                except queue.Empty:
+                    if future.done() and future.exception() is not None: # 자식 프로세스 비정상 종료 등
+                        self.listener.error(
+                            self.url, f"예상치 못한 오류 발생: {self.url} - {future.exception()}", errors.UNKNOWN
+                        )
+                        break
+                    continue
+                if event == "done":
+                    done = True
+                    if not reported: # 자식이 결과를 보내지 못하고 끝남: 작업이 실행 중으로 남지 않도록 에러 처리
+                        self.listener.error(
+                            self.url, f"예상치 못한 오류 발생: {self.url} - 작업 결과를 받지 못했습니다", errors.UNKNOWN
+                        )
+                else:
+                    reported = reported or event in ("finished", "error")
+                    getattr(self.listener, event)(self.url, *args)
+        finally:
+            broken = future.done() and isinstance(future.exception(), BrokenProcessPool)
+            with self.pool.lock:
+                self.slot = None # 반납한 슬롯은 다른 작업이 쓰므로 이후 stop() 이 그 작업의 플래그를 건드리지 않도록
+            self.pool._finish(task_id, slot, broken)
+
+    def stop(self, delete_partial=False):
+        """
+        자식 프로세스의 다운로드에 중단을 요청합니다 (공유 메모리 플래그 설정).
+
+        Args:
+            delete_partial (bool, optional): 중단 후 임시 파일을 삭제할지 여부. Defaults to False.
+        """
+        self.is_interrupted = True
+        self.delete_partial = self.delete_partial or delete_partial
+        with self.pool.lock: # 작업이 끝나 슬롯을 반납한 뒤에는 플래그를 설정하지 않음
+            if self.slot is not None:
+                self.pool.cancel_flags[self.slot] = CANCEL_DELETE if self.delete_partial else CANCEL
+
+
+class _ChildWorker(DownloadWorker):
+    """
+    자식 프로세스에서 실행되는 DownloadWorker. 중단 플래그를 공유 메모리에서 읽습니다.
+    `watch_cancel()` 스레드가 플래그를 감시하다가 설정되면 `stop()` 을 호출하여 외부 프로세스(ffmpeg)도 종료합니다.
+    """
+
+    def __init__(self, slot, *args, **kwargs):
+        self.slot = slot
+        super().__init__(*args, **kwargs)
+
+    @property
+    def is_interrupted(self):
+        return bool(_cancel_flags[self.slot])
+
+    @is_interrupted.setter
+    def is_interrupted(self, value):
+        if value and not _cancel_flags[self.slot]: # 초기화 시 False 로 덮어써서 먼저 도착한 중단 요청을 지우지 않도록 설정만 허용
+            _cancel_flags[self.slot] = CANCEL
+
+    def watch_cancel(self, done):
+        """
+        중단 플래그 감시 스레드 본체. 작업이 끝나거나(done 설정) 중단 요청이 오면 반환합니다.
+
+        Args:
+            done (threading.Event): 작업 종료 이벤트
+        """
+        while not done.wait(CANCEL_POLL_INTERVAL):
+            flag = _cancel_flags[self.slot]
+            if flag:
+                self.stop(delete_partial=flag == CANCEL_DELETE)
+                return
+
+
+class _QueueListener(WorkerListener):
+    """자식 프로세스에서 워커 이벤트를 부모 프로세스로 보내는 listener. 진행률은 일정 간격으로만 보냅니다."""
+
+    def __init__(self, task_id):
+        self.task_id = task_id
+        self.last_progress = 0.0
+
+    def _send(self, event, *args):
+        _events.put((self.task_id, event, args))
+
+    def progress(self, url, downloaded_bytes, total_bytes):
+        now = time.monotonic()
+        if now - self.last_progress >= PROGRESS_INTERVAL or downloaded_bytes == total_bytes:
+            self.last_progress = now
+            self._send("progress", downloaded_bytes, total_bytes)
+
+    def started(self, url):
+        self._send("started")
+
+    def extracted(self, url, info):
+        self._send("extracted", {"id": info.get("id"), "title": info.get("title")}) # 필요한 필드만 전달
+
+    def destination(self, url, filename):
+        self._send("destination", filename)
+
+    def postprocessing(self, url):
+        self._send("postprocessing")
+
+    def finished(self, url, info):
+        requested = info.get("requested_downloads") or [{}]
+        self._send(
+            "finished",
+            {
+                "id": info.get("id"),
+                "title": info.get("title"),
+                "format": info.get("format"),
+                "requested_downloads": [{"filepath": requested[0].get("filepath")}],
+            },
+        )
+
+    def error(self, url, message, kind):
+        self._send("error", message, kind)
+
+    def metrics(self, url, metrics):
+        self._send("metrics", metrics)
+
+
+def _init_child(events, cancel_flags, postprocess_slots):
+    """자식 프로세스 초기화 함수. 이벤트 큐, 중단 플래그, 후처리 제한기를 전역 변수로 저장하고 세션 풀을 만듭니다."""
+    global _events, _cancel_flags, _postprocess_slots, _session_pool
+    _events = events
+    _cancel_flags = cancel_flags
+    _postprocess_slots = postprocess_slots
+    _session_pool = SessionPool() # 프로세스 간에 공유할 수 없으므로 자식 프로세스마다 하나
+
+
+def _run_task(task_id, slot, kwargs):
+    """자식 프로세스에서 실행되는 작업 본체."""
+    listener = _QueueListener(task_id)
+    try:
+        rate_limit = kwargs.pop("rate_limit")
+        reuse_session = kwargs.pop("reuse_session")
+        worker = _ChildWorker(
+            slot,
+            listener=listener,
+            rate_limiter=TokenBucket(rate_limit) if rate_limit else None,
+            postprocess_slots=_postprocess_slots,
+            session_pool=_session_pool if reuse_session else None,
+            **kwargs,
+        )
+        done = threading.Event()
+        threading.Thread(target=worker.watch_cancel, args=(done,), name="cancel-watch", daemon=True).start()
+        try:
+            worker.run()
+        finally:
+            done.set()
+    except Exception as e: # 워커 생성 실패 등 run() 밖의 에러: 부모가 작업을 끝낼 수 있도록 에러로 보고
+        listener.error(kwargs.get("url"), f"예상치 못한 오류 발생: {kwargs.get('url')} - {e}", errors.classify_error(e))
+    finally:
+        listener._send("done") # 이벤트 순서 보장: 항상 마지막 이벤트
@@ -0,0 +1,123 @@
+import threading
+
+
+class JobProgress:
+    """
+    작업 하나의 최신 진행 상황 (바이트 단위) 입니다.
+
+    Attributes:
+        downloaded_bytes (int): 현재 파일에서 받은 바이트 수
+        total_bytes (int): 현재 파일의 전체 바이트 수 (알 수 없으면 None)
+        percent (float): 진행률 (0.0 ~ 100.0)
+        counted_bytes (int): 전체 수신량에 반영한 현재 파일의 바이트 수 (None 이면 아직 기준값 없음)
+    """
+    __slots__ = ("downloaded_bytes", "total_bytes", "percent", "counted_bytes")
+
+    def __init__(self, downloaded_bytes=0, total_bytes=None, percent=0.0):
+        self.downloaded_bytes = downloaded_bytes
+        self.total_bytes = total_bytes
+        self.percent = percent
+        self.counted_bytes = None
+
+
+class ProgressAggregator:
+    """
+    여러 워커의 진행 상황을 모아두는 공유 저장소입니다.
+
+    워커 스레드는 청크를 받을 때마다 `update()` 로 최신 바이트 수만 덮어쓰고 (이벤트 전달 없음),
+    UI 등 소비자는 고정 주기로 `collect_changed()` 를 호출해 마지막 호출 이후 바뀐 작업만 가져갑니다.
+    따라서 소비자 쪽 비용은 청크 수신 빈도가 아니라 갱신 주기에만 비례합니다.
+    모든 작업이 실제로 받은 바이트 합계(`received_bytes`)도 함께 집계하여 전체 처리량 측정에 사용합니다.
+    """
+    def __init__(self):
+        """ProgressAggregator 초기화."""
+        self.lock = threading.Lock() # 진행 상황 보호 lock (thread-safe)
+        self.entries = {} # 작업별 최신 진행 상황 (job_id: JobProgress)
+        self.changed = set() # 마지막 collect_changed() 이후 바뀐 작업 ID 목록
+        self.received_bytes = 0 # 모든 작업이 받은 바이트 합계 (이어받기 시 이미 있던 부분은 제외)
+
+    def update(self, job_id, downloaded_bytes, total_bytes):
+        """
+        작업의 최신 바이트 수를 기록합니다. 워커 스레드에서 청크마다 호출됩니다.
+
+        Args:
+            job_id (int): 작업 ID
+            downloaded_bytes (int): 현재 파일에서 받은 바이트 수
+            total_bytes (int): 현재 파일의 전체 바이트 수 (알 수 없으면 None)
+        """
+        with self.lock:
+            entry = self.entries.get(job_id)
+            if entry is None:
+                entry = self.entries[job_id] = JobProgress()
+            if entry.counted_bytes is not None and downloaded_bytes >= entry.counted_bytes:
+                self.received_bytes += downloaded_bytes - entry.counted_bytes
+            entry.counted_bytes = downloaded_bytes # 첫 값(이어받기 시작점)이나 새 파일의 첫 값은 기준값으로만 사용
+            entry.downloaded_bytes = downloaded_bytes
+            entry.total_bytes = total_bytes
+            if total_bytes:
+                entry.percent = min(downloaded_bytes / total_bytes * 100, 100.0) # 전체 크기를 알 때만 진행률 갱신
+            self.changed.add(job_id)
+
+    def set_percent(self, job_id, percent):
+        """
+        작업 진행률을 직접 설정합니다 (시작 시 0%, 완료 시 100% 등).
+
+        Args:
+            job_id (int): 작업 ID
+            percent (float): 진행률 (0.0 ~ 100.0)
+        """
+        with self.lock:
+            entry = self.entries.get(job_id)
+            if entry is None:
+                entry = self.entries[job_id] = JobProgress()
+            entry.percent = percent
+            entry.counted_bytes = None # 시작/완료 시점: 다음 값부터 다시 기준값으로
+            self.changed.add(job_id)
+
+    def get(self, job_id):
+        """
+        작업의 최신 진행률을 반환합니다.
+
+        Args:
+            job_id (int): 작업 ID
+
+        Returns:
+            float: 진행률 (0.0 ~ 100.0), 기록이 없으면 0.0
+        """
+        with self.lock:
+            entry = self.entries.get(job_id)
+            return entry.percent if entry else 0.0
+
+    def snapshot(self, job_ids):
+        """
+        지정한 작업들의 최신 진행 상황 복사본을 반환합니다. `collect_changed()` 와 달리 변경 기록을 지우지 않으므로,
+        주기적으로 읽는 소비자가 여럿이어도 서로 영향을 주지 않습니다.
+
+        Args:
+            job_ids (iterable[int]): 작업 ID 목록
+
+        Returns:
+            dict[int, JobProgress]: 기록이 있는 작업의 진행 상황 (job_id: JobProgress)
+        """
+        snapshot = {}
+        with self.lock:
+            for job_id in job_ids:
+                entry = self.entries.get(job_id)
+                if entry is not None:
+                    snapshot[job_id] = JobProgress(entry.downloaded_bytes, entry.total_bytes, entry.percent)
+        return snapshot
+
+    def collect_changed(self):
+        """
+        마지막 호출 이후 진행 상황이 바뀐 작업들의 복사본을 반환합니다.
+
+        Returns:
+            dict[int, JobProgress]: 바뀐 작업의 진행 상황 (job_id: JobProgress)
+        """
+        changed = {}
+        with self.lock:
+            for job_id in self.changed:
+                entry = self.entries[job_id]
+                changed[job_id] = JobProgress(entry.downloaded_bytes, entry.total_bytes, entry.percent)
+            self.changed.clear()
+        return changed
@@ -0,0 +1,144 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    모든 다운로드 워커가 공유하는 가중치 기반 대역폭 제한기입니다.
+
+    전체 한도 `rate` (바이트/초) 를 최근에 데이터를 받은 작업들에게 가중치(weight) 비율로 나누어 줍니다.
+    각 작업은 자기 몫의 토큰 버킷을 가지며, 받은 바이트만큼 토큰을 소비하고 부족하면 해당 워커(스레드)만 대기합니다.
+    작업 몫의 합이 rate 이므로 전체 사용량은 rate 이하로 유지되고, 가중치가 큰 작업이 더 많은 대역폭을 받습니다.
+    rate 가 0 이면 제한하지 않습니다. 실행 중에도 `set_rate()` 로 한도를 바꿀 수 있습니다.
+    """
+    MAX_SLEEP = 0.2 # 한 번에 대기하는 최대 시간 (초, 중단 요청 확인 및 한도 변경 반영 주기)
+    IDLE_TIMEOUT = 2.0 # 이 시간 동안 데이터를 받지 않은 작업은 몫 계산에서 제외 (초)
+
+    def __init__(self, rate=0, burst=None):
+        """
+        TokenBucket 초기화.
+
+        Args:
+            rate (int, optional): 초당 허용 바이트 수 (0 이면 무제한). Defaults to 0.
+            burst (float, optional): 작업별 버킷 크기 (초 단위 분량). Defaults to None (0.5초 분량).
+        """
+        self.lock = threading.Lock() # 상태 보호 lock (thread-safe)
+        self.rate = 0
+        self.burst = 0.5
+        self.consumers = {} # 작업별 상태 (key: [weight, 버킷이 비는 시각, 마지막 소비 시각])
+        self.set_rate(rate, burst)
+
+    def set_rate(self, rate, burst=None):
+        """
+        초당 허용 바이트 수를 변경합니다.
+
+        Args:
+            rate (int): 초당 허용 바이트 수 (0 이면 무제한)
+            burst (float, optional): 작업별 버킷 크기 (초 단위 분량). Defaults to None (기존 값 유지).
+        """
+        with self.lock:
+            self.rate = max(0, rate)
+            if burst is not None:
+                self.burst = burst
+            self.consumers.clear() # 새 한도로 다시 계산
+
+    def consume(self, nbytes, weight=1.0, is_cancelled=None, key=None):
+        """
+        nbytes 만큼 토큰을 소비하고, 작업 몫의 토큰이 부족하면 채워질 때까지 대기합니다.
+
+        Args:
+            nbytes (int): 받은 바이트 수
+            weight (float, optional): 작업 가중치 (클수록 많은 대역폭). Defaults to 1.0.
+            is_cancelled (callable, optional): 대기 중 True 를 반환하면 즉시 반환하는 함수. Defaults to None.
+            key (hashable, optional): 작업 식별자. 한 작업이 여러 스레드를 쓰는 경우 지정. Defaults to None (현재 스레드).
+        """
+        if key is None:
+            key = threading.get_ident()
+        weight = max(weight, 0.01)
+        with self.lock:
+            if not self.rate:
+                return # 무제한
+            now = time.monotonic()
+            for other in [k for k, c in self.consumers.items() if now - c[2] > self.IDLE_TIMEOUT]:
+                del self.consumers[other] # 쉬고 있는 작업의 몫은 나머지 작업에게 분배
+            state = self.consumers.setdefault(key, [weight, now, now])
+            state[0] = weight
+            state[2] = now
+            share = self.rate * weight / sum(c[0] for c in self.consumers.values()) # 이 작업의 몫 (바이트/초)
+            ready_at = max(state[1], now - self.burst) + nbytes / share # 버킷 잔량(최대 burst 초 분량)에서 차감
+            state[1] = ready_at
+            wait = ready_at - now
+
+        deadline = time.monotonic() + wait
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (is_cancelled and is_cancelled()):
+                return
+            time.sleep(min(remaining, self.MAX_SLEEP))
+
+
+class SlotLimiter:
+    """
+    동시에 실행할 수 있는 작업 수를 제한하는 세마포어입니다. 후처리(ffmpeg 병합 등) 동시 실행 수 제한에 사용합니다.
+
+    threading.Semaphore 와 달리 실행 중에도 `set_limit()` 로 한도를 바꿀 수 있고, 대기 중 중단 요청을 확인합니다.
+    multiprocessing 컨텍스트를 지정하면 상태를 공유 메모리에 두므로, 자식 프로세스 초기화 인자로 넘겨
+    여러 프로세스가 같은 한도를 공유할 수 있습니다.
+    """
+    MAX_WAIT = 0.2 # 한 번에 대기하는 최대 시간 (초, 중단 요청 확인 주기)
+
+    def __init__(self, limit, context=None):
+        """
+        SlotLimiter 초기화.
+
+        Args:
+            limit (int): 동시에 실행할 수 있는 작업 수
+            context (multiprocessing.context.BaseContext, optional): 프로세스 간 공유 시 사용할 컨텍스트. Defaults to None (스레드 간 공유).
+        """
+        if context is None:
+            self.condition = threading.Condition()
+            self.counts = [0, 0]
+        else:
+            self.condition = context.Condition()
+            self.counts = context.Array("i", 2, lock=False) # condition 의 lock 으로 보호
+        self.set_limit(limit) # counts: [한도, 사용 중인 슬롯 수]
+
+    @property
+    def limit(self):
+        """동시에 실행할 수 있는 작업 수."""
+        return self.counts[0]
+
+    def set_limit(self, limit):
+        """
+        한도를 변경합니다. 늘어난 경우 대기 중인 작업이 바로 시작하고, 줄어든 경우 실행 중인 작업이 끝날 때까지 새 작업이 대기합니다.
+
+        Args:
+            limit (int): 동시에 실행할 수 있는 작업 수
+        """
+        with self.condition:
+            self.counts[0] = max(1, limit)
+            self.condition.notify_all()
+
+    def acquire(self, is_cancelled=None):
+        """
+        슬롯을 하나 얻습니다. 남은 슬롯이 없으면 다른 작업이 반납할 때까지 대기합니다.
+
+        Args:
+            is_cancelled (callable, optional): 대기 중 True 를 반환하면 슬롯 없이 반환하는 함수. Defaults to None.
+
+        Returns:
+            bool: 슬롯을 얻었으면 True, 중단 요청으로 대기를 그만두었으면 False
+        """
+        with self.condition:
+            while self.counts[1] >= self.counts[0]:
+                if is_cancelled and is_cancelled():
+                    return False
+                self.condition.wait(self.MAX_WAIT)
+            self.counts[1] += 1
+            return True
+
+    def release(self):
+        """acquire() 로 얻은 슬롯을 반납합니다."""
+        with self.condition:
+            self.counts[1] -= 1
+            self.condition.notify()
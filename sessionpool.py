@@ -0,0 +1,110 @@
+import threading
+import time
+
+
+class SessionPool:
+    """
+    다운로드 작업들이 빌려 쓰고 돌려주는 yt-dlp 세션(YoutubeDL 객체) 풀입니다.
+
+    YoutubeDL 객체를 만들 때마다 추출기 등록, 쿠키 저장소 준비, YouTube 서버와의 새 TLS 연결이 필요하므로,
+    짧은 비디오에서는 이 준비 시간이 전체 시간의 큰 부분을 차지합니다. 작업이 끝나면 세션을 버리지 않고 보관했다가,
+    같은 옵션으로 시작하는 다음 작업에 빌려줍니다. 세션은 한 번에 한 작업만 사용합니다 (YoutubeDL 은 thread-safe 하지 않음).
+
+    옵션이 다른 세션은 섞이지 않도록 옵션 키별로 따로 보관하며, 오래 쓰지 않은 세션은 (연결이 끊겼을 수 있으므로) 닫습니다.
+    세션 사이에 공유할 캐시(YouTube 플레이어 코드, 서명 함수 등)는 `shared` 에 둡니다.
+
+    Attributes:
+        MAX_IDLE (int): 옵션 키별로 보관할 최대 유휴 세션 수
+        IDLE_TIMEOUT (float): 유휴 세션을 닫기까지의 시간 (초)
+    """
+    MAX_IDLE = 16
+    IDLE_TIMEOUT = 300.0
+
+    def __init__(self, max_idle=MAX_IDLE, idle_timeout=IDLE_TIMEOUT):
+        """
+        SessionPool 초기화.
+
+        Args:
+            max_idle (int, optional): 옵션 키별로 보관할 최대 유휴 세션 수. Defaults to MAX_IDLE.
+            idle_timeout (float, optional): 유휴 세션을 닫기까지의 시간 (초). Defaults to IDLE_TIMEOUT.
+        """
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.lock = threading.Lock() # 유휴 세션 목록 보호 lock (여러 워커 스레드에서 호출)
+        self.idle = {} # 옵션 키별 유휴 세션 목록 (key: [(session, 반납 시각), ...]), 최근 반납한 세션이 뒤
+        self.shared = {} # 모든 세션이 공유하는 캐시 (이름: dict)
+        self.created = 0 # 새로 만든 세션 수
+        self.reused = 0 # 재사용한 횟수
+
+    def acquire(self, key, factory):
+        """
+        옵션 키에 맞는 유휴 세션을 빌립니다. 없으면 factory 로 새로 만듭니다.
+
+        Args:
+            key (hashable): 옵션 키 (같은 키의 세션은 서로 바꿔 쓸 수 있음)
+            factory (callable): 새 세션을 만드는 함수 (lock 밖에서 호출)
+
+        Returns:
+            tuple: (세션, 재사용 여부)
+        """
+        now = time.monotonic()
+        with self.lock:
+            expired = self._expire(now)
+            sessions = self.idle.get(key)
+            session = sessions.pop()[0] if sessions else None # 가장 최근에 쓴 세션 (연결이 살아 있을 가능성이 높음)
+            if session is not None:
+                self.reused += 1
+            else:
+                self.created += 1
+        self._close(expired)
+        if session is not None:
+            return session, True
+        return factory(), False
+
+    def release(self, key, session, reuse=True):
+        """
+        빌린 세션을 돌려줍니다. 재사용하지 않거나 보관 한도를 넘으면 닫습니다.
+
+        Args:
+            key (hashable): 빌릴 때 사용한 옵션 키
+            session: 세션 (close() 메서드가 있는 객체)
+            reuse (bool, optional): 다음 작업에 다시 빌려줄지 여부 (실패한 작업의 세션은 False). Defaults to True.
+        """
+        now = time.monotonic()
+        with self.lock:
+            expired = self._expire(now)
+            sessions = self.idle.setdefault(key, [])
+            if reuse and len(sessions) < self.max_idle:
+                sessions.append((session, now))
+                session = None
+        if session is not None:
+            expired.append(session)
+        self._close(expired)
+
+    def clear(self):
+        """유휴 세션을 모두 닫습니다 (종료 시). 빌려 간 세션은 반납할 때 다시 보관됩니다."""
+        with self.lock:
+            expired = [session for sessions in self.idle.values() for session, _ in sessions]
+            self.idle.clear()
+        self._close(expired)
+
+    def _expire(self, now):
+        """IDLE_TIMEOUT 동안 쓰지 않은 유휴 세션을 목록에서 빼서 반환합니다 (lock 보유 상태에서 호출)."""
+        expired = []
+        for key, sessions in list(self.idle.items()):
+            fresh = [(session, released) for session, released in sessions if now - released < self.idle_timeout]
+            expired += [session for session, released in sessions if now - released >= self.idle_timeout]
+            if fresh:
+                self.idle[key] = fresh
+            else:
+                del self.idle[key]
+        return expired
+
+    @staticmethod
+    def _close(sessions):
+        """세션들을 닫습니다 (연결 정리 중 에러는 무시)."""
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
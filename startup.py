@@ -0,0 +1,54 @@
+import importlib
+import os
+import sys
+import threading
+import time
+
+
+ENV_VAR = "TUBEDOWN_STARTUP_TIMING" # 1 로 설정하면 시작 단계별 시간과 지연 import 비용을 stderr 로 출력
+
+_enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+_start = time.perf_counter() # 이 모듈을 import 한 시각 (main.py 에서 가장 먼저 import)
+_last = _start
+_lock = threading.Lock() # 지연 import 가 여러 워커 스레드에서 동시에 일어날 수 있음
+
+
+def mark(label):
+    """
+    시작 단계 하나가 끝났음을 기록합니다. 보고가 켜져 있으면 이전 단계 이후 걸린 시간과 누적 시간을 출력합니다.
+
+    Args:
+        label (str): 단계 이름
+    """
+    global _last
+    if not _enabled:
+        return
+    with _lock:
+        now = time.perf_counter()
+        elapsed, _last = now - _last, now
+    _report(f"{label}: +{elapsed * 1000:.1f} ms (누적 {(now - _start) * 1000:.1f} ms)")
+
+
+def lazy_import(name):
+    """
+    모듈을 처음 사용하는 시점에 import 합니다. 시작 시 필요 없는 무거운 모듈(yt_dlp, requests)에 사용합니다.
+    이미 import 된 모듈은 바로 반환하며, 보고가 켜져 있으면 처음 import 에 걸린 시간을 출력합니다.
+    여러 워커 스레드가 동시에 처음 호출해도 모두 초기화가 끝난 모듈을 받습니다.
+
+    Args:
+        name (str): 모듈 이름
+
+    Returns:
+        module: import 된 모듈
+    """
+    loaded = name in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(name) # 다른 스레드가 import 하는 중이면 끝날 때까지 기다림 (sys.modules 만 보면 초기화 전 모듈을 받음)
+    if _enabled and not loaded:
+        _report(f"import {name}: {(time.perf_counter() - start) * 1000:.1f} ms (지연 import)")
+    return module
+
+
+def _report(message):
+    """보고 한 줄을 stderr 로 출력합니다."""
+    print(f"[startup] {message}", file=sys.stderr, flush=True)
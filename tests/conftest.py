@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 최상위 모듈(utils, manager 등)을 어플리케이션과 같은 방식으로 import 할 수 있도록 저장소 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import errors
+from adaptive import AdaptiveConcurrency
+
+
+class FakeManager:
+    """AdaptiveConcurrency 가 사용하는 DownloadManager 의 일부만 흉내 내는 객체."""
+
+    def __init__(self, concurrency, saturated=True):
+        self.concurrency = concurrency
+        self.saturated = saturated
+        self.progress = SimpleNamespace(received_bytes=0)
+
+    def is_saturated(self):
+        return self.saturated
+
+    def set_concurrency(self, concurrency, preempt=True):
+        assert not preempt # 자동 조절은 실행 중인 작업을 중단하지 않음
+        self.concurrency = concurrency
+
+
+def _step(controller, manager, now, rate):
+    """interval 1초 동안 rate 바이트/초로 받은 뒤 한 번 조절합니다."""
+    manager.progress.received_bytes += rate
+    return controller.step(now)
+
+
+def _controller(concurrency=2, maximum=8, saturated=True):
+    manager = FakeManager(concurrency, saturated)
+    controller = AdaptiveConcurrency(manager, maximum)
+    controller.step(0.0) # 첫 측정은 기준값만 기록
+    return controller, manager
+
+
+def test_first_step_only_records_baseline():
+    manager = FakeManager(2)
+    controller = AdaptiveConcurrency(manager, 8)
+    assert controller.step(0.0) == 2
+    assert manager.concurrency == 2
+
+
+def test_increases_while_throughput_grows():
+    controller, manager = _controller()
+    assert _step(controller, manager, 1.0, 100) == 3
+    assert _step(controller, manager, 2.0, 150) == 3 # 처리량 50% 증가: 유지
+    assert controller.throughput == 150
+    assert _step(controller, manager, 3.0, 150) == 4 # 다음 구간에 다시 늘림
+
+
+def test_reverts_and_holds_when_throughput_flat():
+    controller, manager = _controller()
+    _step(controller, manager, 1.0, 100) # 2 -> 3
+    assert _step(controller, manager, 2.0, 101) == 2 # 늘렸는데 처리량 그대로: 되돌림
+    for i in range(AdaptiveConcurrency.HOLD_INTERVALS):
+        assert _step(controller, manager, 3.0 + i, 101) == 2
+    assert _step(controller, manager, 3.0 + AdaptiveConcurrency.HOLD_INTERVALS, 101) == 3 # 대기 후 다시 시도
+
+
+def test_does_not_increase_without_waiting_jobs():
+    controller, manager = _controller(saturated=False)
+    assert _step(controller, manager, 1.0, 100) == 2
+
+
+def test_does_not_exceed_maximum():
+    controller, manager = _controller(concurrency=4, maximum=4)
+    assert _step(controller, manager, 1.0, 100) == 4
+
+
+def test_halves_on_congestion():
+    controller, manager = _controller(concurrency=6)
+    controller.record_error(errors.RATE_LIMITED)
+    assert _step(controller, manager, 1.0, 100) == 3
+    controller.record_retries(2)
+    assert _step(controller, manager, 2.0, 100) == 1
+    controller.record_error(errors.NETWORK)
+    assert _step(controller, manager, 3.0, 100) == 1 # minimum 아래로 줄이지 않음
+
+
+def test_ignores_non_congestion_errors():
+    controller, manager = _controller(concurrency=4, saturated=False)
+    controller.record_error(errors.EXTRACTOR)
+    controller.record_retries(0)
+    assert _step(controller, manager, 1.0, 100) == 4
+
+
+def test_congestion_cancels_probe():
+    controller, manager = _controller()
+    _step(controller, manager, 1.0, 100) # 2 -> 3
+    controller.record_error(errors.FORBIDDEN)
+    assert _step(controller, manager, 2.0, 200) == 1
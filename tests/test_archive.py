@@ -0,0 +1,55 @@
+import pytest
+
+from archive import DownloadArchive
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = DownloadArchive(str(tmp_path / "archive.sqlite3"))
+    yield archive
+    archive.close()
+
+
+def _video_id(number):
+    return f"vid{number:08d}"
+
+
+def test_contains_many_across_chunks(archive):
+    archive.QUERY_CHUNK_SIZE = 3
+    for number in range(0, 10, 2):
+        archive.add(_video_id(number))
+    queries = []
+    archive.connection.set_trace_callback(queries.append)
+    found = archive.contains_many(_video_id(number) for number in range(10))
+    archive.connection.set_trace_callback(None)
+    assert found == {_video_id(number) for number in range(0, 10, 2)}
+    assert len([query for query in queries if " IN (" in query]) == 4 # 10개를 3개씩 나누어 조회
+
+
+def test_contains_many_beyond_sqlite_variable_limit(archive):
+    video_ids = [_video_id(number) for number in range(2500)] # SQLite 기본 변수 개수 제한(999)보다 많음
+    archive.add(video_ids[0])
+    archive.add(video_ids[-1])
+    assert archive.contains_many(video_ids) == {video_ids[0], video_ids[-1]}
+    assert archive.contains_many([]) == set()
+
+
+def test_import_ytdlp_archive(archive, tmp_path):
+    archive.add("dQw4w9WgXcQ", title="already")
+    path = tmp_path / "downloaded.txt"
+    path.write_text(
+        "youtube dQw4w9WgXcQ\n"
+        "youtube jNQXAC9IVRw\n"
+        "Youtube 9bZkp7q5F8U\n"
+        "vimeo 123456\n"
+        "\n"
+        "youtube\n"
+        "youtube jNQXAC9IVRw\n",
+        encoding="utf-8",
+    )
+    assert archive.import_ytdlp_archive(str(path)) == 2 # 이미 있거나 중복된 비디오, YouTube 이외 항목은 건너뜀
+    assert len(archive) == 3
+    assert "jNQXAC9IVRw" in archive and "9bZkp7q5F8U" in archive
+    assert "123456" not in archive
+    assert archive.get("dQw4w9WgXcQ")["title"] == "already" # 기존 기록은 덮어쓰지 않음
+    assert archive.get("jNQXAC9IVRw")["completed_at"] is None
@@ -0,0 +1,31 @@
+from downloader import DownloadWorker, WorkerListener
+
+
+def _worker(tmp_path):
+    return DownloadWorker("https://youtu.be/dQw4w9WgXcQ", str(tmp_path), "best", WorkerListener(), False)
+
+
+def test_remove_partial_files_deletes_files_of_this_run(tmp_path):
+    worker = _worker(tmp_path)
+    video = tmp_path / "title [dQw4w9WgXcQ].f137.mp4"
+    part = tmp_path / "title [dQw4w9WgXcQ].f137.mp4.part"
+    fragment = tmp_path / "title [dQw4w9WgXcQ].f137.mp4.part-Frag3"
+    for path in (part, fragment):
+        path.write_bytes(b"x")
+    worker._on_progress({
+        "status": "downloading", "filename": str(video), "tmpfilename": str(part), "downloaded_bytes": 1,
+    })
+    video.write_bytes(b"x") # 전송 완료 후 .part 이름 변경
+    part.unlink()
+    worker._on_progress({"status": "finished", "filename": str(video), "downloaded_bytes": 1})
+    worker._remove_partial_files()
+    assert not any(path.exists() for path in (video, part, fragment))
+
+
+def test_remove_partial_files_keeps_already_downloaded_file(tmp_path):
+    worker = _worker(tmp_path)
+    existing = tmp_path / "title [dQw4w9WgXcQ].mp4"
+    existing.write_bytes(b"x")
+    worker._on_progress({"status": "finished", "filename": str(existing), "total_bytes": 1}) # "has already been downloaded"
+    worker._remove_partial_files()
+    assert existing.exists()
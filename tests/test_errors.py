@@ -0,0 +1,72 @@
+import socket
+import sys
+import urllib.error
+
+import pytest
+from yt_dlp.networking.exceptions import TransportError
+from yt_dlp.utils import DownloadCancelled, DownloadError, ExtractorError, PostProcessingError
+
+import errors
+
+
+def _http_error(status):
+    return urllib.error.HTTPError("https://example.com", status, "error", {}, None)
+
+
+def _download_error(cause):
+    """yt-dlp 가 워커에 던지는 것과 같은 형태로 원래 예외를 감싼 DownloadError."""
+    try:
+        raise cause
+    except Exception:
+        return DownloadError(f"ERROR: {cause}", sys.exc_info())
+
+
+@pytest.mark.parametrize("error, kind", [
+    (_http_error(429), errors.RATE_LIMITED),
+    (_http_error(403), errors.FORBIDDEN),
+    (_http_error(503), errors.NETWORK),
+    (_http_error(408), errors.NETWORK),
+    (TransportError("connection reset"), errors.NETWORK),
+    (ConnectionResetError(), errors.NETWORK),
+    (socket.timeout(), errors.NETWORK),
+    (PostProcessingError("merge failed"), errors.FFMPEG),
+    (DownloadCancelled(), errors.CANCELLED),
+    (ExtractorError("Private video", expected=True), errors.EXTRACTOR),
+    (ValueError("?"), errors.UNKNOWN),
+])
+def test_classify_error(error, kind):
+    assert errors.classify_error(error) == kind
+
+
+def test_classify_error_unwraps_download_error():
+    assert errors.classify_error(_download_error(_http_error(429))) == errors.RATE_LIMITED
+    assert errors.classify_error(_download_error(TransportError("timed out"))) == errors.NETWORK
+
+
+def test_classify_error_checks_cause_of_extractor_error():
+    error = ExtractorError("Unable to download webpage", cause=TransportError("timed out"))
+    assert errors.classify_error(error) == errors.NETWORK
+
+
+def test_classify_error_reads_status_from_message():
+    assert errors.classify_error(DownloadError("ERROR: unable to download video data: HTTP Error 403: Forbidden")) \
+        == errors.FORBIDDEN
+    assert errors.classify_error(DownloadError("ERROR: HTTP Error 404: Not Found")) == errors.UNKNOWN
+
+
+def test_is_transient():
+    assert all(errors.is_transient(kind) for kind in (errors.NETWORK, errors.FORBIDDEN, errors.RATE_LIMITED))
+    assert not any(errors.is_transient(kind) for kind in (errors.EXTRACTOR, errors.FFMPEG, errors.CANCELLED))
+
+
+@pytest.mark.parametrize("attempt", range(6))
+def test_retry_delay_doubles_with_jitter(attempt):
+    delay = min(errors.RETRY_MAX_DELAY, errors.RETRY_BASE_DELAY * 2 ** attempt)
+    for _ in range(20):
+        assert delay / 2 <= errors.retry_delay(errors.NETWORK, attempt) <= delay
+
+
+def test_retry_delay_rate_limited_and_capped():
+    assert errors.retry_delay(errors.RATE_LIMITED, 0) >= errors.RATE_LIMIT_BASE_DELAY / 2
+    assert errors.retry_delay(errors.RATE_LIMITED, 20) <= errors.RETRY_MAX_DELAY
+    assert errors.retry_delay(errors.NETWORK, 20) >= errors.RETRY_MAX_DELAY / 2
@@ -0,0 +1,90 @@
+import pytest
+import yt_dlp
+
+from downloader import DownloadWorker
+from formatselect import FormatSelector
+
+
+def _format(format_id, ext, vcodec, acodec, height=None, fps=None, abr=None, tbr=None):
+    return {
+        "format_id": format_id, "ext": ext, "vcodec": vcodec, "acodec": acodec,
+        "height": height, "width": height and height * 16 // 9, "fps": fps, "abr": abr, "tbr": tbr,
+        "url": f"https://example.com/{format_id}", "protocol": "https",
+    }
+
+
+YOUTUBE_FORMATS = [ # YouTube 와 비슷한 구성: 360p/720p 단일 파일, 720p/1080p avc1 비디오, m4a/opus 오디오
+    _format("18", "mp4", "avc1.42001E", "mp4a.40.2", 360, 30, None, 500),
+    _format("22", "mp4", "avc1.64001F", "mp4a.40.2", 720, 30, 192, 1500),
+    _format("136", "mp4", "avc1.4d401f", "none", 720, 30, None, 1300),
+    _format("137", "mp4", "avc1.640028", "none", 1080, 30, None, 4000),
+    _format("140", "m4a", "none", "mp4a.40.2", None, None, 129, 129),
+    _format("251", "webm", "none", "opus", None, None, 135, 135),
+]
+
+
+def _select(formats, tolerance, quality="FHD"):
+    """워커와 같은 방식으로 FormatSelector 를 끼운 YoutubeDL 로 포맷을 고르고 (포맷 id, 확장자, 선택 경로)를 반환합니다."""
+    choices = []
+    ydl = yt_dlp.YoutubeDL({"format": DownloadWorker.QUALITY_MAPPING[quality], "quiet": True, "simulate": True})
+    ydl.format_selector = FormatSelector(ydl, ydl.format_selector, tolerance, on_choice=choices.append)
+    info = {
+        "id": "abc", "title": "t", "extractor": "generic", "extractor_key": "Generic",
+        "webpage_url": "https://example.com", "formats": [dict(f) for f in formats],
+    }
+    result = ydl.process_ie_result(info, download=False)
+    return result["format_id"], result["ext"], choices[-1] if choices else None
+
+
+@pytest.mark.parametrize("tolerance, expected", [
+    (0.0, ("137+251", "mkv", FormatSelector.DEFAULT)), # 손실 불허: 기준 (opus 가 더 좋아 mkv 로 병합)
+    (0.3, ("137+140", "mp4", FormatSelector.COMPATIBLE_PAIR)), # 오디오 비트레이트 손실만 허용: mp4 쌍
+    (0.4, ("22", "mp4", FormatSelector.SINGLE)), # 1080p -> 720p 허용: 병합 없는 단일 파일
+])
+def test_tolerance_decides_path(tolerance, expected):
+    assert _select(YOUTUBE_FORMATS, tolerance) == expected
+
+
+def _small_formats(single_abr, single_fps=30, audio_abr=129):
+    """360p 단일 파일(18)과 같은 해상도의 비디오(134) + 오디오(140) 쌍."""
+    return [
+        _format("18", "mp4", "avc1", "mp4a.40.2", 360, single_fps, single_abr, 500),
+        _format("134", "mp4", "avc1", "none", 360, 30, None, 300),
+        _format("140", "m4a", "none", "mp4a.40.2", None, None, audio_abr, 129),
+    ]
+
+
+def test_single_without_loss():
+    assert _select(_small_formats(single_abr=129), 0.0) == ("18", "mp4", FormatSelector.SINGLE)
+
+
+@pytest.mark.parametrize("formats", [
+    _small_formats(single_abr=None), # 단일 파일의 오디오 비트레이트를 모름
+    _small_formats(single_abr=96), # 오디오 비트레이트가 기준보다 낮음
+    _small_formats(single_abr=129, single_fps=None), # 단일 파일의 fps 를 모름
+])
+def test_unknown_or_lower_quality_is_loss(formats):
+    assert _select(formats, 0.0) == ("134+140", "mp4", FormatSelector.DEFAULT)
+
+
+def test_tolerance_allows_lower_audio_bitrate():
+    assert _select(_small_formats(single_abr=96), 0.3) == ("18", "mp4", FormatSelector.SINGLE)
+
+
+def test_audio_only_bitrate_falls_back_to_tbr():
+    assert _select(_small_formats(single_abr=129, audio_abr=None), 0.0) == ("18", "mp4", FormatSelector.SINGLE)
+
+
+def test_fps_counts_as_loss():
+    formats = YOUTUBE_FORMATS + [_format("299", "mp4", "avc1.64002a", "none", 1080, 60, None, 6000)]
+    # 1080p60 기준에서 720p30 단일 파일은 손실이 커서 허용 범위 밖: 1080p60 mp4 쌍
+    assert _select(formats, 0.4) == ("299+140", "mp4", FormatSelector.COMPATIBLE_PAIR)
+
+
+def test_does_not_exceed_quality_limit():
+    formats = YOUTUBE_FORMATS + [_format("96", "mp4", "avc1.640032", "mp4a.40.2", 2160, 30, 192, 20000)]
+    assert _select(formats, 0.4)[0] == "22" # 4K 단일 파일은 FHD 상한을 넘으므로 고르지 않음
+
+
+def test_non_merge_selection_unchanged():
+    assert _select(YOUTUBE_FORMATS, 0.4, "best") == ("22", "mp4", None)
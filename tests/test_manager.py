@@ -0,0 +1,145 @@
+import threading
+
+import pytest
+
+import errors
+from manager import DownloadJob, DownloadManager, _JobReporter
+
+
+class FakeWorker:
+    """네트워크 없이 release() 또는 stop() 이 호출될 때까지 실행 중으로 남는 워커."""
+
+    def __init__(self, job, listener):
+        self.job = job
+        self.listener = listener
+        self.released = threading.Event()
+        self.stopped = threading.Event()
+        self.done = threading.Event() # _run_job 이 끝남 (다음 작업 배치까지)
+
+    def run(self):
+        while not self.released.wait(0.01):
+            if self.stopped.is_set():
+                self.listener.error(self.job.url, "중단됨", errors.CANCELLED)
+                return
+        self.listener.finished(self.job.url, {"id": self.job.video_id, "title": self.job.url})
+
+    def stop(self, delete_partial=False):
+        self.stopped.set()
+
+
+class FakeManager(DownloadManager):
+    """작업을 FakeWorker 로 실행하고, 시작된 순서를 기록하는 DownloadManager."""
+
+    def __init__(self, concurrency):
+        self.started = [] # _dispatch 가 작업을 시작한 순서 (job_id)
+        self.workers = {}
+        super().__init__(concurrency, reuse_sessions=False)
+
+    def _create_worker(self, job):
+        worker = FakeWorker(job, _JobReporter(self, job))
+        self.started.append(job.job_id)
+        self.workers[job.job_id] = worker
+        return worker
+
+    def _run_job(self, job):
+        worker = job.worker
+        try:
+            super()._run_job(job)
+        finally:
+            worker.done.set()
+
+    def finish(self, job):
+        """실행 중인 작업을 완료시키고 다음 작업이 배치될 때까지 기다립니다."""
+        worker = self.workers[job.job_id]
+        worker.released.set()
+        assert worker.done.wait(5.0)
+
+
+def _submit(manager, name, priority=DownloadJob.PRIORITY_NORMAL):
+    return manager.submit(f"https://example.com/{name}", "/tmp", "best", False, priority=priority)
+
+
+@pytest.fixture
+def manager():
+    managers = []
+
+    def create(concurrency):
+        managers.append(FakeManager(concurrency))
+        return managers[-1]
+
+    yield create
+    for created in managers:
+        created.stop_all()
+        assert created.wait(5.0)
+
+
+def test_dispatch_by_priority_then_submission_order(manager):
+    manager = manager(1)
+    first = _submit(manager, "first")
+    low = _submit(manager, "low", DownloadJob.PRIORITY_LOW)
+    normal1 = _submit(manager, "normal1")
+    high = _submit(manager, "high", DownloadJob.PRIORITY_HIGH)
+    normal2 = _submit(manager, "normal2")
+    assert manager.started == [first.job_id]
+    for job in (first, high, normal1, normal2):
+        manager.finish(job)
+    assert manager.started == [first.job_id, high.job_id, normal1.job_id, normal2.job_id, low.job_id]
+    assert first.state == DownloadJob.COMPLETED
+
+
+def test_set_priority_and_move_to_front(manager):
+    manager = manager(1)
+    first = _submit(manager, "first")
+    a, b, c = _submit(manager, "a"), _submit(manager, "b"), _submit(manager, "c")
+    manager.set_priority(c.job_id, DownloadJob.PRIORITY_HIGH)
+    assert manager.move_to_front(b.job_id)
+    assert b.priority == DownloadJob.PRIORITY_HIGH # 맨 앞 작업의 우선순위로 올림
+    for job in (first, b, c):
+        manager.finish(job)
+    assert manager.started == [first.job_id, b.job_id, c.job_id, a.job_id]
+
+
+def test_pause_queued_and_running(manager):
+    manager = manager(1)
+    running, queued, other = _submit(manager, "running"), _submit(manager, "queued"), _submit(manager, "other")
+    assert manager.pause(queued.job_id)
+    assert queued.state == DownloadJob.PAUSED
+    assert manager.pause(running.job_id) # 실행 중: 중단 후 일시정지, 다음 작업 시작
+    assert manager.workers[running.job_id].done.wait(5.0)
+    assert running.state == DownloadJob.PAUSED
+    assert manager.started == [running.job_id, other.job_id]
+
+    manager.finish(other)
+    assert manager.wait(1.0) # 일시정지한 작업은 시작하지 않음
+    assert manager.resume(running.job_id)
+    assert manager.started[-1] == running.job_id
+    assert not manager.pause(other.job_id) # 이미 끝난 작업
+
+
+def test_lower_concurrency_preempts_lowest_priority_latest_job(manager):
+    manager = manager(3)
+    high = _submit(manager, "high", DownloadJob.PRIORITY_HIGH)
+    early = _submit(manager, "early")
+    late = _submit(manager, "late")
+    waiting = _submit(manager, "waiting")
+    manager.set_concurrency(2)
+    assert manager.workers[late.job_id].done.wait(5.0)
+    assert late.state == DownloadJob.QUEUED
+    assert manager._pending[0][2] == late.job_id # 선점된 작업은 대기열 맨 앞으로
+    assert high.state == early.state == DownloadJob.RUNNING
+
+    manager.finish(early)
+    assert manager.started[-1] == late.job_id # 선점된 작업이 먼저 재개
+    manager.finish(late)
+    assert manager.started[-1] == waiting.job_id
+
+
+def test_lower_concurrency_without_preempt_keeps_running_jobs(manager):
+    manager = manager(2)
+    first, second, waiting = _submit(manager, "first"), _submit(manager, "second"), _submit(manager, "waiting")
+    manager.set_concurrency(1, preempt=False)
+    assert first.state == second.state == DownloadJob.RUNNING
+    manager.finish(first)
+    assert waiting.job_id not in manager.started # 실행 중인 작업이 한도보다 많음: 새 작업을 시작하지 않음
+    manager.finish(second)
+    assert manager.started[-1] == waiting.job_id
@@ -0,0 +1,73 @@
+import pytest
+
+from utils import canonical_video_url, extract_video_id, scan_playlist_urls, scan_youtube_urls
+
+VIDEO_ID = "dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize("url", [
+    f"https://www.youtube.com/watch?v={VIDEO_ID}",
+    f"http://youtube.com/watch?v={VIDEO_ID}",
+    f"youtube.com/watch?v={VIDEO_ID}",
+    f"https://m.youtube.com/watch?v={VIDEO_ID}",
+    f"https://music.youtube.com/watch?v={VIDEO_ID}&list=RDAMVM{VIDEO_ID}",
+    f"https://www.youtube.com/watch?feature=share&v={VIDEO_ID}&t=42s",
+    f"https://youtu.be/{VIDEO_ID}?si=abc",
+    f"https://www.youtube.com/shorts/{VIDEO_ID}",
+    f"https://www.youtube.com/live/{VIDEO_ID}?feature=share",
+    f"https://www.youtube.com/embed/{VIDEO_ID}",
+    f"https://www.youtube-nocookie.com/embed/{VIDEO_ID}",
+    f"https://www.youtube.com/v/{VIDEO_ID}",
+    f"  https://youtu.be/{VIDEO_ID}  ",
+])
+def test_extract_video_id(url):
+    assert extract_video_id(url) == VIDEO_ID
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.youtube.com/watch?v=short",
+    f"https://www.youtube.com/watch?v={VIDEO_ID}x",
+    "https://www.youtube.com/playlist?list=PL1234567890",
+    f"https://notyoutube.com/watch?v={VIDEO_ID}",
+    f"https://example.com/{VIDEO_ID}",
+    "",
+])
+def test_extract_video_id_rejects(url):
+    assert extract_video_id(url) is None
+
+
+def test_scan_youtube_urls_finds_urls_in_text():
+    text = (
+        f"first https://youtu.be/{VIDEO_ID}, then\n"
+        "(https://www.youtube.com/shorts/abcdefghijk) and "
+        f"again https://m.youtube.com/watch?v={VIDEO_ID}&t=1"
+    )
+    assert scan_youtube_urls(text) == [
+        (VIDEO_ID, canonical_video_url(VIDEO_ID)),
+        ("abcdefghijk", canonical_video_url("abcdefghijk")),
+    ]
+
+
+@pytest.mark.parametrize("text", [
+    f"notyoutube.com/watch?v={VIDEO_ID}",
+    f"https://notyoutube.com/watch?v={VIDEO_ID}",
+    f"xyoutu.be/{VIDEO_ID}",
+    f"https://evil.youtu.be.example/{VIDEO_ID}x",
+    f"foo.youtube.com/watch?v={VIDEO_ID}",
+    f"my-youtube.com/watch?v={VIDEO_ID}",
+])
+def test_scan_youtube_urls_rejects_other_hosts(text):
+    assert scan_youtube_urls(text) == []
+
+
+def test_scan_playlist_urls():
+    text = (
+        "https://www.youtube.com/playlist?list=PLabc_123 "
+        "https://www.youtube.com/@some.channel "
+        "https://www.youtube.com/playlist?list=PLabc_123 "
+        "https://notyoutube.com/playlist?list=PLother"
+    )
+    assert scan_playlist_urls(text) == [
+        "https://www.youtube.com/playlist?list=PLabc_123",
+        "https://www.youtube.com/@some.channel",
+    ]
@@ -1,41 +1,18 @@
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPixmap, QCursor
-import requests
-from urllib.parse import parse_qs, urlparse
-
-
-class ThumbnailCache:
-    """
-    다운로드한 썸네일을 캐싱하는 클래스입니다.
-
-    메모리에 썸네일을 저장하여, 동일한 썸네일을 다시 다운로드하는 것을 방지하여 효율성을 높입니다.
-    """
-    def __init__(self):
-        """ThumbnailCache 초기화."""
-        self.thumbnails = {} # 썸네일 저장 딕셔너리 (video_id: QPixmap)
-
-    def get(self, video_id):
-        """
-        캐시에서 video_id에 해당하는 썸네일을 가져옵니다.
-
-        Args:
-            video_id (str): YouTube 비디오 ID
-
-        Returns:
-            QPixmap: 캐시에 썸네일이 있으면 QPixmap, 없으면 None
-        """
-        return self.thumbnails.get(video_id)
-
-    def set(self, video_id, pixmap):
-        """
-        캐시에 video_id와 썸네일(QPixmap)을 저장합니다.
-
-        Args:
-            video_id (str): YouTube 비디오 ID
-            pixmap (QPixmap): 썸네일 이미지 (QPixmap 객체)
-        """
-        self.thumbnails[video_id] = pixmap
+from PyQt5.QtWidgets import (
+    QApplication,
+    QLabel,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionProgressBar,
+    QStyleOptionViewItem,
+)
+from PyQt5.QtCore import QRect, QSize, Qt, QTimer
+from PyQt5.QtGui import QPalette, QPixmap, QCursor
+
+from .download_model import DownloadListModel
+from .thumbnail_cache import ThumbnailCache
+from .thumbnail_loader import ThumbnailLoader
 
 
 class ThumbnailLabel(QLabel):
@@ -61,124 +38,166 @@ class ThumbnailLabel(QLabel):
         self.hide() # 초기 상태: 숨김
 
 
-class DownloadItemWidget(QWidget):
+class DownloadItemDelegate(QStyledItemDelegate):
+    """
+    다운로드 목록의 각 행(URL 또는 제목, 진행률 표시줄, 자막 상태)을 직접 그리는 delegate 입니다.
+
+    행마다 위젯을 만드는 대신 DownloadListModel 의 값으로 화면에 보이는 행만 그리므로,
+    항목 수가 많아도 메모리와 다시 그리기 비용이 늘지 않습니다.
+    """
+    MARGIN = 6 # 행 안쪽 여백 (px)
+    SPACING = 8 # 영역 사이 간격 (px)
+    PROGRESS_WIDTH = 160 # 진행률 표시줄 너비 (px)
+
+    def paint(self, painter, option, index):
+        """QStyledItemDelegate override. 행 배경(선택/호버), 텍스트, 진행률 표시줄, 자막 상태를 그립니다."""
+        option = QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+
+        option.text = "" # 배경만 그리고 텍스트는 아래에서 배치
+        style.drawControl(QStyle.CE_ItemViewItem, option, painter, widget)
+
+        rect = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        metrics = option.fontMetrics
+        subtitle = index.data(DownloadListModel.SubtitleRole)
+        subtitle_width = metrics.horizontalAdvance(subtitle)
+        progress_width = min(self.PROGRESS_WIDTH, max(0, rect.width() - subtitle_width - 2 * self.SPACING) // 2)
+        subtitle_rect = QRect(rect.right() - subtitle_width + 1, rect.top(), subtitle_width, rect.height())
+        progress_rect = QRect(
+            subtitle_rect.left() - self.SPACING - progress_width, rect.top(), progress_width, rect.height()
+        )
+        text_rect = QRect(rect.left(), rect.top(), progress_rect.left() - self.SPACING - rect.left(), rect.height())
+
+        painter.save()
+        if option.state & QStyle.State_Selected:
+            painter.setPen(option.palette.color(QPalette.HighlightedText)) # 선택된 행 텍스트 색
+        else:
+            painter.setPen(option.palette.color(QPalette.Text))
+        text = metrics.elidedText(index.data(Qt.DisplayRole), Qt.ElideRight, text_rect.width()) # 긴 제목은 말줄임
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, text)
+        painter.drawText(subtitle_rect, Qt.AlignRight | Qt.AlignVCenter, subtitle)
+        painter.restore()
+
+        progress = QStyleOptionProgressBar() # 진행률 표시줄 (QProgressBar 위젯 없이 스타일로 그림)
+        progress.rect = progress_rect
+        progress.state = QStyle.State_Enabled | QStyle.State_Horizontal
+        progress.direction = option.direction
+        progress.fontMetrics = metrics
+        progress.palette = option.palette
+        progress.minimum = 0
+        progress.maximum = 100
+        progress.progress = int(index.data(DownloadListModel.ProgressRole))
+        progress.text = f"{progress.progress}%"
+        progress.textVisible = True
+        style.drawControl(QStyle.CE_ProgressBar, progress, painter, widget)
+
+    def sizeHint(self, option, index):
+        """QStyledItemDelegate override. 모든 행은 같은 높이입니다 (글자 높이 + 여백)."""
+        return QSize(option.rect.width(), option.fontMetrics.height() + 4 * self.MARGIN)
+
+
+class DownloadListView(QListView):
     """
-    다운로드 목록에 표시되는 각 다운로드 아이템 위젯입니다.
+    DownloadListModel 을 표시하는 다운로드 목록 뷰입니다.
 
-    YouTube URL, 진행률 표시줄, 자막 상태, 썸네일 미리보기 기능을 제공합니다.
+    모든 행의 높이가 같으므로(uniformItemSizes) 스크롤 시 화면에 보이는 행만 배치하고 그립니다.
+    마우스를 올린 행의 썸네일을 툴팁처럼 보여주며, 썸네일 창과 로더 연결은 뷰 하나에서 공유합니다.
     """
-    def __init__(self, url):
+    def __init__(self, parent=None):
         """
-        DownloadItemWidget 초기화.
+        DownloadListView 초기화.
 
         Args:
-            url (str): YouTube 비디오 URL
+            parent (QWidget, optional): 부모 위젯. Defaults to None.
         """
-        super().__init__()
-        self.url = url
-        self.thumbnail_cache = ThumbnailCache() # 썸네일 캐시 객체 생성
-        self.thumbnail_label = ThumbnailLabel() # 썸네일 라벨 객체 생성
-        self.setup_ui() # UI 설정
-        self.setup_thumbnail() # 썸네일 설정
-
+        super().__init__(parent)
+        self.setItemDelegate(DownloadItemDelegate(self)) # 행 그리기 delegate
+        self.setUniformItemSizes(True) # 행 높이 계산 생략 (항목이 많아도 배치 비용 일정)
         self.setMouseTracking(True) # 마우스 트래킹 활성화 (hover event 감지)
 
-        self.preview_timer = QTimer() # 썸네일 미리보기 타이머
+        self.thumbnail_cache = ThumbnailCache.instance() # 프로세스 전역 썸네일 캐시
+        self.thumbnail_label = ThumbnailLabel() # 썸네일 라벨 (뷰 전체에서 하나만 사용)
+        self.destroyed.connect(self.thumbnail_label.deleteLater) # 뷰와 함께 썸네일 라벨 삭제 (별도 창이므로 부모가 없음)
+        self.hovered_video_id = None # 마우스가 올라가 있는 행의 비디오 ID
+        self.awaiting_thumbnails = set() # 로드 요청 중인 비디오 ID 목록
+        ThumbnailLoader.instance().loaded.connect(self.on_thumbnail_loaded) # 로드 완료 시 on_thumbnail_loaded 슬롯 연결
+
+        self.preview_timer = QTimer(self) # 썸네일 미리보기 타이머
         self.preview_timer.setSingleShot(True) # 싱글샷 타이머 설정
         self.preview_timer.timeout.connect(self.show_thumbnail) # 타임아웃 시 show_thumbnail 호출
 
-    def setup_ui(self):
-        """UI 레이아웃 및 기본 위젯 설정."""
-        layout = QHBoxLayout()
-        self.label = QLabel(self.url) # URL 표시 라벨
-        self.progress_bar = QProgressBar() # 다운로드 진행률 표시줄
-        self.subtitle_label = QLabel("Subtitles: 준비 중") # 자막 상태 표시 라벨 (초기 상태 "준비 중"으로 변경)
-        layout.addWidget(self.label)
-        layout.addWidget(self.progress_bar)
-        layout.addWidget(self.subtitle_label)
-        self.setLayout(layout)
-
-    def setup_thumbnail(self):
-        """비디오 썸네일을 다운로드하고 캐시에 저장합니다."""
-        video_id = self.extract_video_id(self.url) # URL에서 비디오 ID 추출
-        if not video_id:
-            return # 비디오 ID 없으면 썸네일 설정 중단
-
-        if self.thumbnail_cache.get(video_id):
-            return # 캐시에 썸네일이 있으면 다운로드 생략
-
-        try:
-            thumbnail_url = f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg" # 고화질 썸네일 URL
-            response = requests.get(thumbnail_url, timeout=10) # 10초 타임아웃 설정
-            response.raise_for_status() # HTTP 에러 발생 시 예외 처리
-
-            pixmap = QPixmap()
-            pixmap.loadFromData(response.content) # 다운로드한 이미지 데이터로 QPixmap 생성
-            pixmap = pixmap.scaled(
-                320, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation # 썸네일 크기 조정 및 스무딩
-            )
-            self.thumbnail_cache.set(video_id, pixmap) # 썸네일을 캐시에 저장
-        except requests.exceptions.RequestException as e: # requests 관련 예외 처리 (네트워크 에러, 타임아웃 등)
-            print(f"Error loading thumbnail for {self.url}: {e}")
-        except Exception as e: # 기타 예외 처리
-            print(f"Unexpected error loading thumbnail for {self.url}: {e}")
-
-
-    def extract_video_id(self, url):
-        """YouTube URL에서 비디오 ID를 추출합니다."""
-        parsed_url = urlparse(url)
-        if parsed_url.hostname in ["www.youtube.com", "youtube.com"]:
-            if parsed_url.path == "/watch":
-                return parse_qs(parsed_url.query).get("v", [None])[0]
-            elif parsed_url.path.startswith("/shorts/"):
-                return parsed_url.path.split("/shorts/")[1].split("/")[0]
-        elif parsed_url.hostname == "youtu.be":
-            return parsed_url.path[1:]
-        return None # 비디오 ID 추출 실패 시 None 반환
-
-    def enterEvent(self, event):
-        """마우스 커서가 위젯 영역에 진입했을 때 이벤트 핸들러. 썸네일 미리보기 타이머 시작."""
-        self.preview_timer.start(100)  # 100ms 후 썸네일 표시 (delay)
+    def mouseMoveEvent(self, event):
+        """마우스 커서가 뷰 안에서 움직일 때 이벤트 핸들러. 다른 행으로 옮기면 미리보기를 다시 시작합니다."""
+        super().mouseMoveEvent(event)
+        index = self.indexAt(event.pos())
+        video_id = index.data(DownloadListModel.VideoIdRole) if index.isValid() else None
+        if video_id != self.hovered_video_id: # 다른 행으로 이동
+            self.hide_thumbnail()
+            self.hovered_video_id = video_id
+            if video_id:
+                self.preview_timer.start(100)  # 100ms 후 썸네일 표시 (delay)
+        elif self.thumbnail_label.isVisible(): # 썸네일이 표시 중일 때만 위치 업데이트
+            self.update_thumbnail_position()
 
     def leaveEvent(self, event):
-        """마우스 커서가 위젯 영역을 벗어났을 때 이벤트 핸들러. 썸네일 미리보기 타이머 중지 및 썸네일 숨김."""
+        """마우스 커서가 뷰 영역을 벗어났을 때 이벤트 핸들러. 썸네일 미리보기 타이머 중지 및 썸네일 숨김."""
+        super().leaveEvent(event)
+        self.hide_thumbnail()
+        self.hovered_video_id = None
+
+    def scrollContentsBy(self, dx, dy):
+        """QListView override. 스크롤하면 커서 아래 행이 바뀌므로 썸네일을 숨깁니다."""
+        super().scrollContentsBy(dx, dy)
+        self.hide_thumbnail()
+        self.hovered_video_id = None
+
+    def hide_thumbnail(self):
+        """썸네일 미리보기 타이머를 중지하고 썸네일을 숨깁니다."""
         self.preview_timer.stop() # 타이머 중지
         self.thumbnail_label.hide() # 썸네일 라벨 숨김
 
-    def mouseMoveEvent(self, event):
-        """마우스 커서가 위젯 영역 내에서 움직일 때 이벤트 핸들러. 썸네일 위치 업데이트."""
-        if self.thumbnail_label.isVisible(): # 썸네일이 표시 중일 때만 위치 업데이트
-            self.update_thumbnail_position()
-
     def update_thumbnail_position(self):
         """썸네일 라벨의 위치를 마우스 커서 위치에 상대적으로 조정합니다."""
         cursor_pos = QCursor.pos() # 현재 마우스 커서 위치
         self.thumbnail_label.move(cursor_pos.x() + 10, cursor_pos.y() + 10) # 썸네일 위치 조정 (커서 오른쪽 아래 10px 옵셋)
 
     def show_thumbnail(self):
-        """썸네일을 현재 마우스 커서 위치에 표시합니다."""
-        video_id = self.extract_video_id(self.url) # 비디오 ID 추출
+        """
+        마우스가 올라가 있는 행의 썸네일을 현재 마우스 커서 위치에 표시합니다.
+        캐시에 없으면 ThumbnailLoader 에 로드를 요청하고, 로드가 끝났을 때 아직 같은 행 위에 있으면 표시합니다.
+        """
+        video_id = self.hovered_video_id
         if not video_id:
             return # 비디오 ID 없으면 썸네일 표시 중단
 
         thumbnail = self.thumbnail_cache.get(video_id) # 캐시에서 썸네일 가져오기
         if not thumbnail:
-            return # 캐시에 썸네일 없으면 표시 중단
+            if video_id not in self.awaiting_thumbnails: # 화면에서 미리보기한 행만 로드 (디스크 캐시 -> 네트워크 순)
+                self.awaiting_thumbnails.add(video_id)
+                ThumbnailLoader.instance().request(video_id) # 백그라운드 로드 요청 (즉시 반환)
+            return
 
         self.thumbnail_label.setPixmap(thumbnail) # 썸네일 라벨에 이미지 설정
         self.thumbnail_label.adjustSize() # 라벨 크기를 이미지 크기에 맞게 조정
         self.update_thumbnail_position() # 썸네일 위치 업데이트
         self.thumbnail_label.show() # 썸네일 라벨 표시
 
+    def on_thumbnail_loaded(self, video_id, image):
+        """
+        ThumbnailLoader 의 로드 완료 시그널을 처리합니다. 요청한 썸네일이면 캐시에 저장하고,
+        마우스가 아직 해당 행 위에 있으면 바로 표시합니다.
 
-    def update_progress(self, percent):
-        """다운로드 진행률 표시줄을 업데이트합니다."""
-        self.progress_bar.setValue(int(percent)) # 진행률 값 설정 (int 형변환)
-
-    def update_subtitle_status(self, status):
-        """자막 다운로드 상태 레이블을 업데이트합니다."""
-        self.subtitle_label.setText(f"자막: {status}") # 자막 상태 텍스트 설정
-
-    def __del__(self):
-        """DownloadItemWidget 소멸자. 썸네일 라벨 객체를 명시적으로 삭제합니다."""
-        self.thumbnail_label.deleteLater() # 썸네일 라벨 삭제 (메모리 누수 방지)
\ No newline at end of file
+        Args:
+            video_id (str): YouTube 비디오 ID
+            image (QImage): 크기 조정된 썸네일 이미지 (실패 시 빈 이미지)
+        """
+        if video_id not in self.awaiting_thumbnails:
+            return # 이 뷰에서 요청하지 않은 썸네일
+        self.awaiting_thumbnails.discard(video_id)
+        if image.isNull():
+            return # 로드 실패
+        self.thumbnail_cache.set(video_id, QPixmap.fromImage(image)) # GUI 스레드에서 QPixmap 변환 후 캐시에 저장
+        if video_id == self.hovered_video_id: # 마우스가 올라가 있으면 미리보기 즉시 표시
+            self.show_thumbnail()
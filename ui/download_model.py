@@ -0,0 +1,182 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from utils import extract_video_id
+
+
+class DownloadEntry:
+    """다운로드 목록의 한 행에 표시할 상태입니다. 행마다 위젯을 만들지 않고 값만 저장합니다."""
+    __slots__ = ("job_id", "url", "video_id", "title", "status", "percent", "subtitle_status")
+
+    def __init__(self, job_id, url):
+        """
+        DownloadEntry 초기화.
+
+        Args:
+            job_id (int): 작업 ID
+            url (str): YouTube 비디오 URL
+        """
+        self.job_id = job_id
+        self.url = url
+        self.video_id = extract_video_id(url) # 썸네일 미리보기용 비디오 ID
+        self.title = None # 비디오 제목 (정보를 가져온 뒤 설정)
+        self.status = None # 표시 상태 (None, "postprocessing", "complete", "error", "paused", "cancelled", "retrying")
+        self.percent = 0.0 # 다운로드 진행률 (%)
+        self.subtitle_status = "준비 중" # 자막 상태
+
+    @property
+    def display_name(self):
+        """목록에 표시할 이름. 제목을 알면 제목, 아니면 URL."""
+        return self.title or self.url
+
+
+class DownloadListModel(QAbstractListModel):
+    """
+    다운로드 목록 모델입니다. 작업별 상태를 DownloadEntry 로 저장하고, 그리기는 DownloadItemDelegate 가 담당합니다.
+
+    행마다 위젯(진행률 표시줄, 라벨, 썸네일 툴팁 창)을 만들지 않으므로, 항목이 수만 개여도
+    메모리는 항목 수에 비례해 조금씩만 늘고 화면에 보이는 행만 다시 그립니다.
+    작업 ID 로 행 번호를 O(1) 에 찾을 수 있도록 인덱스를 유지합니다.
+    """
+    JobIdRole = Qt.UserRole # 작업 ID (int)
+    ProgressRole = Qt.UserRole + 1 # 다운로드 진행률 (float, %)
+    SubtitleRole = Qt.UserRole + 2 # 자막 상태 텍스트 (str)
+    VideoIdRole = Qt.UserRole + 3 # 비디오 ID (str, 없으면 None)
+
+    STATUS_PREFIXES = { # 상태별 표시 텍스트 앞머리
+        "complete": "다운로드 완료: ",
+        "error": "다운로드 실패: ",
+        "paused": "일시정지: ",
+        "postprocessing": "병합 중: ",
+        "cancelled": "취소됨: ",
+        "retrying": "재시도 대기: ",
+    }
+
+    def __init__(self, parent=None):
+        """
+        DownloadListModel 초기화.
+
+        Args:
+            parent (QObject, optional): 부모 객체. Defaults to None.
+        """
+        super().__init__(parent)
+        self.entries = [] # 행 목록 (DownloadEntry)
+        self.rows = {} # 작업 ID 인덱스 (작업 ID: 행 번호)
+
+    def rowCount(self, parent=QModelIndex()):
+        """QAbstractListModel override. 행 수를 반환합니다."""
+        if parent.isValid():
+            return 0 # 리스트 모델: 하위 항목 없음
+        return len(self.entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """QAbstractListModel override. 행의 역할(role)별 값을 반환합니다."""
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        if role == Qt.DisplayRole:
+            return self.STATUS_PREFIXES.get(entry.status, "") + entry.display_name
+        if role == Qt.ToolTipRole:
+            return entry.url if entry.title else None # 제목을 표시하는 경우 URL 은 툴팁으로 표시
+        if role == self.JobIdRole:
+            return entry.job_id
+        if role == self.ProgressRole:
+            return entry.percent
+        if role == self.SubtitleRole:
+            return f"자막: {entry.subtitle_status}"
+        if role == self.VideoIdRole:
+            return entry.video_id
+        return None
+
+    def add_job(self, job_id, url):
+        """
+        목록 끝에 작업 행을 추가합니다.
+
+        Args:
+            job_id (int): 작업 ID
+            url (str): YouTube 비디오 URL
+        """
+        row = len(self.entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.entries.append(DownloadEntry(job_id, url))
+        self.rows[job_id] = row
+        self.endInsertRows()
+
+    def remove_jobs(self, job_ids):
+        """
+        작업 행들을 한 번에 제거합니다. 남은 행으로 목록과 인덱스를 다시 만듭니다 (O(n)).
+
+        Args:
+            job_ids (iterable[int]): 제거할 작업 ID 목록
+        """
+        removed = set(job_ids) & self.rows.keys()
+        if not removed:
+            return
+        self.beginResetModel() # 흩어진 행을 하나씩 지우면 O(n^2) 이므로 한 번에 재구성
+        self.entries = [entry for entry in self.entries if entry.job_id not in removed]
+        self.rows = {entry.job_id: row for row, entry in enumerate(self.entries)}
+        self.endResetModel()
+
+    def job_ids(self):
+        """목록에 있는 작업 ID 목록을 반환합니다."""
+        return list(self.rows)
+
+    def set_title(self, job_id, title):
+        """
+        비디오 제목을 설정합니다.
+
+        Args:
+            job_id (int): 작업 ID
+            title (str): 비디오 제목
+        """
+        entry = self._entry(job_id)
+        if entry is not None:
+            entry.title = title
+            self._changed(job_id)
+
+    def set_status(self, job_id, status, percent=None, subtitle_status=None):
+        """
+        작업의 표시 상태를 변경합니다.
+
+        Args:
+            job_id (int): 작업 ID
+            status (str): 표시 상태 (None, "postprocessing", "complete", "error", "paused", "cancelled", "retrying")
+            percent (float, optional): 함께 변경할 진행률. Defaults to None (유지).
+            subtitle_status (str, optional): 함께 변경할 자막 상태. Defaults to None (유지).
+        """
+        entry = self._entry(job_id)
+        if entry is None:
+            return # 목록에서 이미 제거된 작업
+        entry.status = status
+        if percent is not None:
+            entry.percent = percent
+        if subtitle_status is not None:
+            entry.subtitle_status = subtitle_status
+        self._changed(job_id)
+
+    def set_progress(self, progress):
+        """
+        여러 작업의 진행률을 한 번에 변경하고, 바뀐 행 범위에 대해 dataChanged 를 한 번만 보냅니다.
+
+        Args:
+            progress (dict): 작업 ID: 진행률(%)
+        """
+        changed_rows = []
+        for job_id, percent in progress.items():
+            row = self.rows.get(job_id)
+            if row is not None:
+                self.entries[row].percent = percent
+                changed_rows.append(row)
+        if changed_rows:
+            self.dataChanged.emit( # 뷰는 화면에 보이는 행만 다시 그림
+                self.index(min(changed_rows)), self.index(max(changed_rows)), [self.ProgressRole]
+            )
+
+    def _entry(self, job_id):
+        """작업 ID 에 해당하는 DownloadEntry. 없으면 None."""
+        row = self.rows.get(job_id)
+        return None if row is None else self.entries[row]
+
+    def _changed(self, job_id):
+        """작업 행이 바뀌었음을 뷰에 알립니다."""
+        index = self.index(self.rows[job_id])
+        self.dataChanged.emit(index, index)
@@ -0,0 +1,103 @@
+import time
+
+from PyQt5.QtWidgets import (
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+import errors
+
+
+class ErrorPanel(QWidget):
+    """
+    다운로드 에러를 모아서 보여주는 패널입니다. 메시지 박스와 달리 이벤트 루프를 막지 않으므로,
+    에러가 한꺼번에 많이 발생해도 다른 다운로드의 진행률 표시가 멈추지 않습니다.
+
+    에러마다 한 행(시간, 분류, 항목, 내용)을 추가하고, 위쪽 요약 줄에 분류별 건수를 표시합니다.
+    자동 재시도가 예약된 에러는 최종 실패와 구분하여 표시합니다. 첫 에러가 발생하면 패널이 나타납니다.
+
+    Attributes:
+        MAX_ENTRIES (int): 보관할 최대 행 수 (넘으면 오래된 행부터 삭제, 요약 건수는 유지)
+    """
+    MAX_ENTRIES = 500
+
+    def __init__(self, parent=None):
+        """
+        ErrorPanel 초기화.
+
+        Args:
+            parent (QWidget, optional): 부모 위젯. Defaults to None.
+        """
+        super().__init__(parent)
+        self.counts = {} # 분류별 에러 건수 (에러 분류: 건수)
+        self.failed = 0 # 최종 실패 건수
+        self.retrying = 0 # 재시도가 예약된 에러 건수
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        header = QHBoxLayout()
+        self.summary_label = QLabel() # 분류별 건수 요약
+        header.addWidget(self.summary_label, 1)
+        self.clear_button = QPushButton("지우기") # 목록과 건수 초기화
+        self.clear_button.clicked.connect(self.clear)
+        header.addWidget(self.clear_button)
+        self.hide_button = QPushButton("숨기기") # 패널 숨기기 (다음 에러 시 다시 표시)
+        self.hide_button.clicked.connect(self.hide)
+        header.addWidget(self.hide_button)
+        layout.addLayout(header)
+
+        self.tree = QTreeWidget() # 에러 목록 (최근 에러가 위)
+        self.tree.setHeaderLabels(["시간", "분류", "항목", "내용"])
+        self.tree.setRootIsDecorated(False)
+        self.tree.setUniformRowHeights(True) # 행 높이 계산 생략 (행이 많아도 빠르게 그림)
+        self.tree.setMaximumHeight(160)
+        layout.addWidget(self.tree)
+        self.hide() # 초기 상태: 숨김 (첫 에러 시 표시)
+
+    def add_error(self, kind, item, message, retry_delay=None):
+        """
+        에러 한 건을 목록 맨 위에 추가하고 요약을 갱신합니다. 패널이 숨겨져 있으면 표시합니다 (포커스는 가져오지 않음).
+
+        Args:
+            kind (str): 에러 분류 (errors.NETWORK, RATE_LIMITED 등)
+            item (str): 에러가 발생한 항목 (비디오 제목 또는 URL)
+            message (str): 에러 메시지
+            retry_delay (float, optional): 자동 재시도까지 대기 시간(초). Defaults to None (최종 실패).
+        """
+        if retry_delay is None:
+            self.failed += 1
+        else:
+            self.retrying += 1
+            message = f"{retry_delay:.0f}초 후 다시 시도 - {message}"
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        row = QTreeWidgetItem([time.strftime("%H:%M:%S"), errors.label(kind), item, message.splitlines()[0]])
+        row.setToolTip(3, message) # 여러 줄 메시지 전체는 툴팁으로
+        self.tree.insertTopLevelItem(0, row)
+        while self.tree.topLevelItemCount() > self.MAX_ENTRIES:
+            self.tree.takeTopLevelItem(self.tree.topLevelItemCount() - 1) # 가장 오래된 행 삭제
+        self._update_summary()
+        self.show()
+
+    def clear(self):
+        """에러 목록과 건수를 초기화합니다."""
+        self.tree.clear()
+        self.counts.clear()
+        self.failed = self.retrying = 0
+        self._update_summary()
+
+    def _update_summary(self):
+        """요약 줄을 갱신합니다. 예: `오류 15건 (실패 3, 재시도 12) - HTTP 429 12, 네트워크 1, 정보 추출 2`."""
+        total = self.failed + self.retrying
+        if not total:
+            self.summary_label.setText("오류 없음")
+            return
+        by_kind = ", ".join(
+            f"{errors.label(kind)} {count}"
+            for kind, count in sorted(self.counts.items(), key=lambda entry: -entry[1])
+        )
+        self.summary_label.setText(f"오류 {total}건 (실패 {self.failed}, 재시도 {self.retrying}) - {by_kind}")
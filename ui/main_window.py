@@ -1,24 +1,33 @@
 import os
-from threading import Lock
 
-from PyQt5.QtCore import QTimer, QThreadPool
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import (
     QMainWindow,
+    QMenu,
     QWidget,
     QVBoxLayout,
     QPushButton,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
     QMessageBox,
 )
 
-from downloader import WorkerSignals, DownloadWorker
-from utils import YOUTUBE_REGEX, extract_video_id
-
-
-from .download_item import DownloadItemWidget
+from api import JobApiServer
+from archive import DownloadArchive
+from config import get_app_data_dir
+from infocache import InfoCache
+from jobstore import JobStore
+from library import LibraryIndex
+from manager import DownloadJob, DownloadManager
+from metrics import MetricsRecorder, MetricsServer
+from startup import lazy_import
+from watchfolder import WatchFolder
+
+
+from .download_item import DownloadListView
+from .download_model import DownloadListModel
+from .error_panel import ErrorPanel
 from .settings_dialog import SettingsDialog
+from .signals import WorkerSignals, SignalListener
 
 
 class MainWindow(QMainWindow):
@@ -26,10 +35,16 @@ class MainWindow(QMainWindow):
     어플리케이션 메인 윈도우 클래스입니다.
 
     - 클립보드 감시 (YouTube URL 감지)
-    - 다운로드 관리 (시작, 진행률 표시, 완료/에러 처리)
+    - 다운로드 관리 (시작, 진행률 표시, 완료/에러 처리, 에러 패널)
     - UI 업데이트
     - 설정 관리 (SettingsDialog 연동)
+
+    Attributes:
+        PROGRESS_REFRESH_INTERVAL_MS (int): 진행률 표시 갱신 주기 (밀리초, 약 15Hz)
+        SHUTDOWN_TIMEOUT (float): 종료 시 작업 중단 및 자식 프로세스 종료를 각각 기다리는 최대 시간 (초)
     """
+    PROGRESS_REFRESH_INTERVAL_MS = 66
+    SHUTDOWN_TIMEOUT = 5.0 # 종료 시 실행 중인 작업이 중단되기를 기다리는 최대 시간 (초)
     def __init__(self, config, clipboard):
         """
         MainWindow 초기화.
@@ -42,14 +57,13 @@ class MainWindow(QMainWindow):
         self.config = config # 설정 객체 저장
         self.clipboard = clipboard # 클립보드 객체 저장
 
-        self.downloaded_urls = set() # 다운로드 완료된 URL 목록 (중복 다운로드 방지)
-        self.active_downloads = {} # 현재 활성 다운로드 worker 목록 (URL: Worker 객체)
-        self.download_progress = {} # 다운로드 진행률 정보 (URL: 진행률%)
-        self.clipboard_lock = Lock() # 클립보드 접근 lock (thread-safe)
+        self.active_downloads = {} # 현재 활성 다운로드 작업 목록 (작업 ID: DownloadJob 객체)
+        self.download_progress = {} # 다운로드 진행률 정보 (작업 ID: 진행률%)
 
         self._setup_window() # 윈도우 UI 설정
-        self._setup_threadpool() # 스레드 풀 설정
+        self._setup_download_manager() # 다운로드 매니저 설정
         self._setup_clipboard_monitoring() # 클립보드 감시 설정
+        QTimer.singleShot(0, self.download_manager.restore) # 창을 먼저 표시한 뒤 이전 실행에서 끝나지 않은 작업 이어받기
 
     def _setup_window(self):
         """메인 윈도우 UI 기본 설정 (타이틀, 크기, 레이아웃)."""
@@ -63,22 +77,127 @@ class MainWindow(QMainWindow):
 
         self._create_status_label() # 상태 표시 라벨 생성 및 추가
         self._create_download_list() # 다운로드 목록 리스트 위젯 생성 및 추가
+        self._create_error_panel() # 에러 패널 생성 및 추가 (첫 에러 시 표시)
+        self._create_clear_button() # 완료 항목 정리 버튼 생성 및 추가
         self._create_settings_button() # 설정 버튼 생성 및 추가
 
-    def _setup_threadpool(self):
-        """다운로드 작업 스레드 풀 설정."""
-        self.threadpool = QThreadPool() # 스레드 풀 생성
-        self.threadpool.setMaxThreadCount(self.config.concurrent_downloads) # 동시 다운로드 수 설정 적용
+    def _setup_download_manager(self):
+        """다운로드 매니저 설정. 매니저 이벤트를 WorkerSignals 를 통해 GUI 스레드 슬롯으로 연결합니다."""
+        self.signals = WorkerSignals() # GUI 스레드에서 시그널 객체 생성
+        self.signals.added.connect(self.on_job_added) # 작업 추가 시 on_job_added 슬롯 연결
+        self.signals.finished.connect(self.on_download_finished) # 다운로드 완료 시 on_download_finished 슬롯 연결
+        self.signals.error.connect(self.on_download_error) # 다운로드 에러 시 on_download_error 슬롯 연결
+        self.signals.retrying.connect(self.on_job_retrying) # 자동 재시도 예약 시 on_job_retrying 슬롯 연결
+        self.signals.info.connect(self.on_job_info) # 비디오 정보 수신 시 on_job_info 슬롯 연결
+        self.signals.postprocessing.connect(self.on_job_postprocessing) # 병합 시작 시 on_job_postprocessing 슬롯 연결
+        self.signals.paused.connect(self.on_job_paused) # 작업 일시정지 시 on_job_paused 슬롯 연결
+        self.signals.queued.connect(self.on_job_queued) # 작업 재개/선점 시 on_job_queued 슬롯 연결
+        self.signals.cancelled.connect(self.on_job_cancelled) # 작업 취소 시 on_job_cancelled 슬롯 연결
+        self.signals.playlist_expanded.connect(self.on_playlist_expanded) # 재생목록 펼치기 완료 시 슬롯 연결
+        self.signals.playlist_failed.connect(self.on_playlist_failed) # 재생목록 펼치기 에러 시 슬롯 연결
+        self.signals.concurrency_changed.connect(self.on_concurrency_changed) # 동시 다운로드 수 변경(자동 조절) 시 슬롯 연결
+
+        self.archive = DownloadArchive( # 다운로드 완료 기록 (비디오 ID 기준, 재시작 후에도 유지)
+            os.path.join(get_app_data_dir(), DownloadArchive.DEFAULT_FILENAME)
+        )
+        self.process_pool = None # 프로세스 모드에서 사용하는 프로세스 풀 (설정에서 켰을 때 생성)
+        if self.config.use_process_pool: # 프로세스 모드를 켠 경우에만 import (multiprocessing 등, 시작 시간 단축)
+            self.process_pool = lazy_import("procpool").ProcessPool(self.config.concurrent_downloads)
+        self.job_store = JobStore( # 끝나지 않은 작업 기록 (종료/비정상 종료 후 다음 실행 시 이어받기)
+            os.path.join(get_app_data_dir(), JobStore.DEFAULT_FILENAME)
+        )
+        self.library = LibraryIndex( # 다운로드 폴더 인덱스 (비디오 ID: 파일 경로)
+            os.path.join(get_app_data_dir(), LibraryIndex.DEFAULT_FILENAME)
+        )
+        self.metrics = MetricsRecorder( # 작업 실행별 성능 지표 기록 (JSON lines)
+            os.path.join(get_app_data_dir(), MetricsRecorder.DEFAULT_FILENAME)
+        )
+        self.metrics_server = None # 성능 지표 서버 (설정에서 포트를 지정했을 때 생성)
+        self._apply_metrics_port()
+        self.download_manager = DownloadManager( # GUI 와 독립적인 다운로드 스케줄러 생성
+            concurrency=self.config.concurrent_downloads, # 동시 다운로드 수 설정 적용
+            listener=SignalListener(self.signals), # 매니저 이벤트 -> Qt 시그널 변환
+            archive=self.archive, # 완료 시 아카이브에 기록
+            bandwidth_limit=self.config.bandwidth_limit * 1024, # 전체 대역폭 제한 (KB/s -> 바이트/초)
+            store=self.job_store, # 작업 추가/상태 변경 시 기록
+            info_cache=InfoCache( # 비디오 정보 캐시 (재시도/재개/품질 변경 시 추출 생략)
+                os.path.join(get_app_data_dir(), InfoCache.DEFAULT_DIRNAME)
+            ),
+            process_pool=self.process_pool, # 설정에 따라 작업을 자식 프로세스에서 실행
+            library=self.library, # 이미 다운로드 폴더에 있는 비디오는 네트워크 요청 없이 건너뜀
+            metrics=self.metrics, # 단계별 소요 시간, 속도, 재시도 등 기록
+            postprocess_concurrency=self.config.postprocess_concurrency, # 병합은 다운로드 슬롯과 별도 한도로 실행
+            max_retries=self.config.max_retries, # 네트워크 오류, HTTP 403/429 자동 재시도 횟수
+            auto_concurrency_max=self.config.auto_concurrency_max, # 처리량/에러에 따라 동시 다운로드 수 자동 조절 (0 이면 고정)
+            format_tolerance=self.config.format_tolerance / 100, # 병합 생략 허용 화질 손실 (% -> 비율)
+        )
+        self.api_server = None # 로컬 API 서버 (설정에서 포트를 지정했을 때 생성)
+        self.watch_folder = None # 감시 폴더 (설정에서 폴더를 지정했을 때 생성)
+        self._apply_api_port()
+        self._apply_watch_folder()
+
+        self.progress_timer = QTimer() # 진행률 표시 갱신 타이머 (청크 수신 빈도와 무관하게 고정 주기로 갱신)
+        self.progress_timer.timeout.connect(self.refresh_progress) # 타임아웃 시 refresh_progress 슬롯 호출
+        self.progress_timer.start(self.PROGRESS_REFRESH_INTERVAL_MS)
+
+    def _apply_metrics_port(self):
+        """설정된 포트로 성능 지표 서버를 시작하거나 다시 시작합니다 (0 이면 중지)."""
+        if self.metrics_server is not None:
+            if self.metrics_server.port == self.config.metrics_port:
+                return # 변경 없음
+            self.metrics_server.close()
+            self.metrics_server = None
+        if self.config.metrics_port:
+            try:
+                self.metrics_server = MetricsServer(self.metrics, self.config.metrics_port)
+            except OSError as e: # 포트 사용 중 등
+                QMessageBox.warning(
+                    self, "성능 지표 서버 오류", f"포트 {self.config.metrics_port} 을(를) 사용할 수 없습니다: {e}"
+                )
 
-    def _setup_clipboard_monitoring(self):
-        """클립보드 감시 기능 설정 (시그널-슬롯 연결, 타이머 설정)."""
-        self.last_clipboard = self.clipboard.text() # 초기 클립보드 내용 저장
-        self.clipboard.dataChanged.connect(self.on_clipboard_change) # 클립보드 변경 시 on_clipboard_change 슬롯 호출
+    def _apply_api_port(self):
+        """설정된 포트로 로컬 API 서버를 시작하거나 다시 시작합니다 (0 이면 중지)."""
+        if self.api_server is not None:
+            if self.api_server.port == self.config.api_port:
+                return # 변경 없음
+            self.api_server.close()
+            self.api_server = None
+        if self.config.api_port:
+            try:
+                self.api_server = JobApiServer(self.download_manager, self.config.api_port, self._submit_options)
+            except OSError as e: # 포트 사용 중 등
+                QMessageBox.warning(
+                    self, "로컬 API 서버 오류", f"포트 {self.config.api_port} 을(를) 사용할 수 없습니다: {e}"
+                )
 
-        self.timer = QTimer() # 타이머 생성 (클립보드 폴링용)
-        self.timer.timeout.connect(self.check_clipboard) # 타임아웃 시 check_clipboard 슬롯 호출
-        self.timer.start(1000) # 1초마다 클립보드 체크 (dataChanged 시그널 보조)
+    def _apply_watch_folder(self):
+        """설정된 감시 폴더 감시를 시작하거나 다시 시작합니다 (비어 있으면 중지)."""
+        if self.watch_folder is not None:
+            if self.watch_folder.path == self.config.watch_folder:
+                return # 변경 없음
+            self.watch_folder.close()
+            self.watch_folder = None
+        if self.config.watch_folder:
+            try:
+                self.watch_folder = WatchFolder(self.download_manager, self.config.watch_folder, self._submit_options)
+            except OSError as e: # 폴더를 만들 수 없음 (권한 등)
+                QMessageBox.warning(
+                    self, "감시 폴더 오류", f"감시 폴더를 사용할 수 없습니다: {e}"
+                )
 
+    def _submit_options(self):
+        """로컬 API 와 감시 폴더로 추가하는 작업의 기본 다운로드 옵션 (현재 설정, API/감시 스레드에서 호출)."""
+        return {
+            "download_path": self.config.download_path,
+            "quality": self.config.video_quality,
+            "download_subtitles": self.config.download_subtitles,
+            "concurrent_fragments": self.config.concurrent_fragments,
+            "expand_playlists": self.config.expand_playlists,
+        }
+
+    def _setup_clipboard_monitoring(self):
+        """클립보드 감시 기능 설정 (시그널-슬롯 연결)."""
+        self.clipboard.dataChanged.connect(self.on_clipboard_change) # 클립보드 변경 시 on_clipboard_change 슬롯 호출
 
     def _create_status_label(self):
         """상태 라벨 생성 및 레이아웃에 추가."""
@@ -86,9 +205,24 @@ class MainWindow(QMainWindow):
         self.layout.addWidget(self.status_label) # 레이아웃에 상태 라벨 추가
 
     def _create_download_list(self):
-        """다운로드 목록 리스트 위젯 생성 및 레이아웃에 추가."""
-        self.list_widget = QListWidget() # 리스트 위젯 생성 (다운로드 목록 표시)
-        self.layout.addWidget(self.list_widget) # 레이아웃에 리스트 위젯 추가
+        """다운로드 목록 모델/뷰 생성 및 레이아웃에 추가."""
+        self.download_model = DownloadListModel(self) # 다운로드 목록 모델 (행마다 위젯을 만들지 않음)
+        self.list_view = DownloadListView() # 리스트 뷰 생성 (화면에 보이는 행만 그림)
+        self.list_view.setModel(self.download_model)
+        self.list_view.setContextMenuPolicy(Qt.CustomContextMenu) # 우클릭 메뉴 (우선순위, 일시정지 등)
+        self.list_view.customContextMenuRequested.connect(self.show_job_menu)
+        self.layout.addWidget(self.list_view) # 레이아웃에 리스트 뷰 추가
+
+    def _create_error_panel(self):
+        """에러 패널 생성 및 레이아웃에 추가. 메시지 박스 대신 에러를 모아서 표시합니다 (이벤트 루프를 막지 않음)."""
+        self.error_panel = ErrorPanel(self) # 에러 패널 생성 (초기 상태: 숨김)
+        self.layout.addWidget(self.error_panel) # 레이아웃에 에러 패널 추가
+
+    def _create_clear_button(self):
+        """완료 항목 정리 버튼 생성 및 레이아웃에 추가, 클릭 시 clear_finished_items 슬롯 호출."""
+        self.clear_button = QPushButton("완료 항목 지우기") # 완료 항목 정리 버튼 생성
+        self.clear_button.clicked.connect(self.clear_finished_items) # 클릭 시 clear_finished_items 슬롯 연결
+        self.layout.addWidget(self.clear_button) # 레이아웃에 버튼 추가
 
     def _create_settings_button(self):
         """설정 버튼 생성 및 레이아웃에 추가, 클릭 시 open_settings 슬롯 호출."""
@@ -96,142 +230,266 @@ class MainWindow(QMainWindow):
         self.settings_button.clicked.connect(self.open_settings) # 클릭 시 open_settings 슬롯 연결
         self.layout.addWidget(self.settings_button) # 레이아웃에 설정 버튼 추가
 
-    def check_clipboard(self):
+    def on_clipboard_change(self):
+        """
+        클립보드 내용 변경 시 호출되는 슬롯 함수. 붙여넣은 텍스트 전체를 한 번 훑어 모든 YouTube URL을 찾고,
+        비디오 ID 기준으로 중복을 제거한 뒤 새 비디오만 한 번에 다운로드 대기열에 추가합니다.
+        클립보드 내용은 그대로 두며, 같은 내용이 다시 복사되어도 이미 다운로드했거나 진행 중인 비디오는 건너뜁니다.
+        """
+        jobs, playlists, _ = self.download_manager.submit_text( # 한 번에 대기열에 추가 (아카이브/진행 중 비디오 제외)
+            self.clipboard.text(), # 현재 클립보드 텍스트
+            download_path=self.config.download_path, # 다운로드 경로 (설정에서 가져옴)
+            quality=self.config.video_quality, # 비디오 품질 (설정에서 가져옴)
+            download_subtitles=self.config.download_subtitles, # 자막 다운로드 여부 (설정에서 가져옴)
+            concurrent_fragments=self.config.concurrent_fragments, # 조각 동시 다운로드 수 (설정에서 가져옴)
+            expand_playlists=self.config.expand_playlists, # 재생목록/채널 URL 은 백그라운드에서 펼쳐 개별 작업으로 추가
+        )
+        if playlists:
+            self.status_label.setText(f"재생목록 가져오는 중: {playlists[-1]}") # 상태 라벨에 진행 표시
+        elif len(jobs) > 1:
+            self.status_label.setText(f"클립보드에서 {len(jobs)}개 비디오 추가됨") # 상태 라벨 업데이트
+
+    def on_job_added(self, job_id):
         """
-        타이머 기반 클립보드 체크 함수. 클립보드 내용 변경 여부를 주기적으로 확인합니다.
-        `clipboard.dataChanged` 시그널의 보조 역할로, 시그널 누락 방지 및 안정성 향상 목적입니다.
+        작업 추가 시 호출되는 슬롯 함수. 활성 다운로드 목록과 UI에 다운로드 아이템을 추가합니다.
+
+        Args:
+            job_id (int): 추가된 작업 ID
         """
-        with self.clipboard_lock: # 클립보드 접근 Lock 획득 (thread-safe)
-            current_text = self.clipboard.text() # 현재 클립보드 텍스트 가져오기
-            if current_text != self.last_clipboard: # 클립보드 내용 변경 확인
-                self.last_clipboard = current_text # 마지막 클립보드 내용 업데이트
-                self.on_clipboard_change() # 클립보드 변경 처리 함수 호출
+        job = self.download_manager.jobs[job_id]
+        self.active_downloads[job_id] = job # 활성 다운로드 목록에 작업 추가 (작업 ID: DownloadJob)
+        self._add_download_item(job) # UI에 다운로드 아이템 추가
 
-    def on_clipboard_change(self):
+    def on_playlist_expanded(self, url, count):
         """
-        클립보드 내용 변경 시 호출되는 슬롯 함수. 클립보드 텍스트에서 YouTube URL을 감지하고,
-        새로운 URL인 경우 다운로드를 시작합니다.
+        재생목록 펼치기 완료 시 호출되는 슬롯 함수. 추가된 작업 수를 상태 라벨에 표시합니다.
+
+        Args:
+            url (str): 재생목록 또는 채널 URL
+            count (int): 새로 추가된 작업 수
         """
-        text = self.clipboard.text() # 현재 클립보드 텍스트 가져오기
-        if YOUTUBE_REGEX.match(text): # YouTube URL 정규식 매칭 확인
-            video_id = extract_video_id(text) # URL에서 비디오 ID 추출
-            if video_id and video_id not in self.downloaded_urls: # 중복 다운로드 방지 (이미 다운로드한 URL인지 확인)
-                self.start_download(text) # 다운로드 시작
-                self.clipboard.clear() # 클립보드 내용 비우기 (URL 자동 다운로드 후 클립보드 정리)
+        self.status_label.setText(f"재생목록에서 {count}개 비디오 추가됨: {url}") # 상태 라벨 업데이트
 
-    def start_download(self, url):
+    def on_playlist_failed(self, url, kind, message):
         """
-        새로운 다운로드 작업을 시작합니다. DownloadWorker 스레드를 생성하고, 각종 시그널을 연결하며,
-        UI에 다운로드 아이템을 추가합니다.
+        재생목록 펼치기 에러 시 호출되는 슬롯 함수. 에러를 에러 패널에 추가합니다.
 
         Args:
-            url (str): 다운로드할 YouTube URL
+            url (str): 재생목록 또는 채널 URL
+            kind (str): 에러 분류 (errors.NETWORK 등)
+            message (str): 에러 메시지
         """
-        signals = WorkerSignals() # Worker 시그널 객체 생성
-        signals.finished.connect(self.on_download_finished) # 다운로드 완료 시 on_download_finished 슬롯 연결
-        signals.error.connect(self.on_download_error) # 다운로드 에러 시 on_download_error 슬롯 연결
-        signals.progress.connect(self.on_download_progress) # 다운로드 진행률 변경 시 on_download_progress 슬롯 연결
+        self.error_panel.add_error(kind, url, message) # 에러 패널에 추가 (메시지 박스로 이벤트 루프를 막지 않음)
+        self.status_label.setText(f"재생목록을 가져오지 못했습니다: {url}") # 상태 라벨 업데이트
 
-        worker = DownloadWorker( # DownloadWorker 객체 생성 (다운로드 스레드)
-            url=url,
-            download_path=self.config.download_path, # 다운로드 경로 (설정에서 가져옴)
-            quality=self.config.video_quality, # 비디오 품질 (설정에서 가져옴)
-            signals=signals, # 시그널 객체 전달
-            download_subtitles=self.config.download_subtitles, # 자막 다운로드 여부 (설정에서 가져옴)
-        )
-        self.active_downloads[url] = worker # 활성 다운로드 목록에 worker 추가 (URL: Worker)
-        self.threadpool.start(worker) # 스레드 풀에 worker 스레드 시작 요청
+    def on_concurrency_changed(self, concurrency):
+        """
+        동시 다운로드 수가 바뀌었을 때 호출되는 슬롯 함수. 자동 조절 중이면 바뀐 값을 상태 라벨에 표시합니다.
 
-        self._add_download_item(url) # UI에 다운로드 아이템 추가
+        Args:
+            concurrency (int): 새 동시 다운로드 수
+        """
+        if self.download_manager.autotuner is not None: # 설정 다이얼로그에서 바꾼 경우는 표시하지 않음
+            self.status_label.setText(f"동시 다운로드 수 자동 조절: {concurrency}") # 상태 라벨 업데이트
 
-    def _add_download_item(self, url):
+    def _add_download_item(self, job):
         """
-        UI 다운로드 목록에 새로운 다운로드 아이템 (DownloadItemWidget) 을 추가합니다.
+        UI 다운로드 목록 모델에 새로운 다운로드 행을 추가합니다.
 
         Args:
-            url (str): 다운로드할 YouTube URL
+            job (DownloadJob): 다운로드 작업
         """
-        item = QListWidgetItem() # QListWidgetItem 생성 (리스트 뷰 아이템)
-        widget = DownloadItemWidget(url) # DownloadItemWidget 생성 (커스텀 위젯)
-        item.setSizeHint(widget.sizeHint()) # 아이템 크기 힌트 설정 (위젯 크기에 맞춤)
-        self.list_widget.addItem(item) # 리스트 위젯에 아이템 추가
-        self.list_widget.setItemWidget(item, widget) # 아이템에 커스텀 위젯 설정 (아이템 - 위젯 연결)
+        self.download_model.add_job(job.job_id, job.url) # 모델에 행 추가 (작업 ID 인덱스에 등록)
 
+    def show_job_menu(self, pos):
+        """
+        다운로드 목록 우클릭 메뉴를 표시합니다. 작업 상태에 따라 맨 앞으로 이동, 우선순위 변경,
+        일시정지/재개, 취소 동작을 제공합니다.
 
-    def on_download_finished(self, url):
+        Args:
+            pos (QPoint): 리스트 뷰 기준 클릭 위치
+        """
+        index = self.list_view.indexAt(pos)
+        if not index.isValid():
+            return
+        job_id = index.data(DownloadListModel.JobIdRole)
+        job = self.active_downloads.get(job_id)
+        if job is None:
+            return # 이미 완료/에러 처리된 작업
+
+        menu = QMenu(self)
+        if job.state == DownloadJob.QUEUED and job.retry_delay is None: # 재시도 대기 중인 작업은 대기열에 없음
+            menu.addAction("맨 앞으로", lambda: self.download_manager.move_to_front(job_id))
+        if job.state in (DownloadJob.QUEUED, DownloadJob.RUNNING):
+            menu.addAction("일시정지", lambda: self.download_manager.pause(job_id))
+        if job.state == DownloadJob.PAUSED:
+            menu.addAction("재개", lambda: self.download_manager.resume(job_id))
+        menu.addAction("취소", lambda: self.download_manager.cancel(job_id)) # 받던 임시 파일은 남김
+        menu.addAction(
+            "취소하고 임시 파일 삭제", lambda: self.download_manager.cancel(job_id, delete_partial=True)
+        )
+        priority_menu = menu.addMenu("우선순위")
+        for label, priority in (
+                ("높음", DownloadJob.PRIORITY_HIGH),
+                ("보통", DownloadJob.PRIORITY_NORMAL),
+                ("낮음", DownloadJob.PRIORITY_LOW),
+        ):
+            action = priority_menu.addAction(
+                label, lambda priority=priority: self.download_manager.set_priority(job_id, priority)
+            )
+            action.setCheckable(True)
+            action.setChecked(job.priority == priority) # 현재 우선순위 표시
+        menu.exec_(self.list_view.viewport().mapToGlobal(pos))
+
+    def clear_finished_items(self):
+        """완료/실패한 다운로드 아이템을 목록에서 모두 제거합니다 (모델을 한 번에 재구성)."""
+        finished = [job_id for job_id in self.download_model.job_ids() if job_id not in self.active_downloads]
+        self.download_model.remove_jobs(finished)
+
+    def on_download_finished(self, job_id):
         """
         다운로드 완료 시 호출되는 슬롯 함수. UI 업데이트 및 완료 처리.
 
         Args:
-            url (str): 완료된 다운로드의 YouTube URL
+            job_id (int): 완료된 다운로드의 작업 ID
         """
-        self.downloaded_urls.add(url) # 다운로드 완료 URL 목록에 추가 (중복 다운로드 방지)
-        self._update_download_widget(url, status="complete") # UI 다운로드 아이템 위젯 업데이트 (상태: 완료)
-        self._cleanup_download(url) # 다운로드 정리 (활성 다운로드 목록, 진행률 정보 제거)
+        self._update_download_item(job_id, status="complete") # UI 다운로드 목록 행 업데이트 (상태: 완료)
+        self._cleanup_download(job_id) # 다운로드 정리 (활성 다운로드 목록, 진행률 정보 제거)
 
-    def on_download_error(self, message):
+    def on_download_error(self, job_id, kind, message):
         """
-        다운로드 에러 발생 시 호출되는 슬롯 함수. 에러 메시지 표시 및 UI 업데이트.
+        다운로드 에러(최종 실패) 시 호출되는 슬롯 함수. 에러를 에러 패널에 추가하고 UI 를 업데이트합니다.
+        에러가 한꺼번에 많이 발생해도 메시지 박스로 이벤트 루프를 막지 않습니다.
 
         Args:
+            job_id (int): 실패한 다운로드의 작업 ID
+            kind (str): 에러 분류 (errors.NETWORK, RATE_LIMITED, EXTRACTOR, FFMPEG 등)
             message (str): 에러 메시지
         """
-        QMessageBox.critical(self, "다운로드 오류", message) # 에러 메시지 박스 표시
-        url = message.split(":")[0].split(' ')[-1] # 에러 메시지에서 URL 추출 (메시지 포맷에 따라 조정 필요)
-        self._update_download_widget(url, status="error") # UI 다운로드 아이템 위젯 업데이트 (상태: 에러)
-        self._cleanup_download(url) # 다운로드 정리
+        job = self.download_manager.jobs[job_id]
+        self.error_panel.add_error(kind, job.title or job.url, message) # 에러 패널에 추가
+        self._update_download_item(job_id, status="error") # UI 다운로드 목록 행 업데이트 (상태: 에러)
+        self._cleanup_download(job_id) # 다운로드 정리
 
-    def _cleanup_download(self, url):
+    def on_job_retrying(self, job_id):
         """
-        다운로드 완료 또는 에러 발생 후 뒷정리 작업 (활성 다운로드 목록, 진행률 정보 제거).
+        일시적인 에러(네트워크, HTTP 403/429)로 자동 재시도가 예약되었을 때 호출되는 슬롯 함수.
+        에러를 에러 패널에 재시도 예정으로 추가합니다. 대기 시간이 지나면 on_job_queued 가 호출됩니다.
 
         Args:
-            url (str): 다운로드 URL
+            job_id (int): 작업 ID
         """
-        self.active_downloads.pop(url, None) # 활성 다운로드 목록에서 제거 (worker 객체 제거)
-        self.download_progress.pop(url, None) # 진행률 정보 딕셔너리에서 제거
-        self.update_status_label() # 상태 라벨 업데이트 (활성 다운로드 목록 갱신 반영)
+        job = self.download_manager.jobs[job_id]
+        self.error_panel.add_error(
+            job.error_kind, job.title or job.url, job.error, retry_delay=job.retry_delay
+        ) # 에러 패널에 추가 (재시도 예정)
+        self._update_download_item(job_id, status="retrying") # UI 다운로드 목록 행 업데이트 (상태: 재시도 대기)
+
+    def on_job_info(self, job_id):
+        """
+        비디오 정보 수신 시 호출되는 슬롯 함수. 다운로드 시작 전에 제목을 표시합니다.
+
+        Args:
+            job_id (int): 작업 ID
+        """
+        job = self.download_manager.jobs[job_id]
+        if job.title:
+            self.download_model.set_title(job_id, job.title) # 목록에 제목 표시
+
+    def on_job_postprocessing(self, job_id):
+        """
+        작업의 전송이 끝나고 후처리(병합)를 시작했을 때 호출되는 슬롯.
+
+        Args:
+            job_id (int): 작업 ID
+        """
+        self._update_download_item(job_id, status="postprocessing") # UI 다운로드 목록 행 업데이트 (상태: 병합 중)
+
+    def on_job_paused(self, job_id):
+        """
+        작업 일시정지 시 호출되는 슬롯 함수.
+
+        Args:
+            job_id (int): 일시정지된 작업 ID
+        """
+        self._update_download_item(job_id, status="paused") # UI 다운로드 목록 행 업데이트 (상태: 일시정지)
+
+    def on_job_queued(self, job_id):
+        """
+        일시정지/선점된 작업이 다시 대기열에 들어갔을 때 호출되는 슬롯 함수.
+
+        Args:
+            job_id (int): 대기열로 돌아간 작업 ID
+        """
+        self._update_download_item(job_id, status="queued") # UI 다운로드 목록 행 업데이트 (상태: 대기 중)
 
-    def _update_download_widget(self, url, status):
+    def on_job_cancelled(self, job_id):
         """
-        UI 다운로드 아이템 위젯의 상태를 업데이트합니다 (진행률, 텍스트 변경 등).
+        작업이 취소되었을 때 호출되는 슬롯 함수.
 
         Args:
-            url (str): 다운로드 URL
-            status (str): 업데이트할 상태 ("complete", "error")
-        """
-        for index in range(self.list_widget.count()): # 다운로드 목록 아이템 순회
-            item = self.list_widget.item(index) # 아이템 가져오기
-            widget = self.list_widget.itemWidget(item) # 아이템에 연결된 위젯 (DownloadItemWidget) 가져오기
-            if widget.label.text() == url: # 위젯의 URL 라벨 텍스트가 업데이트 대상 URL과 일치하는지 확인
-                if status == "complete": # 다운로드 완료 상태인 경우
-                    widget.label.setText(f"다운로드 완료: {url}") # 라벨 텍스트 변경 (다운로드 완료 표시)
-                    widget.update_progress(100.0) # 진행률 100%로 업데이트
-                    if self.config.download_subtitles: # 자막 다운로드 설정 활성화 시
-                        widget.update_subtitle_status("다운로드 완료") # 자막 상태 "다운로드 완료" 로 업데이트
-                elif status == "error": # 다운로드 에러 상태인 경우
-                    widget.label.setText(f"다운로드 실패: {url}") # 라벨 텍스트 변경 (다운로드 실패 표시)
-                    widget.update_progress(0.0) # 진행률 0%로 초기화 (or 에러 상태 표시)
-                    if self.config.download_subtitles: # 자막 다운로드 설정 활성화 시
-                        widget.update_subtitle_status("다운로드 실패") # 자막 상태 "다운로드 실패" 로 업데이트
-                break # URL 찾았으면 루프 종료
-
-    def on_download_progress(self, url, percent):
-        """
-        다운로드 진행률 변경 시 호출되는 슬롯 함수. UI 진행률 표시줄 업데이트.
+            job_id (int): 취소된 작업 ID
+        """
+        self._update_download_item(job_id, status="cancelled") # UI 다운로드 목록 행 업데이트 (상태: 취소됨)
+        self._cleanup_download(job_id) # 다운로드 정리
+
+    def _cleanup_download(self, job_id):
+        """
+        다운로드 완료 또는 에러 발생 후 뒷정리 작업 (활성 다운로드 목록, 진행률 정보 제거).
 
         Args:
-            url (str): 다운로드 URL
-            percent (float): 다운로드 진행률 (0.0 ~ 100.0)
-        """
-        self.download_progress[url] = percent # 진행률 정보 업데이트 (딕셔너리에 저장)
-        for index in range(self.list_widget.count()): # 다운로드 목록 아이템 순회
-            item = self.list_widget.item(index) # 아이템 가져오기
-            widget = self.list_widget.itemWidget(item) # 아이템에 연결된 위젯 가져오기
-            if widget.label.text() == url: # 위젯의 URL 라벨 텍스트가 업데이트 대상 URL과 일치하는지 확인
-                widget.update_progress(percent) # 위젯의 진행률 표시줄 업데이트
-                break # URL 찾았으면 루프 종료
-        self.update_status_label() # 상태 라벨 업데이트 (전체 진행률 요약 표시)
+            job_id (int): 작업 ID
+        """
+        self.active_downloads.pop(job_id, None) # 활성 다운로드 목록에서 제거 (작업 객체 제거)
+        self.download_progress.pop(job_id, None) # 진행률 정보 딕셔너리에서 제거
+        self.update_status_label() # 상태 라벨 업데이트 (활성 다운로드 목록 갱신 반영)
+
+    def _update_download_item(self, job_id, status):
+        """
+        UI 다운로드 목록 행의 상태를 업데이트합니다 (진행률, 텍스트 변경 등). 모델이 바뀐 행만 다시 그리게 합니다.
+
+        Args:
+            job_id (int): 작업 ID
+            status (str): 업데이트할 상태 ("postprocessing", "complete", "error", "paused", "queued", "cancelled", "retrying")
+        """
+        if status == "complete": # 다운로드 완료 상태인 경우: 진행률 100%, 자막 상태 "다운로드 완료"
+            self.download_model.set_status(
+                job_id, "complete", percent=100.0,
+                subtitle_status="다운로드 완료" if self.config.download_subtitles else None,
+            )
+        elif status == "error": # 다운로드 에러 상태인 경우: 진행률 0%로 초기화, 자막 상태 "다운로드 실패"
+            self.download_model.set_status(
+                job_id, "error", percent=0.0,
+                subtitle_status="다운로드 실패" if self.config.download_subtitles else None,
+            )
+        elif status == "postprocessing": # 후처리(병합) 중인 경우: 전송은 끝났으므로 진행률 100%
+            self.download_model.set_status(job_id, "postprocessing", percent=100.0)
+        elif status == "paused": # 일시정지 상태인 경우 (진행률은 유지)
+            self.download_model.set_status(job_id, "paused")
+        elif status == "queued": # 다시 대기열에 들어간 경우: 텍스트 원래대로 (제목 또는 URL 표시)
+            self.download_model.set_status(job_id, None)
+        elif status == "cancelled": # 취소된 경우 (진행률은 유지)
+            self.download_model.set_status(job_id, "cancelled")
+        elif status == "retrying": # 재시도 대기 중인 경우 (받은 부분부터 이어받으므로 진행률은 유지)
+            self.download_model.set_status(job_id, "retrying")
+
+    def refresh_progress(self):
+        """
+        진행률 표시 갱신 타이머 슬롯. 마지막 갱신 이후 진행 상황이 바뀐 작업만 모아서 한 번에 표시합니다.
+        워커는 공유 상태(DownloadManager.progress)에 바이트 수만 기록하므로, 청크 수가 늘어도 GUI 비용은 일정합니다.
+        """
+        changed = self.download_manager.progress.collect_changed() # 바뀐 작업의 진행 상황 스냅샷
+        if not changed:
+            return # 변경 없음
+
+        percents = {}
+        for job_id, progress in changed.items():
+            if job_id not in self.active_downloads:
+                continue # 이미 완료/에러 처리된 작업
+            self.download_progress[job_id] = progress.percent # 진행률 정보 업데이트 (딕셔너리에 저장)
+            percents[job_id] = progress.percent
+        self.download_model.set_progress(percents) # 바뀐 행 범위만 한 번에 다시 그리기
+        self.update_status_label() # 상태 라벨 업데이트 (전체 진행률 요약 표시, 갱신 주기당 한 번)
 
     def update_status_label(self):
         """
@@ -243,9 +501,9 @@ class MainWindow(QMainWindow):
             return # 더 이상 진행 X
 
         status_text = [] # 상태 텍스트 리스트 초기화
-        for url, progress in self.download_progress.items(): # 진행률 정보 딕셔너리 순회
+        for job_id, progress in self.download_progress.items(): # 진행률 정보 딕셔너리 순회
             if progress < 100: # 진행률이 100% 미만인 다운로드만 표시 (진행 중인 다운로드)
-                video_title_snippet = url.split('/')[-1] # URL에서 비디오 제목 일부 추출 (간략하게 표시)
+                video_title_snippet = self.active_downloads[job_id].url.split('/')[-1] # URL에서 비디오 제목 일부 추출 (간략하게 표시)
                 status_text.append(f"{video_title_snippet}: {progress:.1f}%") # 상태 텍스트 생성 및 리스트에 추가
 
         if status_text: # 상태 텍스트 리스트가 비어있지 않은 경우 (진행 중인 다운로드 O)
@@ -255,7 +513,20 @@ class MainWindow(QMainWindow):
         """설정 다이얼로그 (SettingsDialog) 를 열고, 설정 변경 사항을 적용합니다."""
         dialog = SettingsDialog(self.config, self) # SettingsDialog 객체 생성 (설정, 부모 윈도우 전달)
         if dialog.exec_(): # 다이얼로그 실행 (Modal), OK 버튼 클릭 시 True 반환
-            self.threadpool.setMaxThreadCount(self.config.concurrent_downloads) # 동시 다운로드 수 설정 변경 적용 (스레드 풀 업데이트)
+            self.download_manager.set_concurrency(self.config.concurrent_downloads) # 동시 다운로드 수 설정 변경 즉시 적용
+            self.download_manager.set_bandwidth_limit(self.config.bandwidth_limit * 1024) # 대역폭 제한 변경 즉시 적용 (실행 중인 작업 포함)
+            self.download_manager.set_postprocess_concurrency(self.config.postprocess_concurrency) # 후처리 동시 실행 수 변경 적용
+            self.download_manager.set_max_retries(self.config.max_retries) # 자동 재시도 횟수 변경 적용 (다음 실패부터)
+            self.download_manager.set_auto_concurrency(self.config.auto_concurrency_max) # 자동 조절 (위 동시 다운로드 수에서 다시 시작)
+            self.download_manager.set_format_tolerance(self.config.format_tolerance / 100) # 병합 생략 허용 화질 손실 (새 작업부터)
+            if self.config.use_process_pool and self.process_pool is None: # 프로세스 모드 켜짐: 새 작업부터 적용
+                self.process_pool = lazy_import("procpool").ProcessPool(self.config.concurrent_downloads)
+            self.download_manager.set_process_pool( # 프로세스 모드 꺼짐: 풀은 종료 시까지 유지 (실행 중인 작업 보호)
+                self.process_pool if self.config.use_process_pool else None
+            )
+            self._apply_metrics_port() # 성능 지표 서버 포트 변경 적용
+            self._apply_api_port() # 로컬 API 포트 변경 적용
+            self._apply_watch_folder() # 감시 폴더 변경 적용
             if not self.config.download_path or not os.path.isdir( # 다운로드 경로 유효성 재확인
                     self.config.download_path
             ):
@@ -269,19 +540,33 @@ class MainWindow(QMainWindow):
         """
         QMainWindow closeEvent override. 윈도우 닫기 이벤트 처리.
         어플리케이션 종료 전에 사용자에게 종료 확인 메시지 박스를 표시합니다.
+        끝나지 않은 다운로드는 중단 후 저장되며, 다음 실행 시 이어서 받습니다.
         """
+        message = "정말로 종료하시겠습니까?"
+        if self.download_manager.active_jobs():
+            message += "\n진행 중인 다운로드는 다음 실행 시 이어서 받습니다."
         reply = QMessageBox.question( # 종료 확인 메시지 박스 표시 (Yes/No 선택)
             self,
             "종료 확인",
-            "정말로 종료하시겠습니까?",
+            message,
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No, # 기본 선택 버튼: No
         )
         if reply == QMessageBox.Yes: # Yes 버튼 클릭 시
-            # 다운로드 중단 로직 (선택 사항, 필요시 활성화)
-            # for worker in self.active_downloads.values():
-            #     worker.stop() # 활성 다운로드 worker 들에게 stop() 호출 (Graceful shutdown 시도)
-            self.threadpool.waitForDone() # 스레드 풀의 모든 작업 완료 대기 (Graceful shutdown)
+            self.progress_timer.stop() # 진행률 갱신 중지
+            if self.api_server is not None:
+                self.api_server.close() # 종료 중에는 새 작업을 받지 않음
+            if self.watch_folder is not None:
+                self.watch_folder.close()
+            self.download_manager.shutdown(self.SHUTDOWN_TIMEOUT) # 실행 중인 작업 중단 (.part 파일과 작업 기록은 남김, 시간 제한)
+            self.job_store.close()
+            self.library.close()
+            self.archive.close()
+            if self.metrics_server is not None:
+                self.metrics_server.close()
+            self.metrics.close()
+            if self.process_pool is not None:
+                self.process_pool.shutdown(timeout=self.SHUTDOWN_TIMEOUT) # 자식 프로세스 종료 (시간 초과 시 강제 종료)
             event.accept() # 윈도우 닫기 승인 (어플리케이션 종료)
         else: # No 버튼 클릭 시 or 메시지 박스 닫기 시
             event.ignore() # 윈도우 닫기 무시 (어플리케이션 종료 취소)
\ No newline at end of file
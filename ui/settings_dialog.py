@@ -19,7 +19,8 @@ class SettingsDialog(QDialog):
     """
     어플리케이션 설정 다이얼로그 클래스입니다.
 
-    동시 다운로드 수, 다운로드 경로, 비디오 품질, 자막 다운로드 설정을 변경하고 저장하는 기능을 제공합니다.
+    동시 다운로드 수(자동 조절), 다운로드 경로, 비디오 품질, 자막 다운로드, 재생목록 펼치기,
+    대역폭 제한, 조각 동시 다운로드, 후처리 동시 실행, 프로세스 모드, 성능 지표 서버, 로컬 API, 감시 폴더 설정을 변경하고 저장하는 기능을 제공합니다.
     """
     def __init__(self, config, parent=None):
         """
@@ -40,9 +41,20 @@ class SettingsDialog(QDialog):
         self.layout = QFormLayout(self)  # 폼 레이아웃 생성 (Label - Field 쌍으로 구성)
 
         self._create_concurrent_downloads_spinbox()  # 동시 다운로드 수 스핀박스 생성 및 추가
+        self._create_auto_concurrency_spinbox()  # 동시 다운로드 자동 조절 상한 스핀박스 생성 및 추가
+        self._create_concurrent_fragments_spinbox()  # 조각 동시 다운로드 수 스핀박스 생성 및 추가
+        self._create_postprocess_spinbox()  # 후처리 동시 실행 수 스핀박스 생성 및 추가
+        self._create_bandwidth_limit_spinbox()  # 대역폭 제한 스핀박스 생성 및 추가
+        self._create_retries_spinbox()  # 자동 재시도 횟수 스핀박스 생성 및 추가
         self._create_download_path_selector()  # 다운로드 경로 선택 UI (LineEdit + Browse Button) 생성 및 추가
         self._create_video_quality_combobox()  # 비디오 품질 콤보박스 생성 및 추가
+        self._create_format_tolerance_spinbox()  # 병합 생략 화질 허용 손실 스핀박스 생성 및 추가
         self._create_subtitles_checkbox()  # 자막 다운로드 체크박스 생성 및 추가
+        self._create_playlists_checkbox()  # 재생목록 펼치기 체크박스 생성 및 추가
+        self._create_process_pool_checkbox()  # 프로세스 모드 체크박스 생성 및 추가
+        self._create_metrics_port_spinbox()  # 성능 지표 서버 포트 스핀박스 생성 및 추가
+        self._create_api_port_spinbox()  # 로컬 API 포트 스핀박스 생성 및 추가
+        self._create_watch_folder_selector()  # 감시 폴더 선택 UI (LineEdit + Browse Button) 생성 및 추가
         self._create_buttons()  # 저장/취소 버튼 생성 및 추가
 
     def _create_concurrent_downloads_spinbox(self):
@@ -51,6 +63,45 @@ class SettingsDialog(QDialog):
         self.concurrent_spin.setRange(1, 10)  # 다운로드 수 범위 설정 (1 ~ 10)
         self.layout.addRow("동시 다운로드:", self.concurrent_spin)  # 폼 레이아웃에 행 추가 (Label - Spinbox)
 
+    def _create_auto_concurrency_spinbox(self):
+        """동시 다운로드 수 자동 조절 상한 설정 스핀박스 생성 및 레이아웃에 추가."""
+        self.auto_concurrency_spin = QSpinBox()  # 스핀박스 생성
+        self.auto_concurrency_spin.setRange(0, 32)  # 자동 조절 상한 범위 설정 (0 이면 사용 안 함)
+        self.auto_concurrency_spin.setSpecialValueText("사용 안 함")  # 0 은 사용 안 함으로 표시
+        self.auto_concurrency_spin.setToolTip(
+            "동시 다운로드 수에서 시작하여, 전체 속도가 늘어나는 동안 이 값까지 늘리고 "
+            "HTTP 429/403, 네트워크 오류가 나면 줄입니다."
+        )
+        self.layout.addRow("동시 다운로드 자동 조절 (최대):", self.auto_concurrency_spin)  # 폼 레이아웃에 행 추가 (Label - Spinbox)
+
+    def _create_concurrent_fragments_spinbox(self):
+        """작업당 조각(DASH/HLS) 동시 다운로드 수 설정 스핀박스 생성 및 레이아웃에 추가."""
+        self.fragments_spin = QSpinBox()  # 스핀박스 생성
+        self.fragments_spin.setRange(1, 16)  # 조각 동시 다운로드 수 범위 설정 (1 ~ 16)
+        self.layout.addRow("조각 동시 다운로드:", self.fragments_spin)  # 폼 레이아웃에 행 추가 (Label - Spinbox)
+
+    def _create_postprocess_spinbox(self):
+        """후처리(ffmpeg 병합, 자막 변환) 동시 실행 수 설정 스핀박스 생성 및 레이아웃에 추가."""
+        self.postprocess_spin = QSpinBox()  # 스핀박스 생성
+        self.postprocess_spin.setRange(1, 64)  # 후처리 동시 실행 수 범위 설정 (1 ~ 64)
+        self.postprocess_spin.setToolTip("병합은 다운로드 슬롯과 별도로 실행되므로, 병합 중에도 다음 다운로드가 시작됩니다.")
+        self.layout.addRow("동시 병합(후처리):", self.postprocess_spin)  # 폼 레이아웃에 행 추가 (Label - Spinbox)
+
+    def _create_bandwidth_limit_spinbox(self):
+        """전체 대역폭 제한 설정 스핀박스 생성 및 레이아웃에 추가."""
+        self.bandwidth_spin = QSpinBox()  # 스핀박스 생성
+        self.bandwidth_spin.setRange(0, 10_000_000)  # 대역폭 제한 범위 설정 (KB/s)
+        self.bandwidth_spin.setSuffix(" KB/s")  # 단위 표시
+        self.bandwidth_spin.setSpecialValueText("무제한")  # 0 은 무제한으로 표시
+        self.layout.addRow("전체 대역폭 제한:", self.bandwidth_spin)  # 폼 레이아웃에 행 추가 (Label - Spinbox)
+
+    def _create_retries_spinbox(self):
+        """자동 재시도 횟수 설정 스핀박스 생성."""
+        self.retries_spin = QSpinBox()  # 스핀박스 생성
+        self.retries_spin.setRange(0, 10)  # 재시도 횟수 범위 설정 (0 ~ 10, 0 이면 재시도 안 함)
+        self.retries_spin.setToolTip("네트워크 오류, HTTP 403/429 로 실패한 다운로드를 대기 시간을 늘려 가며 다시 시도합니다.")
+        self.layout.addRow("자동 재시도 횟수:", self.retries_spin)  # 폼 레이아웃에 행 추가 (Label - Spinbox)
+
     def _create_download_path_selector(self):
         """다운로드 경로 설정 UI (LineEdit + Browse Button) 생성 및 레이아웃에 추가."""
         self.path_edit = QLineEdit()  # 경로 표시 LineEdit 생성
@@ -70,11 +121,62 @@ class SettingsDialog(QDialog):
         )
         self.layout.addRow("비디오 품질:", self.quality_combo)  # 폼 레이아웃에 행 추가 (Label - ComboBox)
 
+    def _create_format_tolerance_spinbox(self):
+        """병합(비디오 + 오디오) 대신 단일 파일 등을 고를 때 허용할 화질 손실 설정 스핀박스 생성 및 레이아웃에 추가."""
+        self.format_tolerance_spin = QSpinBox()  # 스핀박스 생성
+        self.format_tolerance_spin.setRange(0, 50)  # 허용 손실 범위 설정 (%)
+        self.format_tolerance_spin.setSuffix(" %")  # 단위 표시
+        self.format_tolerance_spin.setToolTip(
+            "선택한 품질보다 해상도·fps·음질이 이 비율 이내로 낮은 단일 파일이 있으면, "
+            "비디오와 오디오를 따로 받아 병합하지 않고 그 파일을 받습니다."
+        )
+        self.layout.addRow("병합 생략 허용 화질 손실:", self.format_tolerance_spin)  # 폼 레이아웃에 행 추가 (Label - Spinbox)
+
     def _create_subtitles_checkbox(self):
         """자막 다운로드 설정 체크박스 생성 및 레이아웃에 추가."""
         self.subtitles_checkbox = QCheckBox()  # 체크박스 생성
         self.layout.addRow("자막 다운로드:", self.subtitles_checkbox)  # 폼 레이아웃에 행 추가 (Label - CheckBox)
 
+    def _create_playlists_checkbox(self):
+        """재생목록/채널 펼치기 설정 체크박스 생성 및 레이아웃에 추가."""
+        self.playlists_checkbox = QCheckBox()  # 체크박스 생성
+        self.layout.addRow("재생목록/채널 펼치기:", self.playlists_checkbox)  # 폼 레이아웃에 행 추가 (Label - CheckBox)
+
+    def _create_process_pool_checkbox(self):
+        """다운로드를 별도 프로세스에서 실행할지 설정하는 체크박스 생성 및 레이아웃에 추가."""
+        self.process_pool_checkbox = QCheckBox()  # 체크박스 생성
+        self.process_pool_checkbox.setToolTip("동시 다운로드가 많을 때 UI 멈춤을 줄이고 여러 CPU 코어를 사용합니다.")
+        self.layout.addRow("별도 프로세스에서 다운로드:", self.process_pool_checkbox)  # 폼 레이아웃에 행 추가 (Label - CheckBox)
+
+    def _create_metrics_port_spinbox(self):
+        """Prometheus 형식 성능 지표 서버 포트 설정 스핀박스 생성 및 레이아웃에 추가."""
+        self.metrics_port_spin = QSpinBox()  # 스핀박스 생성
+        self.metrics_port_spin.setRange(0, 65535)  # 포트 범위 설정
+        self.metrics_port_spin.setSpecialValueText("사용 안 함")  # 0 은 사용 안 함으로 표시
+        self.metrics_port_spin.setToolTip("http://127.0.0.1:<포트>/metrics 에서 다운로드 성능 지표를 제공합니다.")
+        self.layout.addRow("성능 지표 서버 포트:", self.metrics_port_spin)  # 폼 레이아웃에 행 추가 (Label - Spinbox)
+
+    def _create_api_port_spinbox(self):
+        """작업 추가/조회/취소용 로컬 HTTP API 포트 설정 스핀박스 생성 및 레이아웃에 추가."""
+        self.api_port_spin = QSpinBox()  # 스핀박스 생성
+        self.api_port_spin.setRange(0, 65535)  # 포트 범위 설정
+        self.api_port_spin.setSpecialValueText("사용 안 함")  # 0 은 사용 안 함으로 표시
+        self.api_port_spin.setToolTip("http://127.0.0.1:<포트>/jobs 로 다른 프로그램이 다운로드를 추가하고 진행 상황을 받아볼 수 있습니다.")
+        self.layout.addRow("로컬 API 포트:", self.api_port_spin)  # 폼 레이아웃에 행 추가 (Label - Spinbox)
+
+    def _create_watch_folder_selector(self):
+        """감시 폴더 설정 UI (LineEdit + Browse Button) 생성 및 레이아웃에 추가."""
+        self.watch_folder_edit = QLineEdit()  # 경로 표시 LineEdit 생성
+        self.watch_folder_edit.setPlaceholderText("사용 안 함")  # 비어 있으면 사용 안 함
+        self.watch_folder_edit.setToolTip("이 폴더에 넣은 .txt 파일의 URL 을 다운로드하고, 파일은 processed 폴더로 옮깁니다.")
+        self.watch_browse_button = QPushButton("찾아보기...")  # "찾아보기" 버튼 생성
+        self.watch_browse_button.clicked.connect(self.browse_watch_folder)  # 버튼 클릭 시 browse_watch_folder 슬롯 연결
+
+        watch_layout = QHBoxLayout()  # QHBoxLayout 생성 (LineEdit + Button 수평 배치)
+        watch_layout.addWidget(self.watch_folder_edit)  # 레이아웃에 LineEdit 추가
+        watch_layout.addWidget(self.watch_browse_button)  # 레이아웃에 Button 추가
+        self.layout.addRow("감시 폴더:", watch_layout)  # 폼 레이아웃에 행 추가 (Label - Horizontal Layout)
+
     def _create_buttons(self):
         """저장 및 취소 버튼 생성 및 레이아웃에 추가."""
         button_layout = QHBoxLayout()  # QHBoxLayout 생성 (버튼 수평 배치)
@@ -91,11 +193,22 @@ class SettingsDialog(QDialog):
     def load_settings(self):
         """Config 객체에서 설정을 불러와 UI 위젯에 반영합니다."""
         self.concurrent_spin.setValue(self.config.concurrent_downloads)  # 동시 다운로드 수 스핀박스에 값 설정
+        self.auto_concurrency_spin.setValue(self.config.auto_concurrency_max)  # 자동 조절 상한 스핀박스에 값 설정
+        self.fragments_spin.setValue(self.config.concurrent_fragments)  # 조각 동시 다운로드 수 스핀박스에 값 설정
+        self.postprocess_spin.setValue(self.config.postprocess_concurrency)  # 후처리 동시 실행 수 스핀박스에 값 설정
+        self.retries_spin.setValue(self.config.max_retries)  # 자동 재시도 횟수 스핀박스에 값 설정
+        self.bandwidth_spin.setValue(self.config.bandwidth_limit)  # 대역폭 제한 스핀박스에 값 설정
         self.path_edit.setText(self.config.download_path or "")  # 다운로드 경로 LineEdit에 값 설정
         index = self.quality_combo.findText(self.config.video_quality)  # 비디오 품질 콤보박스에서 현재 설정된 품질의 인덱스 찾기
         if index != -1:  # 찾았으면
             self.quality_combo.setCurrentIndex(index)  # 해당 인덱스로 콤보박스 선택 설정
+        self.format_tolerance_spin.setValue(self.config.format_tolerance)  # 허용 화질 손실 스핀박스에 값 설정
         self.subtitles_checkbox.setChecked(self.config.download_subtitles)  # 자막 다운로드 체크박스에 값 설정
+        self.playlists_checkbox.setChecked(self.config.expand_playlists)  # 재생목록 펼치기 체크박스에 값 설정
+        self.process_pool_checkbox.setChecked(self.config.use_process_pool)  # 프로세스 모드 체크박스에 값 설정
+        self.metrics_port_spin.setValue(self.config.metrics_port)  # 성능 지표 서버 포트 스핀박스에 값 설정
+        self.api_port_spin.setValue(self.config.api_port)  # 로컬 API 포트 스핀박스에 값 설정
+        self.watch_folder_edit.setText(self.config.watch_folder)  # 감시 폴더 LineEdit에 값 설정
 
     def browse_folder(self):
         """폴더 찾아보기 다이얼로그를 열고, 선택된 폴더 경로를 다운로드 경로 LineEdit에 반영합니다."""
@@ -103,6 +216,12 @@ class SettingsDialog(QDialog):
         if folder:  # 폴더가 선택되었으면
             self.path_edit.setText(folder)  # 선택된 폴더 경로를 LineEdit에 설정
 
+    def browse_watch_folder(self):
+        """폴더 찾아보기 다이얼로그를 열고, 선택된 폴더 경로를 감시 폴더 LineEdit에 반영합니다."""
+        folder = QFileDialog.getExistingDirectory(self, "감시 폴더 선택")  # 폴더 선택 다이얼로그 열기
+        if folder:  # 폴더가 선택되었으면
+            self.watch_folder_edit.setText(folder)  # 선택된 폴더 경로를 LineEdit에 설정
+
     def accept(self):
         """
         "저장" 버튼 클릭 시 호출되는 슬롯.
@@ -120,5 +239,16 @@ class SettingsDialog(QDialog):
             download_path=download_path, # 다운로드 경로
             video_quality=self.quality_combo.currentText(), # 비디오 품질
             download_subtitles=self.subtitles_checkbox.isChecked(), # 자막 다운로드 여부
+            expand_playlists=self.playlists_checkbox.isChecked(), # 재생목록 펼치기 여부
+            bandwidth_limit=self.bandwidth_spin.value(), # 전체 대역폭 제한 (KB/s)
+            concurrent_fragments=self.fragments_spin.value(), # 조각 동시 다운로드 수
+            use_process_pool=self.process_pool_checkbox.isChecked(), # 프로세스 모드 사용 여부
+            metrics_port=self.metrics_port_spin.value(), # 성능 지표 서버 포트 (0 이면 사용 안 함)
+            postprocess_concurrency=self.postprocess_spin.value(), # 후처리 동시 실행 수
+            max_retries=self.retries_spin.value(), # 자동 재시도 횟수
+            auto_concurrency_max=self.auto_concurrency_spin.value(), # 동시 다운로드 자동 조절 상한 (0 이면 사용 안 함)
+            api_port=self.api_port_spin.value(), # 로컬 API 포트 (0 이면 사용 안 함)
+            watch_folder=self.watch_folder_edit.text().strip(), # 감시 폴더 (비어 있으면 사용 안 함)
+            format_tolerance=self.format_tolerance_spin.value(), # 병합 생략 허용 화질 손실 (%)
         )
         super().accept()  # 다이얼로그 accept 처리 (다이얼로그 닫기)
\ No newline at end of file
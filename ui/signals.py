@@ -0,0 +1,88 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import errors
+from manager import ManagerListener
+
+
+class WorkerSignals(QObject):
+    """
+    DownloadManager 의 작업 이벤트를 Qt 시그널로 전달합니다.
+
+    added: 작업 추가 시그널, 작업 ID를 인자로 전달합니다 (재생목록 펼치기로 추가된 작업 포함).
+    finished: 다운로드 완료 시그널, 작업 ID를 인자로 전달합니다.
+    error: 다운로드 에러(최종 실패) 시그널, 작업 ID, 에러 분류(errors.NETWORK 등), 에러 메시지를 인자로 전달합니다.
+    retrying: 일시적인 에러로 자동 재시도가 예약되었을 때의 시그널, 작업 ID를 인자로 전달합니다.
+    info: 비디오 정보(제목 등) 수신 시그널, 작업 ID를 인자로 전달합니다.
+    postprocessing: 전송이 끝나고 후처리(병합)를 시작했을 때의 시그널, 작업 ID를 인자로 전달합니다.
+    paused: 작업 일시정지 시그널, 작업 ID를 인자로 전달합니다.
+    queued: 일시정지/선점/재시도 대기 후 작업이 대기열로 돌아갔을 때의 시그널, 작업 ID를 인자로 전달합니다.
+    cancelled: 작업 취소 시그널, 작업 ID를 인자로 전달합니다.
+    playlist_expanded: 재생목록 펼치기 완료 시그널, URL과 추가된 작업 수를 인자로 전달합니다.
+    playlist_failed: 재생목록 펼치기 에러 시그널, URL, 에러 분류, 에러 메시지를 인자로 전달합니다.
+    concurrency_changed: 동시 다운로드 수 변경(자동 조절 포함) 시그널, 새 동시 다운로드 수를 인자로 전달합니다.
+    진행률은 시그널로 전달하지 않고, MainWindow 가 DownloadManager.progress 를 주기적으로 읽어 표시합니다.
+    """
+    added = pyqtSignal(int)
+    finished = pyqtSignal(int)
+    error = pyqtSignal(int, str, str)
+    retrying = pyqtSignal(int)
+    info = pyqtSignal(int)
+    postprocessing = pyqtSignal(int)
+    paused = pyqtSignal(int)
+    queued = pyqtSignal(int)
+    cancelled = pyqtSignal(int)
+    playlist_expanded = pyqtSignal(str, int)
+    playlist_failed = pyqtSignal(str, str, str)
+    concurrency_changed = pyqtSignal(int)
+
+
+class SignalListener(ManagerListener):
+    """
+    워커 스레드에서 호출되는 ManagerListener 이벤트를 WorkerSignals 로 emit 합니다.
+
+    시그널은 GUI 스레드의 슬롯에 queued connection 으로 전달되므로, 슬롯에서 안전하게 UI를 갱신할 수 있습니다.
+    """
+    def __init__(self, signals):
+        """
+        SignalListener 초기화.
+
+        Args:
+            signals (WorkerSignals): GUI 스레드에서 생성된 WorkerSignals 객체
+        """
+        self.signals = signals
+
+    def job_added(self, job):
+        self.signals.added.emit(job.job_id)
+
+    def job_finished(self, job):
+        self.signals.finished.emit(job.job_id)
+
+    def job_failed(self, job):
+        self.signals.error.emit(job.job_id, job.error_kind or errors.UNKNOWN, job.error)
+
+    def job_retrying(self, job):
+        self.signals.retrying.emit(job.job_id)
+
+    def job_info(self, job):
+        self.signals.info.emit(job.job_id)
+
+    def job_postprocessing(self, job):
+        self.signals.postprocessing.emit(job.job_id)
+
+    def job_paused(self, job):
+        self.signals.paused.emit(job.job_id)
+
+    def job_queued(self, job):
+        self.signals.queued.emit(job.job_id)
+
+    def job_cancelled(self, job):
+        self.signals.cancelled.emit(job.job_id)
+
+    def playlist_expanded(self, url, count):
+        self.signals.playlist_expanded.emit(url, count)
+
+    def playlist_failed(self, url, message, kind):
+        self.signals.playlist_failed.emit(url, kind, message)
+
+    def concurrency_changed(self, concurrency):
+        self.signals.concurrency_changed.emit(concurrency)
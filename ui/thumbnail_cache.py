@@ -0,0 +1,184 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from PyQt5.QtCore import QStandardPaths
+
+
+class ThumbnailCache:
+    """
+    다운로드한 썸네일을 캐싱하는 프로세스 전역 메모리 캐시입니다.
+
+    QPixmap 의 픽셀 데이터 크기를 기준으로 전체 사용량을 MAX_BYTES 이하로 유지하며,
+    한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다 (LRU).
+    제거된 썸네일은 DiskThumbnailCache 에서 네트워크 없이 다시 불러올 수 있습니다.
+    GUI 스레드에서만 사용합니다 (QPixmap 은 GUI 스레드 전용).
+    """
+    MAX_BYTES = 32 * 1024 * 1024 # 메모리 캐시 최대 크기 (32MB, 320x180 썸네일 약 140개)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """
+        프로세스 전역 ThumbnailCache 객체를 반환합니다. 처음 호출될 때 생성됩니다.
+
+        Returns:
+            ThumbnailCache: 공유 캐시 객체
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        """
+        ThumbnailCache 초기화.
+
+        Args:
+            max_bytes (int, optional): 메모리 캐시 최대 크기 (바이트). Defaults to MAX_BYTES.
+        """
+        self.max_bytes = max_bytes
+        self.thumbnails = OrderedDict() # 썸네일 저장 딕셔너리 (video_id: QPixmap), 최근 사용 순
+        self.total_bytes = 0 # 현재 캐시된 픽셀 데이터 크기 합계
+
+    def get(self, video_id):
+        """
+        캐시에서 video_id에 해당하는 썸네일을 가져옵니다. 찾은 항목은 최근 사용으로 표시됩니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+
+        Returns:
+            QPixmap: 캐시에 썸네일이 있으면 QPixmap, 없으면 None
+        """
+        pixmap = self.thumbnails.get(video_id)
+        if pixmap is not None:
+            self.thumbnails.move_to_end(video_id) # LRU 순서 갱신
+        return pixmap
+
+    def set(self, video_id, pixmap):
+        """
+        캐시에 video_id와 썸네일(QPixmap)을 저장하고, 한도를 넘으면 오래된 항목을 제거합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+            pixmap (QPixmap): 썸네일 이미지 (QPixmap 객체)
+        """
+        old = self.thumbnails.pop(video_id, None)
+        if old is not None:
+            self.total_bytes -= self._pixmap_bytes(old)
+        self.thumbnails[video_id] = pixmap
+        self.total_bytes += self._pixmap_bytes(pixmap)
+        while self.total_bytes > self.max_bytes and len(self.thumbnails) > 1: # 방금 넣은 항목은 유지
+            _, evicted = self.thumbnails.popitem(last=False) # 가장 오래 사용하지 않은 항목 제거
+            self.total_bytes -= self._pixmap_bytes(evicted)
+
+    @staticmethod
+    def _pixmap_bytes(pixmap):
+        """QPixmap 픽셀 데이터의 대략적인 메모리 사용량 (바이트)."""
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class DiskThumbnailCache:
+    """
+    크기 조정이 끝난 썸네일 이미지 파일(JPEG)을 비디오 ID 별로 저장하는 디스크 캐시입니다.
+
+    전체 파일 크기를 MAX_BYTES 이하로 유지하며, 한도를 넘으면 가장 오래 사용하지 않은 파일부터 삭제합니다.
+    (파일 수정 시각을 사용 시각으로 사용하며, 캐시 적중 시 갱신합니다.)
+    ThumbnailLoader 의 워커 스레드에서 사용하므로 thread-safe 하게 동작합니다.
+    """
+    MAX_BYTES = 200 * 1024 * 1024 # 디스크 캐시 최대 크기 (200MB)
+    EXTENSION = ".jpg"
+    VIDEO_ID_REGEX = re.compile(r"[\w-]+") # 파일 이름으로 사용할 수 있는 비디오 ID 형식
+
+    def __init__(self, directory=None, max_bytes=MAX_BYTES):
+        """
+        DiskThumbnailCache 초기화. 캐시 디렉토리를 만들고 현재 사용량을 계산합니다.
+
+        Args:
+            directory (str, optional): 캐시 디렉토리. Defaults to None (어플리케이션 캐시 폴더/thumbnails).
+            max_bytes (int, optional): 디스크 캐시 최대 크기 (바이트). Defaults to MAX_BYTES.
+        """
+        if directory is None:
+            directory = os.path.join(
+                QStandardPaths.writableLocation(QStandardPaths.CacheLocation), "thumbnails"
+            )
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock() # 파일 목록/사용량 보호 lock (thread-safe)
+        os.makedirs(self.directory, exist_ok=True)
+        self.total_bytes = sum(size for _, _, size in self._scan())
+
+    def load(self, video_id):
+        """
+        디스크 캐시에서 썸네일 이미지 데이터를 읽어옵니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+
+        Returns:
+            bytes: 이미지 파일 데이터. 캐시에 없으면 None
+        """
+        path = self._path(video_id)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path) # 사용 시각 갱신 (LRU)
+            return data
+        except OSError:
+            return None
+
+    def store(self, video_id, data):
+        """
+        썸네일 이미지 데이터를 디스크 캐시에 저장하고, 한도를 넘으면 오래된 파일을 삭제합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+            data (bytes): 이미지 파일 데이터 (크기 조정된 JPEG)
+        """
+        path = self._path(video_id)
+        if path is None:
+            return
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            with self.lock:
+                old_size = os.path.getsize(path) if os.path.exists(path) else 0
+                os.replace(temp_path, path) # 원자적 교체 (읽는 쪽이 중간 상태를 보지 않도록)
+                self.total_bytes += len(data) - old_size
+                if self.total_bytes > self.max_bytes:
+                    self._evict()
+        except OSError as e:
+            print(f"Error caching thumbnail for {video_id}: {e}")
+
+    def _evict(self):
+        """사용량이 한도의 90% 이하가 될 때까지 가장 오래된 파일부터 삭제합니다 (lock 보유 상태에서 호출)."""
+        target = self.max_bytes * 9 // 10 # 매 저장마다 정리하지 않도록 여유 확보
+        for _, path, size in sorted(self._scan()):
+            if self.total_bytes <= target:
+                break
+            try:
+                os.remove(path)
+                self.total_bytes -= size
+            except OSError:
+                pass
+
+    def _scan(self):
+        """캐시 디렉토리의 (수정 시각, 경로, 크기) 목록을 반환합니다."""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(self.EXTENSION):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    def _path(self, video_id):
+        """비디오 ID 에 해당하는 캐시 파일 경로. 파일 이름으로 쓸 수 없는 ID 이면 None."""
+        if not self.VIDEO_ID_REGEX.fullmatch(video_id):
+            return None
+        return os.path.join(self.directory, video_id + self.EXTENSION)
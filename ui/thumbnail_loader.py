@@ -0,0 +1,163 @@
+import threading
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtGui import QImage
+
+from startup import lazy_import
+
+from .thumbnail_cache import DiskThumbnailCache
+
+
+class ThumbnailLoader(QObject):
+    """
+    썸네일을 백그라운드 스레드에서 다운로드하고 디코딩하는 로더입니다.
+
+    - 프로세스 전체에서 하나의 keep-alive HTTP 세션(requests.Session)을 공유합니다.
+      requests 는 첫 썸네일 다운로드 시 import 하고 세션도 그때 만듭니다 (어플리케이션 시작 시간 단축).
+    - 동시에 진행하는 요청 수를 MAX_CONCURRENT_FETCHES 로 제한합니다.
+    - 같은 비디오 ID 에 대한 중복 요청은 하나로 합칩니다.
+    - 크기 조정된 썸네일을 DiskThumbnailCache 에 저장하고, 이후 요청은 네트워크 없이 디스크에서 읽습니다.
+    - 다운로드, 디코딩, 크기 조정까지 워커 스레드에서 처리하고, 결과 QImage 를 `loaded` 시그널로 전달합니다.
+      (QPixmap 은 GUI 스레드에서만 사용할 수 있으므로 변환은 수신 측에서 수행합니다.)
+
+    loaded: 썸네일 로드 완료 시그널, 비디오 ID와 QImage를 인자로 전달합니다.
+    """
+    loaded = pyqtSignal(str, QImage)
+
+    THUMBNAIL_URL = "https://img.youtube.com/vi/{video_id}/hqdefault.jpg" # 고화질 썸네일 URL
+    THUMBNAIL_SIZE = (320, 180) # 썸네일 표시 크기
+    MAX_CONCURRENT_FETCHES = 4 # 동시 썸네일 요청 수
+    REQUEST_TIMEOUT = 10 # 요청 타임아웃 (초)
+    JPEG_QUALITY = 90 # 디스크 캐시 저장 시 JPEG 품질
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """
+        프로세스 전역 ThumbnailLoader 객체를 반환합니다. 처음 호출될 때 생성됩니다 (GUI 스레드에서 호출해야 함).
+
+        Returns:
+            ThumbnailLoader: 공유 로더 객체
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, disk_cache=None):
+        """
+        ThumbnailLoader 초기화.
+
+        Args:
+            disk_cache (DiskThumbnailCache, optional): 디스크 캐시. Defaults to None (기본 캐시 폴더 사용).
+        """
+        super().__init__()
+        self.disk_cache = disk_cache or DiskThumbnailCache() # 크기 조정된 썸네일 디스크 캐시
+        self._session = None # keep-alive 연결을 재사용하는 공유 세션 (첫 다운로드 시 생성)
+        self._session_lock = threading.Lock() # 여러 워커 스레드에서 동시에 처음 요청하는 경우 대비
+        self.threadpool = QThreadPool() # 썸네일 전용 스레드 풀 (다운로드 작업과 분리)
+        self.threadpool.setMaxThreadCount(self.MAX_CONCURRENT_FETCHES)
+        self.pending = set() # 진행 중인 요청의 비디오 ID 목록 (중복 요청 방지)
+        self.loaded.connect(self._on_loaded)
+
+    @property
+    def session(self):
+        """공유 requests.Session. 처음 사용할 때 requests 를 import 하고 생성합니다 (워커 스레드에서 호출)."""
+        with self._session_lock:
+            if self._session is None:
+                requests = lazy_import("requests")
+                self._session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.MAX_CONCURRENT_FETCHES # 썸네일 호스트 하나에 대한 연결 풀
+                )
+                self._session.mount("https://", adapter)
+            return self._session
+
+    def request(self, video_id):
+        """
+        썸네일 로드를 요청합니다. 즉시 반환되며, 완료되면 `loaded` 시그널이 emit 됩니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+        """
+        if video_id in self.pending:
+            return # 이미 요청 중이면 결과를 공유
+        self.pending.add(video_id)
+        self.threadpool.start(_ThumbnailTask(self, video_id))
+
+    def fetch(self, video_id):
+        """
+        표시 크기로 조정된 썸네일 QImage 를 반환합니다. 워커 스레드에서 호출됩니다.
+        디스크 캐시에 있으면 그대로 읽고, 없으면 다운로드 후 크기를 조정하여 디스크 캐시에 저장합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+
+        Returns:
+            QImage: 썸네일 이미지. 실패 시 None
+        """
+        data = self.disk_cache.load(video_id) # 디스크 캐시 확인 (네트워크 접근 없음)
+        if data is not None:
+            image = QImage()
+            if image.loadFromData(data):
+                return image
+
+        image = self.download(video_id)
+        if image is not None:
+            self.disk_cache.store(video_id, self._encode(image)) # 크기 조정된 이미지를 디스크 캐시에 저장
+        return image
+
+    def download(self, video_id):
+        """
+        썸네일을 다운로드하여 표시 크기로 조정한 QImage 를 반환합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+
+        Returns:
+            QImage: 썸네일 이미지. 실패 시 None
+        """
+        requests = lazy_import("requests")
+        try:
+            response = self.session.get(
+                self.THUMBNAIL_URL.format(video_id=video_id), timeout=self.REQUEST_TIMEOUT
+            )
+            response.raise_for_status() # HTTP 에러 발생 시 예외 처리
+        except requests.exceptions.RequestException as e: # requests 관련 예외 처리 (네트워크 에러, 타임아웃 등)
+            print(f"Error loading thumbnail for {video_id}: {e}")
+            return None
+
+        image = QImage()
+        if not image.loadFromData(response.content): # 다운로드한 이미지 데이터 디코딩
+            print(f"Unexpected error loading thumbnail for {video_id}: invalid image data")
+            return None
+        width, height = self.THUMBNAIL_SIZE
+        return image.scaled(
+            width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation # 썸네일 크기 조정 및 스무딩
+        )
+
+    def _encode(self, image):
+        """QImage 를 JPEG 파일 데이터(bytes)로 인코딩합니다."""
+        byte_array = QByteArray()
+        buffer = QBuffer(byte_array)
+        buffer.open(QIODevice.WriteOnly)
+        image.save(buffer, "JPG", self.JPEG_QUALITY)
+        buffer.close()
+        return bytes(byte_array)
+
+    def _on_loaded(self, video_id, image):
+        """로드가 끝난 요청을 진행 중 목록에서 제거합니다 (GUI 스레드)."""
+        self.pending.discard(video_id)
+
+
+class _ThumbnailTask(QRunnable):
+    """썸네일 하나를 가져오는 QRunnable. 실패 시에는 빈 QImage 를 전달합니다."""
+
+    def __init__(self, loader, video_id):
+        super().__init__()
+        self.loader = loader
+        self.video_id = video_id
+
+    def run(self):
+        image = self.loader.fetch(self.video_id)
+        self.loader.loaded.emit(self.video_id, image if image is not None else QImage())
@@ -1,21 +1,49 @@
 import re
-from urllib.parse import urlparse, parse_qs
 
-YOUTUBE_REGEX = re.compile(
-    r"(https?://)?(www\.)?(youtube\.com/(watch\?v=|shorts/)|youtu\.be/)[\w-]{11}"
+YOUTUBE_REGEX = re.compile( # 비디오 URL 정규식 (비디오 ID 캡처). 텍스트 안에서 찾을 때도 사용
+    r"(?<![\w.-])(?:https?://)?(?:(?:www|m|music)\.)?"
+    r"(?:youtube(?:-nocookie)?\.com/(?:watch\?(?:[^\s#]*?&)?v=|shorts/|embed/|live/|v/)|youtu\.be/)"
+    r"([\w-]{11})(?![\w-])"
+)
+
+PLAYLIST_REGEX = re.compile( # 재생목록/채널 URL 정규식. 텍스트 안에서 찾을 때도 사용
+    r"(?<![\w.-])(?:https?://)?(?:(?:www|m)\.)?youtube\.com/"
+    r"(?:playlist\?list=[\w-]+|@[\w.-]+|channel/[\w-]+|c/[\w.-]+|user/[\w.-]+)"
 )
 
 
 def extract_video_id(url):
-    """Extract video ID from YouTube URL."""
-    parsed_url = urlparse(url)
-    if parsed_url.hostname in ["www.youtube.com", "youtube.com"]:
-        if parsed_url.path == "/watch":
-            return parse_qs(parsed_url.query).get("v", [None])[0]
-        elif parsed_url.path.startswith(("/embed/", "/v/")):
-            return parsed_url.path.split("/")[2]
-        elif parsed_url.path.startswith("/shorts/"):
-            return parsed_url.path.split("/shorts/")[1].split("/")[0]
-    elif parsed_url.hostname == "youtu.be":
-        return parsed_url.path[1:]
-    return None
+    """
+    Extract the canonical 11-character video ID from a YouTube URL.
+
+    Handles watch (including m./music. hosts and extra query parameters), youtu.be, shorts,
+    embed, live and /v/ links. Returns None if the text does not start with a YouTube video URL.
+    """
+    match = YOUTUBE_REGEX.match(url.strip())
+    return match.group(1) if match else None
+
+
+def canonical_video_url(video_id):
+    """Return the canonical watch URL for a video ID."""
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+def scan_youtube_urls(text):
+    """
+    Find every YouTube video URL in arbitrary text in a single pass.
+
+    Returns (video_id, canonical_url) pairs in order of first appearance, with duplicate IDs removed.
+    """
+    seen = set()
+    results = []
+    for match in YOUTUBE_REGEX.finditer(text):
+        video_id = match.group(1)
+        if video_id not in seen:
+            seen.add(video_id)
+            results.append((video_id, canonical_video_url(video_id)))
+    return results
+
+
+def scan_playlist_urls(text):
+    """Find every YouTube playlist/channel URL in arbitrary text, with duplicates removed."""
+    return list(dict.fromkeys(match.group(0) for match in PLAYLIST_REGEX.finditer(text)))
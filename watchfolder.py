@@ -0,0 +1,116 @@
+import os
+import sys
+import threading
+
+
+class WatchFolder:
+    """
+    폴더에 놓인 `.txt` URL 목록 파일을 주기적으로 확인하여 다운로드 대기열에 추가합니다.
+
+    파일 안의 모든 YouTube URL 을 찾아 한 번에 추가하고 (아카이브에 있거나 진행 중인 비디오는 건너뜀),
+    처리한 파일은 하위 폴더 `processed` 로 옮깁니다. 다른 프로그램이 아직 쓰고 있는 파일을 읽지 않도록,
+    크기와 수정 시각이 한 번의 확인 간격 동안 바뀌지 않은 파일만 처리합니다.
+    별도 라이브러리 없이 동작하도록 파일 시스템 알림 대신 폴링을 사용합니다.
+
+    Attributes:
+        PROCESSED_DIRNAME (str): 처리한 파일을 옮길 하위 폴더 이름
+    """
+    PROCESSED_DIRNAME = "processed"
+    INTERVAL = 2.0 # 폴더 확인 간격 (초)
+
+    def __init__(self, manager, path, defaults, interval=INTERVAL):
+        """
+        WatchFolder 초기화 및 감시 시작.
+
+        Args:
+            manager (DownloadManager): 작업을 추가할 다운로드 매니저
+            path (str): 감시할 폴더 경로 (없으면 생성)
+            defaults (callable): 다운로드 옵션을 반환하는 함수. 반환하는 dict 의 키는
+                download_path, quality, download_subtitles, concurrent_fragments, expand_playlists 입니다.
+            interval (float, optional): 폴더 확인 간격 (초). Defaults to INTERVAL.
+        """
+        self.manager = manager
+        self.path = path
+        self.defaults = defaults
+        self.interval = interval
+        self.processed_path = os.path.join(path, self.PROCESSED_DIRNAME)
+        os.makedirs(self.processed_path, exist_ok=True)
+        self._seen = {} # 지난 확인 때의 파일 상태 (파일 이름: (크기, 수정 시각))
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="watch-folder", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """감시를 중지합니다."""
+        self._stop_event.set()
+
+    def scan(self):
+        """
+        폴더를 한 번 확인하여, 지난 확인 이후 바뀌지 않은 `.txt` 파일을 처리합니다. 감시 스레드가 interval 마다 호출합니다.
+
+        Returns:
+            int: 이번 확인에서 추가된 작업 수
+        """
+        try:
+            entries = [
+                entry for entry in os.scandir(self.path)
+                if entry.is_file() and entry.name.lower().endswith(".txt")
+            ]
+        except OSError as e: # 폴더 삭제, 네트워크 드라이브 끊김 등: 다음 확인 때 다시 시도
+            print(f"감시 폴더를 읽을 수 없습니다: {e}", file=sys.stderr)
+            return 0
+        seen = {}
+        added = 0
+        for entry in sorted(entries, key=lambda entry: entry.name): # 이름 순으로 처리
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue # 확인하는 사이에 옮겨지거나 삭제됨
+            state = (stat.st_size, stat.st_mtime_ns)
+            if self._seen.get(entry.name) != state:
+                seen[entry.name] = state # 새 파일이거나 아직 쓰는 중: 다음 확인 때 처리
+                continue
+            added += self._ingest(entry.path)
+        self._seen = seen
+        return added
+
+    def _ingest(self, path):
+        """파일 하나를 읽어 대기열에 추가하고 processed 폴더로 옮깁니다. 추가된 작업 수를 반환합니다."""
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                text = f.read()
+        except OSError as e:
+            print(f"감시 폴더의 파일을 읽을 수 없습니다: {e}", file=sys.stderr)
+            return 0
+        options = self.defaults()
+        if not options["download_path"]:
+            print("다운로드 경로가 설정되지 않아 감시 폴더의 파일을 처리하지 않습니다.", file=sys.stderr)
+            return 0 # 경로를 설정하면 다음 확인 때 처리
+        jobs, _, _ = self.manager.submit_text(
+            text,
+            download_path=options["download_path"],
+            quality=options["quality"],
+            download_subtitles=options["download_subtitles"],
+            concurrent_fragments=options["concurrent_fragments"],
+            expand_playlists=options["expand_playlists"],
+        )
+        try:
+            os.replace(path, self._processed_name(os.path.basename(path)))
+        except OSError as e: # 옮기지 못하면 다시 처리되지만, 이미 추가된 비디오는 진행 중이거나 아카이브에 있어 건너뜀
+            print(f"처리한 파일을 옮길 수 없습니다: {e}", file=sys.stderr)
+        return len(jobs)
+
+    def _processed_name(self, filename):
+        """processed 폴더 안에서 기존 파일과 겹치지 않는 경로를 반환합니다 (list.txt, list (1).txt, ...)."""
+        stem, ext = os.path.splitext(filename)
+        candidate = os.path.join(self.processed_path, filename)
+        counter = 1
+        while os.path.exists(candidate):
+            candidate = os.path.join(self.processed_path, f"{stem} ({counter}){ext}")
+            counter += 1
+        return candidate
+
+    def _run(self):
+        """감시 스레드 본체."""
+        while not self._stop_event.wait(self.interval):
+            self.scan()